@@ -11,6 +11,7 @@ from .multimeter import Multimeter
 from .electrometer import Electrometer
 from .function_generator import FunctionGenerator
 from .oscilloscope import (
+    AcquisitionStatistics,
     OscilloscopeChannel,
     OscilloscopeDataSource,
     Oscilloscope,
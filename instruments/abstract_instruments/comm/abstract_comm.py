@@ -204,6 +204,32 @@ class AbstractCommunicator(with_metaclass(abc.ABCMeta, object)):
         """
         return self.read_raw(size).decode(encoding)
 
+    def read_raw_until(self, terminator, size):
+        """
+        Read bytes in from the connection until ``terminator`` has been
+        read, or until ``size`` bytes have been read, whichever is first.
+        Unlike ``read_raw(size)``, bytes following the terminator are left
+        unread, and a short response does not wait for the connection to
+        time out.
+
+        This implementation reads a single byte at a time, in the same way as
+        ``read_raw(-1)`` for stream-based connections. Communicators which
+        can do better override it.
+
+        :param bytes terminator: Bytes marking the end of the read.
+        :param int size: Maximum number of bytes to read.
+
+        :return: The read bytes, including ``terminator`` if it was found.
+        :rtype: `bytes`
+        """
+        result = bytes()
+        while len(result) < size and not result.endswith(terminator):
+            c = self.read_raw(1)
+            if not c:
+                break
+            result += c
+        return result
+
     def sendcmd(self, msg):
         """
         Sends the incoming msg down to the wrapped file-like object
@@ -217,6 +243,28 @@ class AbstractCommunicator(with_metaclass(abc.ABCMeta, object)):
             self._logger.debug(" <- %s", repr(msg))
         self._sendcmd(msg)
 
+    def sendcmd_raw(self, msg, chunk_size=None, progress=None):
+        """
+        Sends bytes to the connected device, such as a command followed by a
+        block of binary data. Unlike `sendcmd`, no termination characters are
+        appended, so ``msg`` should include any that are required.
+
+        :param bytes msg: Bytes to be sent to the instrument.
+        :param int chunk_size: Maximum number of bytes to write at a time, or
+            `None` to write all of ``msg`` at once.
+        :param progress: Function called after each chunk is written with the
+            number of bytes written so far and in total.
+        :type progress: `callable`
+        """
+        if self.debug:
+            self._logger.debug(" <- %s (%d bytes)", repr(msg[:32]), len(msg))
+        if chunk_size is None:
+            chunk_size = max(len(msg), 1)
+        for idx in range(0, len(msg), chunk_size):
+            self.write_raw(msg[idx:idx + chunk_size])
+            if progress is not None:
+                progress(min(idx + chunk_size, len(msg)), len(msg))
+
     def query(self, msg, size=-1):
         """
         Send a string to the connected instrument using sendcmd and read the
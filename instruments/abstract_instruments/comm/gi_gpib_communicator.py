@@ -268,6 +268,19 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         return self._file.read(size, encoding)
 
+    def read_raw_until(self, terminator, size):
+        """
+        Read bytes in from the gpibusb connection until ``terminator`` has
+        been read, or until ``size`` bytes have been read, whichever is first.
+
+        :param bytes terminator: Bytes marking the end of the read.
+        :param int size: Maximum number of bytes to read.
+
+        :return: The read bytes, including ``terminator`` if it was found.
+        :rtype: `bytes`
+        """
+        return self._file.read_raw_until(terminator, size)
+
     def write_raw(self, msg):
         """
         Write bytes to the gpibusb connection.
@@ -128,6 +128,19 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         else:
             raise ValueError("Must read a positive value of characters.")
 
+    def read_raw_until(self, terminator, size):
+        """
+        Read bytes in from the serial port until ``terminator`` has been
+        read, or until ``size`` bytes have been read, whichever is first.
+
+        :param bytes terminator: Bytes marking the end of the read.
+        :param int size: Maximum number of bytes to read.
+
+        :return: The read bytes, including ``terminator`` if it was found.
+        :rtype: `bytes`
+        """
+        return self._conn.read_until(terminator, size)
+
     def write_raw(self, msg):
         """
         Write bytes to the `pyserial.Serial` object.
@@ -130,6 +130,18 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         """
         self._filelike.write(msg, encoding=encoding)
 
+    def read_raw_until(self, terminator, size):  # pylint: disable=unused-argument
+        """
+        Read up to ``size`` bytes in from the usbtmc connection. Each read
+        stops at the end of the message, which is marked by ``terminator``,
+        and so ``terminator`` does not need to be searched for.
+
+        :param bytes terminator: Bytes marking the end of the read.
+        :param int size: Maximum number of bytes to read.
+        :rtype: `bytes`
+        """
+        return self.read_raw(size)
+
     def write_raw(self, msg):
         """
         Write bytes to the usbtmc connection.
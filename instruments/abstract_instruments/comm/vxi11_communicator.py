@@ -124,6 +124,18 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
         """
         return self._inst.read_raw(num=size)
 
+    def read_raw_until(self, terminator, size):  # pylint: disable=unused-argument
+        """
+        Read up to ``size`` bytes in from the vxi11 connection. Each read
+        stops at the end of the message, which is marked by ``terminator``,
+        and so ``terminator`` does not need to be searched for.
+
+        :param bytes terminator: Bytes marking the end of the read.
+        :param int size: Maximum number of bytes to read.
+        :rtype: `bytes`
+        """
+        return self.read_raw(size)
+
     def write_raw(self, msg):
         """
         Write bytes to the vxi11 connection.
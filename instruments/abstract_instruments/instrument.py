@@ -44,6 +44,7 @@ from instruments.abstract_instruments.comm import (
     USBTMCCommunicator, VXI11Communicator, serial_manager
 )
 from instruments.errors import AcknowledgementError, PromptError
+from instruments.util_fns import parse_ascii_values, parse_ascii_chunks
 
 # CONSTANTS ###################################################################
 
@@ -256,7 +257,7 @@ class Instrument(object):
         """
         self._file.write(msg)
 
-    def binblockread(self, data_width, fmt=None):
+    def binblockread(self, data_width, fmt=None, chunk_size=None, count=None):
         """"
         Read a binary data block from attached instrument.
         This requires that the instrument respond in a particular manner
@@ -272,6 +273,82 @@ class Instrument(object):
             or `None` to choose a format automatically based on the data
             width. Typically you can just specify `data_width` and leave this
             default.
+
+        :param int chunk_size: Maximum number of bytes to request from the
+            connection at a time, or `None` to request the whole block at
+            once. Very long blocks may need to be read in chunks for some
+            connections.
+
+        :param int count: Number of data points in the block. This is only
+            used, and is then required, for indefinite-length blocks, which
+            begin with ``#0`` and do not give their own length.
+        """
+        num_of_bytes = self._read_binblock_header()
+        # Make or use the required format string.
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+        if num_of_bytes is None:
+            if count is None:
+                raise IOError("The number of data points must be given to "
+                              "read an indefinite-length binary block.")
+            num_of_bytes = count * np.dtype(fmt).itemsize
+
+        # Read in the data bytes, and pass them to numpy using the specified
+        # data type (format).
+        data = self._read_bytes(num_of_bytes, chunk_size)
+        return np.frombuffer(data, dtype=fmt)
+
+    def binblockread_chunks(self, data_width, fmt=None, chunk_size=65536):
+        """
+        Reads a binary data block from the attached instrument, as with
+        `binblockread`, but yields the data in chunks as they are read
+        rather than returning the whole block at once. This allows long
+        blocks to be processed while they are still being transferred.
+
+        :param int data_width: Specify the number of bytes wide each data
+            point is. One of [1,2,4].
+        :param str fmt: Format string as specified by the :mod:`struct` module,
+            or `None` to choose a format automatically based on the data
+            width.
+        :param int chunk_size: Maximum number of bytes to read at a time.
+        :return: Generator of the data points in each chunk. Data points are
+            never split across chunks.
+        :rtype: `numpy.ndarray`
+        """
+        num_of_bytes = self._read_binblock_header()
+        if num_of_bytes is None:
+            raise IOError("Indefinite-length binary blocks can not be read "
+                          "in chunks.")
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+        item_size = np.dtype(fmt).itemsize
+        chunk_size = max(item_size, chunk_size // item_size * item_size)
+
+        tries = 3
+        remaining = num_of_bytes
+        leftover = bytes()
+        while remaining > 0:
+            data = self._file.read_raw(min(chunk_size, remaining))
+            if not data:
+                tries -= 1
+                if tries == 0:
+                    raise IOError("Did not read in the required number of "
+                                  "bytes during binblock read. Got {}, "
+                                  "expected {}".format(
+                                      num_of_bytes - remaining, num_of_bytes
+                                  ))
+                continue
+            remaining -= len(data)
+            data = leftover + data
+            n_bytes = len(data) // item_size * item_size
+            leftover = data[n_bytes:]
+            yield np.frombuffer(data[:n_bytes], dtype=fmt)
+
+    def _read_binblock_header(self):
+        """
+        Reads the header of a binary data block, returning the number of
+        bytes of data that follow it, or `None` for an indefinite-length
+        block (``#0``).
         """
         # This needs to be a # symbol for valid binary block
         symbol = self._file.read_raw(1)
@@ -279,33 +356,116 @@ class Instrument(object):
             raise IOError("Not a valid binary block start. Binary blocks "
                           "require the first character to be #, instead got "
                           "{}".format(symbol))
-        else:
-            # Read in the num of digits for next part
-            digits = int(self._file.read_raw(1))
-
-            # Read in the num of bytes to be read
-            num_of_bytes = int(self._file.read_raw(digits))
-
-            # Make or use the required format string.
-            if fmt is None:
-                fmt = _DEFAULT_FORMATS[data_width]
-
-            # Read in the data bytes, and pass them to numpy using the specified
-            # data type (format).
-            # This is looped in case a communication timeout occurs midway
-            # through transfer and multiple reads are required
-            tries = 3
-            data = self._file.read_raw(num_of_bytes)
-            while len(data) < num_of_bytes:
-                old_len = len(data)
-                data += self._file.read_raw(num_of_bytes - old_len)
-                if old_len == len(data):
-                    tries -= 1
-                if tries == 0:
-                    raise IOError("Did not read in the required number of bytes"
-                                  "during binblock read. Got {}, expected "
-                                  "{}".format(len(data), num_of_bytes))
-            return np.frombuffer(data, dtype=fmt)
+        # Read in the num of digits for next part
+        digits = int(self._file.read_raw(1))
+        if digits == 0:
+            return None
+
+        # Read in the num of bytes to be read
+        return int(self._file.read_raw(digits))
+
+    def _read_bytes(self, num_of_bytes, chunk_size=None):
+        """
+        Reads exactly the given number of bytes of raw binary data from the
+        attached instrument.
+
+        :param int num_of_bytes: Number of bytes to read.
+        :param int chunk_size: Maximum number of bytes to request from the
+            connection at a time, or `None` to request them all at once.
+        :rtype: `bytearray`
+        """
+        # This is looped in case a communication timeout occurs midway
+        # through transfer and multiple reads are required
+        if chunk_size is None:
+            chunk_size = num_of_bytes
+        tries = 3
+        data = bytearray()
+        while len(data) < num_of_bytes:
+            old_len = len(data)
+            data += self._file.read_raw(
+                min(chunk_size, num_of_bytes - old_len)
+            )
+            if old_len == len(data):
+                tries -= 1
+            if tries == 0:
+                raise IOError("Did not read in the required number of bytes. "
+                              "Got {}, expected {}".format(
+                                  len(data), num_of_bytes
+                              ))
+        return data
+
+    def read_ascii_values(self, dtype=float, sep=",", chunk_size=None):
+        """
+        Reads a response consisting of many numbers, such as an ASCII
+        waveform or a block of readings, into a `numpy.ndarray`.
+
+        By default the whole response is read and then parsed. If
+        ``chunk_size`` is given, the response is instead read and parsed in
+        chunks of that many bytes until the termination character is found,
+        so that very long responses are never held as a single string. In
+        this mode, any prompt sent by the instrument is not stripped, and the
+        command should be sent with `~Instrument.sendcmd` beforehand.
+
+        :param dtype: Data type of the returned array.
+        :param str sep: Separator between numbers, in addition to whitespace.
+        :param int chunk_size: Number of bytes to read at a time, or `None`
+            to read the whole response at once.
+        :rtype: `numpy.ndarray`
+        """
+        if chunk_size is None:
+            return parse_ascii_values(self.read(), dtype, sep)
+        return parse_ascii_chunks(self._read_chunks(chunk_size), dtype, sep)
+
+    def _read_chunks(self, chunk_size):
+        """
+        Reads raw chunks of a response until its termination character is
+        found, yielding each chunk with the termination character removed.
+
+        Each read stops at the last byte of the termination character, so
+        that nothing following the response is consumed, and so that a
+        serial connection does not wait to time out on the final, short
+        chunk. A termination character of several bytes which is split
+        across two reads is held back until it can be checked.
+        """
+        terminator = self._terminator_bytes() or b"\n"
+        pending = bytes()
+
+        while True:
+            chunk = self._file.read_raw_until(terminator[-1:], chunk_size)
+            if not chunk:
+                if pending:
+                    yield pending
+                return
+            chunk = pending + chunk
+            if chunk.endswith(terminator):
+                yield chunk[:-len(terminator)]
+                return
+            # Hold back any bytes which could be the start of the
+            # termination character.
+            split = len(chunk) - len(terminator) + 1
+            pending = chunk[split:]
+            yield chunk[:split]
+
+    def _read_terminator(self):
+        """
+        Consumes the termination character which follows a binary block,
+        so that it is not mistaken for the start of the next response.
+        """
+        terminator = self._terminator_bytes()
+        if terminator:
+            self._file.read_raw(len(terminator))
+
+    def _terminator_bytes(self):
+        """
+        Gets the termination character as `bytes`, which are empty if
+        messages are terminated by asserting EOI.
+        """
+        terminator = self.terminator
+        if isinstance(terminator, int):
+            terminator = chr(terminator)
+        if terminator == "eoi":
+            return bytes()
+        return terminator.encode("utf-8")
 
     # CLASS METHODS #
 
@@ -10,8 +10,12 @@ from __future__ import absolute_import
 from __future__ import division
 
 import abc
+import threading
+import time
+from queue import Queue, Empty, Full
 
 from future.utils import with_metaclass
+import numpy as np
 
 from instruments.abstract_instruments import Instrument
 
@@ -38,6 +42,8 @@ class OscilloscopeDataSource(with_metaclass(abc.ABCMeta, object)):
         if self._old_dsrc != self:
             # Set the new data source, and let __exit__ cleanup.
             self._parent.data_source = self
+            if not self._parent.restore_data_source:
+                self._old_dsrc = None
         else:
             # There's nothing to do or undo in this case.
             self._old_dsrc = None
@@ -80,6 +86,33 @@ class OscilloscopeDataSource(with_metaclass(abc.ABCMeta, object)):
         """
         raise NotImplementedError
 
+    def _transfer_waveform(self, bin_format=True):
+        """
+        Transfers the raw waveform data of this data source from the
+        oscilloscope, without scaling it. Together with `_scale_waveform`,
+        this splits `read_waveform` so that the transfer and the scaling of
+        successive waveforms can happen in parallel.
+
+        Data sources which do not split their waveform reads transfer the
+        fully scaled waveform here.
+
+        :param bool bin_format: If the waveform should be transfered in binary
+            (``True``) or ASCII (``False``) formats.
+        :return: The raw waveform data, to be passed to `_scale_waveform`.
+        """
+        return self.read_waveform(bin_format)
+
+    def _scale_waveform(self, raw):
+        """
+        Converts raw waveform data from `_transfer_waveform` into x and y
+        values. This must not communicate with the oscilloscope.
+
+        :param raw: The raw waveform data returned by `_transfer_waveform`.
+        :return: The waveform with both x and y components.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        return raw
+
 
 class OscilloscopeChannel(with_metaclass(abc.ABCMeta, object)):
 
@@ -109,6 +142,58 @@ class OscilloscopeChannel(with_metaclass(abc.ABCMeta, object)):
         raise NotImplementedError
 
 
+class AcquisitionStatistics(object):
+
+    """
+    Throughput statistics for a continuous acquisition started by
+    `Oscilloscope.acquire_waveforms`.
+
+    The counters are updated by the acquisition threads while the
+    acquisition is running.
+    """
+
+    def __init__(self):
+        self.frames_transferred = 0
+        self.frames_dropped = 0
+        self.frames_yielded = 0
+        self.transfer_time = 0.0
+        self.scale_time = 0.0
+        self._start_time = time.time()
+        self._stop_time = None
+
+    def __repr__(self):
+        return "<AcquisitionStatistics transferred={} dropped={} " \
+               "yielded={} frames_per_second={:.3g}>".format(
+                   self.frames_transferred,
+                   self.frames_dropped,
+                   self.frames_yielded,
+                   self.frames_per_second
+               )
+
+    @property
+    def elapsed(self):
+        """
+        Gets the time, in seconds, since the acquisition was started, or the
+        total duration of the acquisition once it has finished.
+
+        :type: `float`
+        """
+        stop_time = self._stop_time
+        if stop_time is None:
+            stop_time = time.time()
+        return stop_time - self._start_time
+
+    @property
+    def frames_per_second(self):
+        """
+        Gets the average number of frames yielded per second.
+
+        :type: `float`
+        """
+        elapsed = self.elapsed
+        return self.frames_yielded / elapsed if elapsed > 0 else 0.0
+
+
 class Oscilloscope(with_metaclass(abc.ABCMeta, Instrument)):
 
     """
@@ -147,6 +232,16 @@ class Oscilloscope(with_metaclass(abc.ABCMeta, Instrument)):
         """
         raise NotImplementedError
 
+    #: If `True`, data sources restore the previously selected data source
+    #: after they are used as a context manager, for instance after reading
+    #: a waveform. Setting this to `False` leaves the last data source
+    #: selected, which saves switching back and forth in acquisition loops.
+    restore_data_source = True
+
+    #: Policies for frames transferred while the queue of
+    #: `Oscilloscope.acquire_waveforms` is full.
+    DROP_POLICIES = ("block", "drop_newest", "drop_oldest")
+
     # METHODS #
 
     @abc.abstractmethod
@@ -155,3 +250,205 @@ class Oscilloscope(with_metaclass(abc.ABCMeta, Instrument)):
         Forces a trigger event to occur on the attached oscilloscope.
         """
         raise NotImplementedError
+
+    def read_waveforms(self, sources, bin_format=True):
+        """
+        Gets the waveforms of several data sources, which share a single
+        time axis.
+
+        This implementation reads each data source in turn. Oscilloscopes
+        which can transfer several data sources at once override this
+        method.
+
+        :param sources: The data sources to read waveforms from.
+        :type sources: `list` of `OscilloscopeDataSource`
+        :param bool bin_format: If the waveforms should be transfered in
+            binary (``True``) or ASCII (``False``) formats.
+        :return: The shared x values, and the y values of each data source
+            as one row of a two-dimensional array.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        x = None
+        ys = []
+        for source in sources:
+            x, y = source.read_waveform(bin_format)
+            ys.append(y)
+        return x, np.vstack(ys)
+
+    def acquire_waveforms(self, source, n_frames=None, bin_format=True,
+                          queue_size=8, drop_policy="block",
+                          force_trigger=False, stats=None, transform=None):
+        """
+        Continuously acquires waveforms from a data source, yielding each
+        frame as it becomes available.
+
+        Waveforms are transferred from the oscilloscope on one thread and
+        scaled on another, so that the transfer of a frame overlaps the
+        scaling of the previous frame. The two threads are connected by a
+        bounded queue of raw frames, and scaled frames wait in a second
+        bounded queue until they are consumed by the caller.
+
+        When the consumer falls behind and the raw frame queue is full, the
+        ``drop_policy`` decides what happens to newly transferred frames:
+
+        - ``"block"``: the transfer thread waits for space, so no frames
+          are lost.
+        - ``"drop_newest"``: the new frame is discarded.
+        - ``"drop_oldest"``: the oldest queued frame is discarded to make
+          room for the new one.
+
+        The arguments are checked when this method is called, while the
+        acquisition starts when the first frame is requested. Closing the
+        generator (for instance by breaking out of a ``for`` loop) stops the
+        acquisition.
+
+        Example usage:
+
+        >>> import instruments as ik
+        >>> tek = ik.tektronix.TekTDS5xx.open_tcpip("192.168.0.2", 8888)
+        >>> stats = ik.abstract_instruments.AcquisitionStatistics()
+        >>> for x, y in tek.acquire_waveforms(tek.channel[0], n_frames=1000,
+        ...                                   stats=stats):
+        ...     process(x, y)
+        >>> print(stats.frames_per_second)
+
+        :param source: The data source to acquire waveforms from.
+        :type source: `OscilloscopeDataSource`
+        :param int n_frames: The number of frames to transfer, or `None` to
+            acquire until the generator is closed.
+        :param bool bin_format: If the waveforms should be transfered in
+            binary (``True``) or ASCII (``False``) formats.
+        :param int queue_size: The maximum number of frames held in each of
+            the transfer and scaling queues.
+        :param str drop_policy: One of `Oscilloscope.DROP_POLICIES`.
+        :param bool force_trigger: If `True`, a trigger event is forced
+            before each frame is transferred.
+        :param stats: Object in which to record throughput statistics. If
+            not specified, a new one is created and made available as the
+            ``acquisition_stats`` attribute of the oscilloscope.
+        :type stats: `AcquisitionStatistics`
+        :param transform: Function applied to the x and y values of each
+            frame on the scaling thread, returning the frame to yield. For
+            instance, `~instruments.util_fns.minmax_decimate` or
+            `~instruments.util_fns.lttb_downsample` can reduce long
+            waveforms to display resolution.
+        :type transform: `callable`
+        :return: Generator of waveforms with both x and y components.
+        :rtype: `tuple` of `numpy.ndarray`
+        """
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError("Drop policy must be one of {}.".format(
+                self.DROP_POLICIES
+            ))
+        if n_frames is not None and n_frames < 0:
+            raise ValueError("Number of frames must be non-negative.")
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least one.")
+        if transform is not None and not callable(transform):
+            raise TypeError("Transform must be callable, got {} "
+                            "instead.".format(type(transform)))
+
+        if stats is None:
+            stats = AcquisitionStatistics()
+        self.acquisition_stats = stats
+        return self._acquire_waveforms(
+            source, n_frames, bin_format, queue_size, drop_policy,
+            force_trigger, stats, transform
+        )
+
+    def _acquire_waveforms(self, source, n_frames, bin_format, queue_size,
+                           drop_policy, force_trigger, stats, transform):
+        """
+        Generator which runs the acquisition pipeline of
+        `Oscilloscope.acquire_waveforms`, once its arguments have been
+        checked.
+        """
+        # pylint: disable=protected-access
+        stats._start_time = time.time()
+        stats._stop_time = None
+
+        raw_queue = Queue(maxsize=queue_size)
+        frame_queue = Queue(maxsize=queue_size)
+        stop = threading.Event()
+        done = object()
+
+        def put(target, item):
+            # Blocks until the item is queued or the acquisition stops.
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.05)
+                    return
+                except Full:
+                    pass
+
+        def transfer():
+            try:
+                count = 0
+                while not stop.is_set() and \
+                        (n_frames is None or count < n_frames):
+                    start = time.time()
+                    if force_trigger:
+                        self.force_trigger()
+                    raw = source._transfer_waveform(bin_format)
+                    stats.transfer_time += time.time() - start
+                    stats.frames_transferred += 1
+                    count += 1
+
+                    if drop_policy == "block":
+                        put(raw_queue, (None, raw))
+                        continue
+                    try:
+                        raw_queue.put_nowait((None, raw))
+                    except Full:
+                        stats.frames_dropped += 1
+                        if drop_policy == "drop_oldest":
+                            try:
+                                raw_queue.get_nowait()
+                            except Empty:
+                                pass
+                            raw_queue.put_nowait((None, raw))
+            except Exception as exc:  # pylint: disable=broad-except
+                put(raw_queue, (exc, None))
+            put(raw_queue, (None, done))
+
+        def scale():
+            while not stop.is_set():
+                try:
+                    exc, raw = raw_queue.get(timeout=0.05)
+                except Empty:
+                    continue
+                if exc is None and raw is not done:
+                    start = time.time()
+                    try:
+                        raw = source._scale_waveform(raw)
+                        if transform is not None:
+                            raw = transform(*raw)
+                    except Exception as scale_exc:  # pylint: disable=broad-except
+                        exc, raw = scale_exc, None
+                    stats.scale_time += time.time() - start
+                put(frame_queue, (exc, raw))
+                if exc is not None or raw is done:
+                    return
+
+        threads = [
+            threading.Thread(target=transfer, name="transfer"),
+            threading.Thread(target=scale, name="scale")
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                exc, frame = frame_queue.get()
+                if exc is not None:
+                    raise exc
+                if frame is done:
+                    break
+                stats.frames_yielded += 1
+                yield frame
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            stats._stop_time = time.time()
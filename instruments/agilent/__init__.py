@@ -7,4 +7,6 @@ Module containing Agilent instruments
 from __future__ import absolute_import
 
 from instruments.agilent.agilent33220a import Agilent33220a
-from instruments.agilent.agilent34410a import Agilent34410a
+from instruments.agilent.agilent34410a import (
+    Agilent34410a, Agilent34410aStream
+)
@@ -8,11 +8,13 @@ Provides support for the Agilent 34410a digital multimeter.
 
 from __future__ import absolute_import
 from __future__ import division
-from builtins import map
+
+import time
 
 import quantities as pq
 
 from instruments.generic_scpi import SCPIMultimeter
+from instruments.util_fns import RingBufferStream
 
 # CLASSES #####################################################################
 
@@ -35,6 +37,12 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
     .. _Keysight website: http://www.keysight.com/
     """
 
+    def __init__(self, filelike):
+        super(Agilent34410a, self).__init__(filelike)
+        # Data format last selected with FORM:DATA, or `None` if it has not
+        # been set since connecting and is therefore unknown.
+        self._data_format = None
+
     # PROPERTIES #
 
     @property
@@ -93,10 +101,43 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             msg = 'R?'
         else:
             msg = 'R? ' + str(count)
-        self.sendcmd('FORM:DATA REAL,64')
-        self.sendcmd(msg)
-        data = self.binblockread(8, fmt=">d")
-        return data * units
+        return self._read_binary_data(msg) * units
+
+    def stream(self, buffer_size=100000, chunk_size=10000,
+               poll_interval=0.01, count=None):
+        """
+        Starts the multimeter taking readings, and streams them into a ring
+        buffer from a background thread. The thread polls the number of
+        readings in reading memory, and transfers those available in binary
+        using ``R?``, which also erases them from reading memory.
+
+        No other commands should be sent to the multimeter until the stream
+        has been stopped.
+
+        Example usage:
+
+        >>> dmm = ik.agilent.Agilent34410a.open_gpibusb('/dev/ttyUSB0', 1)
+        >>> dmm.trigger_count = dmm.TriggerCount.infinity
+        >>> with dmm.stream() as stream:
+        ...     for readings in stream:
+        ...         print(readings.mean())
+
+        :param int buffer_size: Number of readings held by the ring buffer.
+        :param int chunk_size: Maximum number of readings transferred by each
+            ``R?`` query.
+        :param float poll_interval: Time in seconds to wait before polling
+            again when no readings are available.
+        :param int count: Total number of readings to transfer before
+            stopping, or `None` to stream until `Agilent34410aStream.stop`
+            is called.
+
+        :rtype: `Agilent34410aStream`
+        """
+        stream = Agilent34410aStream(
+            self, buffer_size, chunk_size, poll_interval, count
+        )
+        stream.start()
+        return stream
 
     # DATA READING METHODS #
 
@@ -108,14 +149,13 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         complete before executing this command.
         Readings are NOT erased from memory when using fetch. Use the R?
         command to read and erase data.
-        Note that the data is transfered as ASCII, and thus it is not
-        recommended to transfer a large number of
-        data points using this method.
+        Data is transfered from the instrument in 64-bit double floating
+        point precision format.
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `~quantities.quantity.Quantity` with `numpy.array`
         """
         units = UNITS[self.mode]
-        return list(map(float, self.query('FETC?').split(','))) * units
+        return self._read_binary_data('FETC?') * units
 
     def read_data(self, sample_count):
         """
@@ -128,7 +168,7 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             output buffer. If set to -1, all points in memory will be
             transfered.
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `~quantities.quantity.Quantity` with `numpy.array`
         """
         if not isinstance(sample_count, int):
             raise TypeError('Parameter "sample_count" must be an integer.')
@@ -136,19 +176,17 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         if sample_count == -1:
             sample_count = self.data_point_count
         units = UNITS[self.mode]
-        self.sendcmd('FORM:DATA ASC')
-        data = self.query('DATA:REM? {}'.format(sample_count)).split(',')
-        return list(map(float, data)) * units
+        data = self._read_binary_data('DATA:REM? {}'.format(sample_count))
+        return data * units
 
     def read_data_nvmem(self):
         """
         Returns all readings in non-volatile memory (NVMEM).
 
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `~quantities.quantity.Quantity` with `numpy.array`
         """
         units = UNITS[self.mode]
-        data = list(map(float, self.query('DATA:DATA? NVMEM').split(',')))
-        return data * units
+        return self._read_binary_data('DATA:DATA? NVMEM') * units
 
     def read_last_data(self):
         """
@@ -188,8 +226,140 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
         """
         mode = self.mode
         units = UNITS[mode]
+        self._restore_ascii_format()
         return float(self.query('READ?')) * units
 
+    def measure(self, mode=None):
+        """
+        Instruct the multimeter to perform a one time measurement. See
+        `SCPIMultimeter.measure` for details.
+
+        :param mode: Desired measurement mode. If set to `None`, will default
+            to the current mode.
+        :type mode: `~SCPIMultimeter.Mode`
+
+        :rtype: `~quantities.Quantity`
+        """
+        self._restore_ascii_format()
+        return super(Agilent34410a, self).measure(mode)
+
+    # COMMUNICATION METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the instrument, keeping track of the data format
+        selected by ``FORM:DATA`` so that it is only re-sent when it needs
+        to change.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        super(Agilent34410a, self).sendcmd(cmd)
+        if cmd.startswith('FORM'):
+            self._data_format = cmd.split(' ', 1)[-1]
+        elif cmd == '*RST':
+            self._data_format = 'ASC'
+
+    def _select_data_format(self, data_format):
+        """
+        Selects the format used by the instrument to return readings, unless
+        it is already known to be selected.
+
+        :param str data_format: Format as accepted by ``FORM:DATA``.
+        """
+        if self._data_format != data_format:
+            self.sendcmd('FORM:DATA {}'.format(data_format))
+
+    def _restore_ascii_format(self):
+        """
+        Switches readings back to ASCII for queries that are parsed as text,
+        if a binary format has previously been selected.
+        """
+        if self._data_format not in (None, 'ASC'):
+            self._select_data_format('ASC')
+
+    def _read_binary_data(self, cmd):
+        """
+        Sends a query returning readings, and reads the readings back as a
+        block of 64-bit floating point values.
+
+        :param str cmd: Query returning the readings.
+
+        :rtype: `numpy.ndarray`
+        """
+        self._select_data_format('REAL,64')
+        self.sendcmd(cmd)
+        data = self.binblockread(8, fmt='>d')
+        self._read_terminator()
+        return data
+
+
+class Agilent34410aStream(RingBufferStream):
+
+    """
+    Streaming acquisition from an `Agilent34410a`, started by
+    `Agilent34410a.stream`.
+
+    Readings are transferred on a background thread into a
+    `~instruments.util_fns.RingBuffer`. Iterating over the stream yields
+    each new block of readings as a `~quantities.Quantity` array, until the
+    stream is stopped and all readings have been yielded. Alternatively,
+    `latest` returns the most recent readings at any time.
+
+    The stream can be used as a context manager, in which case it is
+    stopped on exit.
+    """
+
+    def __init__(self, parent, buffer_size=100000, chunk_size=10000,
+                 poll_interval=0.01, count=None):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least one.")
+        super(Agilent34410aStream, self).__init__(
+            buffer_size, poll_interval=poll_interval
+        )
+        self._parent = parent
+        self._chunk_size = chunk_size
+        self._count = count
+        self._units = None
+
+    @property
+    def readings_transferred(self):
+        """
+        Gets the total number of readings transferred from the multimeter.
+
+        :type: `int`
+        """
+        return self._buffer.total_written
+
+    def _on_start(self):
+        # Starts the multimeter taking readings.
+        self._units = UNITS[self._parent.mode]
+        self._parent.init()
+
+    def _on_stop(self):
+        self._parent.abort()
+
+    def _convert(self, data):
+        return data * self._units
+
+    def _transfer(self):
+        # pylint: disable=protected-access
+        parent = self._parent
+        remaining = self._count
+        while not self._stop.is_set() and \
+                (remaining is None or remaining > 0):
+            n_points = min(parent.data_point_count, self._chunk_size)
+            if remaining is not None:
+                n_points = min(n_points, remaining)
+            if n_points == 0:
+                if not parent._testing:
+                    time.sleep(self._poll_interval)
+                continue
+            data = parent._read_binary_data('R? {}'.format(n_points))
+            self._buffer.extend(data)
+            if remaining is not None:
+                remaining -= len(data)
+
+
 # UNITS #######################################################################
 
 UNITS = {
@@ -42,7 +42,9 @@ from enum import Enum, IntEnum
 import quantities as pq
 
 from instruments.abstract_instruments import Multimeter
-from instruments.util_fns import assume_units, bool_property, enum_property
+from instruments.util_fns import (
+    assume_units, bool_property, enum_property, parse_ascii_values
+)
 
 # CLASSES #####################################################################
 
@@ -521,8 +523,7 @@ class HP3456a(Multimeter):
             units = 1
 
         value = self.query("", size=-1)
-        values = [float(x) * units for x in value.split(",")]
-        return values
+        return parse_ascii_values(value) * units
 
     def measure(self, mode=None):
         """Instruct the HP3456a to perform a one time measurement. The
@@ -562,6 +563,54 @@ class HP3456a(Multimeter):
         value = self.query("", size=-1)
         return float(value) * units
 
+    def measure_statistics(self, count, mode=None, poll_interval=0.1,
+                           timeout=60):
+        """Take a series of measurements and summarise them on the
+        instrument, using `HP3456a.MathMode.statistic`. Only the mean,
+        variance and count registers are read back, so that large series of
+        measurements can be summarised without transferring every reading.
+
+        Example usage:
+
+        >>> dmm = ik.hp.HP3456a.open_gpibusb("/dev/ttyUSB0", 22)
+        >>> dmm.nplc = 1
+        >>> mean, variance, n = dmm.measure_statistics(
+        ...     1000, dmm.Mode.dcv
+        ... )
+
+        :param int count: Number of measurements to take.
+        :param mode: Desired measurement mode. If not specified, the previous
+            set mode will be used, but no measurement unit will be returned.
+        :type mode: `HP3456a.Mode`
+        :param float poll_interval: Time in seconds between checks of the
+            count register while the measurements are taken.
+        :param float timeout: Time in seconds to wait for the measurements
+            to complete.
+
+        :return: The mean and variance of the measurements, and the number
+            of measurements taken.
+        :rtype: `tuple` of (`~quantities.Quantity`, `~quantities.Quantity`,
+            `int`)
+        """
+        units = UNITS[mode]
+        if mode is not None:
+            self.sendcmd(mode.value)
+        self.math_mode = HP3456a.MathMode.statistic
+        self.number_of_readings = count
+        self.trigger()
+
+        start = time.time()
+        n_taken = self.count
+        while n_taken < count:
+            if time.time() - start > timeout:
+                raise IOError("Timed out waiting for {} measurements to "
+                              "complete.".format(count))
+            if not self._testing:  # pragma: no cover
+                time.sleep(poll_interval)
+            n_taken = self.count
+
+        return self.mean * units, self.variance * units ** 2, int(n_taken)
+
     def _register_read(self, name):
         """
         Read a register on the HP3456a.
@@ -8,7 +8,8 @@ Driver for the Keithley 2182 nano-voltmeter
 
 from __future__ import absolute_import
 from __future__ import division
-from builtins import range, map
+from builtins import range
+import time
 
 from enum import Enum
 import quantities as pq
@@ -35,6 +36,13 @@ class Keithley2182(SCPIMultimeter):
 
     """
 
+    def __init__(self, filelike):
+        super(Keithley2182, self).__init__(filelike)
+        # Measurement units and data format (as selected by FORM:DATA) last
+        # known to be set on the instrument, or `None` if they are unknown.
+        self._units = None
+        self._data_format = None
+
     # INNER CLASSES #
 
     class Channel(Multimeter):
@@ -123,6 +131,12 @@ class Keithley2182(SCPIMultimeter):
         timer = 'TIM'
         manual = 'MAN'
 
+    # CONSTANTS #
+
+    #: Minimum and maximum number of readings stored by the buffer.
+    MIN_BUFFER_SIZE = 2
+    MAX_BUFFER_SIZE = 1024
+
     # PROPERTIES #
 
     @property
@@ -186,24 +200,37 @@ class Keithley2182(SCPIMultimeter):
         """
         Gets the current measurement units of the instrument.
 
+        The units are cached after they are first read, and the cache is
+        cleared when a command changing the measurement function or units is
+        sent. Use `refresh_units` if they were changed from the front panel.
+
         :rtype: `~quantities.unitquantity.UnitQuantity`
         """
-        mode = self.channel[0].mode
-        if mode == Keithley2182.Mode.voltage_dc:
-            return pq.volt
-        unit = self.query("UNIT:TEMP?")
-        if unit == "C":
-            unit = pq.celsius
-        elif unit == "K":
-            unit = pq.kelvin
-        elif unit == "F":
-            unit = pq.fahrenheit
-        else:
-            raise ValueError("Unknown temperature units.")
-        return unit
+        if self._units is None:
+            self._units = self._read_units()
+        return self._units
+
+    @property
+    def buffer_count(self):
+        """
+        Gets the number of readings currently stored in the buffer.
+
+        :type: `int`
+        """
+        return int(self.query("TRAC:POIN:ACT?"))
 
     # METHODS #
 
+    def refresh_units(self):
+        """
+        Reads the measurement units from the instrument, replacing the
+        cached value.
+
+        :rtype: `~quantities.unitquantity.UnitQuantity`
+        """
+        self._units = None
+        return self.units
+
     def fetch(self):
         """
         Transfer readings from instrument memory to the output buffer, and thus
@@ -212,13 +239,98 @@ class Keithley2182(SCPIMultimeter):
         complete before executing this command.
         Readings are NOT erased from memory when using fetch. Use the ``R?``
         command to read and erase data.
-        Note that the data is transfered as ASCII, and thus it is not
-        recommended to transfer a large number of data points using GPIB.
+        Note that the data is transfered as ASCII. Use `read_buffer` to
+        transfer a large number of data points.
 
         :return: Measurement readings from the instrument output buffer.
-        :rtype: `list` of `~quantities.quantity.Quantity` elements
+        :rtype: `~quantities.quantity.Quantity` with `numpy.array`
+        """
+        self._restore_ascii_format()
+        self.sendcmd("FETC?")
+        return self.read_ascii_values(chunk_size=4096) * self.units
+
+    def arm_buffer(self, count):
+        """
+        Clears the buffer and sets it up to store the next ``count``
+        readings, then arms the nano-voltmeter to take them. Once the
+        measurements are complete, the readings can be downloaded with
+        `read_buffer`.
+
+        :param int count: Number of readings to take, between
+            `MIN_BUFFER_SIZE` and `MAX_BUFFER_SIZE`.
+        """
+        if not self.MIN_BUFFER_SIZE <= count <= self.MAX_BUFFER_SIZE:
+            raise ValueError("Buffer size must be between {} and {}, got "
+                             "{}.".format(self.MIN_BUFFER_SIZE,
+                                          self.MAX_BUFFER_SIZE, count))
+        self.sendcmd("TRAC:CLE")
+        self.sendcmd("TRAC:POIN {}".format(count))
+        self.sendcmd("TRAC:FEED SENS")
+        self.sendcmd("TRAC:FEED:CONT NEXT")
+        self.sendcmd("TRIG:COUN {}".format(count))
+        self.sendcmd("INIT")
+
+    def read_buffer(self):
+        """
+        Downloads all readings stored in the buffer in a single binary
+        transfer, using 64-bit floating point precision.
+
+        :rtype: `~quantities.Quantity` with `numpy.array`
+        """
+        return self._read_buffer_data(self.buffer_count) * self.units
+
+    def stream(self, buffer_size=MAX_BUFFER_SIZE, count=None,
+               poll_interval=0.1, timeout=60):
         """
-        return list(map(float, self.query("FETC?").split(","))) * self.units
+        Records readings by repeatedly filling the buffer and downloading
+        it, yielding the readings of each filled buffer. This allows
+        recordings longer than the buffer itself. There is a short gap in
+        the recording while each buffer is downloaded and the next one is
+        armed.
+
+        Example usage:
+
+        >>> meter = ik.keithley.Keithley2182.open_gpibusb("/dev/ttyUSB0", 10)
+        >>> readings = np.concatenate([
+        ...     chunk.magnitude for chunk in meter.stream(count=10000)
+        ... ])
+
+        :param int buffer_size: Number of readings stored in each buffer,
+            between `MIN_BUFFER_SIZE` and `MAX_BUFFER_SIZE`.
+        :param int count: Total number of readings to record, or `None` to
+            record until the generator is closed.
+        :param float poll_interval: Time in seconds between checks for
+            whether the buffer has filled.
+        :param float timeout: Time in seconds to wait for a new reading to
+            be stored in the buffer before raising `IOError`.
+        :return: Generator of the readings of each buffer.
+        :rtype: `~quantities.Quantity` with `numpy.array`
+        """
+        units = self.units
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = buffer_size
+            if remaining is not None:
+                size = max(min(size, remaining), self.MIN_BUFFER_SIZE)
+            self.arm_buffer(size)
+            stored = 0
+            deadline = time.time() + timeout
+            while stored < size:
+                n_readings = self.buffer_count
+                if n_readings > stored:
+                    stored = n_readings
+                    deadline = time.time() + timeout
+                elif time.time() > deadline:
+                    raise IOError("Timed out waiting for the buffer to fill: "
+                                  "{} of {} readings were stored.".format(
+                                      stored, size))
+                elif not self._testing:
+                    time.sleep(poll_interval)
+            data = self._read_buffer_data(size)
+            if remaining is not None:
+                data = data[:remaining]
+                remaining -= len(data)
+            yield data * units
 
     def measure(self, mode=None):
         """
@@ -237,6 +349,78 @@ class Keithley2182(SCPIMultimeter):
         if not isinstance(mode, Keithley2182.Mode):
             raise TypeError("Mode must be specified as a Keithley2182.Mode "
                             "value, got {} instead.".format(mode))
+        self._restore_ascii_format()
         value = float(self.query("MEAS:{}?".format(mode.value)))
+        # MEAS: also selects the measurement function.
+        self._units = None
         unit = self.units
         return value * unit
+
+    # COMMUNICATION METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the instrument, keeping track of the data format
+        selected by ``FORM:DATA`` and clearing the cached units when the
+        measurement function or units may have changed.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        super(Keithley2182, self).sendcmd(cmd)
+        if cmd.startswith("FORM:DATA"):
+            self._data_format = cmd.split(" ", 1)[-1]
+        elif cmd.startswith(("SENS:FUNC", "UNIT", "CONF", "*RST")):
+            self._units = None
+            if cmd == "*RST":
+                self._data_format = "ASC"
+
+    # PRIVATE METHODS #
+
+    def _read_units(self):
+        mode = self.channel[0].mode
+        if mode == Keithley2182.Mode.voltage_dc:
+            return pq.volt
+        unit = self.query("UNIT:TEMP?")
+        if unit == "C":
+            unit = pq.celsius
+        elif unit == "K":
+            unit = pq.kelvin
+        elif unit == "F":
+            unit = pq.fahrenheit
+        else:
+            raise ValueError("Unknown temperature units.")
+        return unit
+
+    def _select_data_format(self, data_format):
+        """
+        Selects the format used to return readings, unless it is already
+        known to be selected. Binary formats are sent in big-endian order.
+
+        :param str data_format: Format as accepted by ``FORM:DATA``.
+        """
+        if self._data_format != data_format:
+            self.sendcmd("FORM:DATA {}".format(data_format))
+            if data_format != "ASC":
+                self.sendcmd("FORM:BORD NORM")
+
+    def _restore_ascii_format(self):
+        """
+        Switches readings back to ASCII for queries that are parsed as text,
+        if a binary format has previously been selected.
+        """
+        if self._data_format not in (None, "ASC"):
+            self._select_data_format("ASC")
+
+    def _read_buffer_data(self, count):
+        """
+        Reads ``count`` readings from the buffer in binary.
+
+        :rtype: `numpy.ndarray`
+        """
+        self._select_data_format("REAL,64")
+        self.sendcmd("TRAC:DATA?")
+        # Binary data is sent as an indefinite-length block, so its length
+        # follows from the number of readings.
+        data = self.binblockread(8, fmt=">d", count=count)
+        self._read_terminator()
+        return data
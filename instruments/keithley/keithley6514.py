@@ -8,15 +8,17 @@ Provides support for the Keithley 6514 electrometer
 
 from __future__ import absolute_import
 from __future__ import division
-from builtins import map
 
 from enum import Enum
 
+import numpy as np
 import quantities as pq
 
 from instruments.abstract_instruments import Electrometer
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import bool_property, enum_property
+from instruments.util_fns import (
+    bool_property, enum_property, int_property, parse_ascii_values
+)
 
 # CLASSES #####################################################################
 
@@ -34,6 +36,12 @@ class Keithley6514(SCPIInstrument, Electrometer):
     >>> dmm = ik.keithley.Keithley6514.open_gpibusb('/dev/ttyUSB0', 12)
     """
 
+    def __init__(self, filelike):
+        super(Keithley6514, self).__init__(filelike)
+        # Data format last selected with FORM:DATA, or `None` if it has not
+        # been set since connecting and is therefore unknown.
+        self._data_format = None
+
     # ENUMS #
 
     class Mode(Enum):
@@ -84,6 +92,25 @@ class Keithley6514(SCPIInstrument, Electrometer):
         Mode.charge: pq.coulomb
     }
 
+    #: Maximum number of readings stored by the buffer.
+    MAX_BUFFER_SIZE = 2500
+
+    #: Data type of the structured arrays returned by `read_buffer`.
+    BUFFER_DTYPE = np.dtype([
+        ('reading', np.float64),
+        ('timestamp', np.float64),
+        ('status', np.int64)
+    ])
+
+    # Layout of each reading in the buffer when read in binary, as selected
+    # by FORM:DATA REAL,64, FORM:ELEM READ,TIME,STAT and FORM:BORD NORM.
+    # Double precision keeps millisecond timestamps exact over long runs.
+    _BINARY_DTYPE = np.dtype([
+        ('reading', '>f8'),
+        ('timestamp', '>f8'),
+        ('status', '>f8')
+    ])
+
     # PRIVATE METHODS #
 
     def _valid_range(self, mode):
@@ -99,8 +126,7 @@ class Keithley6514(SCPIInstrument, Electrometer):
             raise ValueError('Invalid mode.')
 
     def _parse_measurement(self, ascii):
-        # TODO: don't assume ASCII data format # pylint: disable=fixme
-        vals = list(map(float, ascii.split(',')))
+        vals = parse_ascii_values(ascii)
         reading = vals[0] * self.unit
         timestamp = vals[1]
         status = vals[2]
@@ -154,6 +180,26 @@ class Keithley6514(SCPIInstrument, Electrometer):
         """
     )
 
+    buffer_size = int_property(
+        'TRAC:POIN',
+        doc="""
+        Gets/sets the number of readings the buffer stores, up to
+        `MAX_BUFFER_SIZE`.
+
+        :type: `int`
+        """
+    )
+
+    buffer_count = int_property(
+        'TRAC:POIN:ACT',
+        readonly=True,
+        doc="""
+        Gets the number of readings currently stored in the buffer.
+
+        :type: `int`
+        """
+    )
+
     @property
     def unit(self):
         return self._MODE_UNITS[self.mode]
@@ -220,6 +266,7 @@ class Keithley6514(SCPIInstrument, Electrometer):
         (So does not issue a trigger)
         Returns a tuple of the form (reading, timestamp)
         """
+        self._restore_ascii_format()
         raw = self.query('FETC?')
         reading, timestamp, _ = self._parse_measurement(raw)
         return reading, timestamp
@@ -229,6 +276,88 @@ class Keithley6514(SCPIInstrument, Electrometer):
         Trigger and acquire readings using the current mode.
         Returns a tuple of the form (reading, timestamp)
         """
+        self._restore_ascii_format()
         raw = self.query('READ?')
         reading, timestamp, _ = self._parse_measurement(raw)
         return reading, timestamp
+
+    def arm_buffer(self, count):
+        """
+        Clears the buffer and sets it up to store the next ``count``
+        readings, then arms the electrometer to take them. Once the
+        measurements are complete, the readings can be downloaded with
+        `read_buffer`.
+
+        :param int count: Number of readings to take, between 1 and
+            `MAX_BUFFER_SIZE`.
+        """
+        if not 1 <= count <= self.MAX_BUFFER_SIZE:
+            raise ValueError("Buffer size must be between 1 and {}, got "
+                             "{}.".format(self.MAX_BUFFER_SIZE, count))
+        self.sendcmd('TRAC:CLE')
+        self.buffer_size = count
+        self.sendcmd('TRAC:FEED SENS')
+        self.sendcmd('TRAC:FEED:CONT NEXT')
+        self.sendcmd('TRIG:COUN {}'.format(count))
+        self.sendcmd('INIT')
+
+    def read_buffer(self):
+        """
+        Downloads all readings stored in the buffer in a single binary
+        transfer, using 64-bit floating point precision.
+
+        The readings are in the units of the current measurement mode (see
+        `unit`), and the timestamps are in seconds.
+
+        :return: Structured array with ``reading``, ``timestamp`` and
+            ``status`` fields, as described by `BUFFER_DTYPE`.
+        :rtype: `numpy.ndarray`
+        """
+        count = self.buffer_count
+        self._select_data_format('REAL,64')
+        self.sendcmd('TRAC:DATA?')
+        # Binary data from the buffer is sent as an indefinite-length block,
+        # so its length follows from the number of readings.
+        data = self.binblockread(
+            self._BINARY_DTYPE.itemsize, fmt=self._BINARY_DTYPE, count=count
+        )
+        self._read_terminator()
+        return data.astype(self.BUFFER_DTYPE)
+
+    # COMMUNICATION METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the instrument, keeping track of the data format
+        selected by ``FORM:DATA`` so that it is only re-sent when it needs
+        to change.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        super(Keithley6514, self).sendcmd(cmd)
+        if cmd.startswith('FORM:DATA'):
+            self._data_format = cmd.split(' ', 1)[-1]
+        elif cmd == '*RST':
+            self._data_format = 'ASC'
+
+    def _select_data_format(self, data_format):
+        """
+        Selects the format used to return readings, unless it is already
+        known to be selected. Binary formats also select the elements and
+        byte order expected by `read_buffer`.
+
+        :param str data_format: Format as accepted by ``FORM:DATA``.
+        """
+        if self._data_format != data_format:
+            self.sendcmd('FORM:DATA {}'.format(data_format))
+            if data_format != 'ASC':
+                self.sendcmd('FORM:ELEM READ,TIME,STAT')
+                self.sendcmd('FORM:BORD NORM')
+
+    def _restore_ascii_format(self):
+        """
+        Switches readings back to ASCII for queries that are parsed as text,
+        if a binary format has previously been selected.
+        """
+        if self._data_format not in (None, 'ASC'):
+            self._select_data_format('ASC')
@@ -12,13 +12,13 @@ likely contains bugs and non-complete behaviour.
 
 from __future__ import absolute_import
 from __future__ import division
-from functools import reduce
 from time import time, sleep
 from contextlib import contextmanager
 
 from builtins import range, map
 from enum import IntEnum
 
+import numpy as np
 import quantities as pq
 
 from instruments.abstract_instruments import Instrument
@@ -95,11 +95,17 @@ class NewportESP301(Instrument):
     .. _user's guide: http://assets.newport.com/webDocuments-EN/images/14294.pdf
     """
 
+    # The controller accepts at most 80 characters on each line of
+    # semicolon-separated commands.
+    _max_line_length = 80
+
     def __init__(self, filelike):
         super(NewportESP301, self).__init__(filelike)
         self._execute_immediately = True
         self._command_list = []
-        self._bulk_query_resp = ""
+        self._query_parsers = []
+        self._bulk_query_resp = []
+        self._axis_units = {}
         self.terminator = "\r"
 
     # PROPERTIES ##
@@ -126,7 +132,8 @@ class NewportESP301(Instrument):
 
     # LOW-LEVEL COMMAND METHODS ##
 
-    def _newport_cmd(self, cmd, params=tuple(), target=None, errcheck=True):
+    def _newport_cmd(self, cmd, params=tuple(), target=None, errcheck=True,
+                     parse=None):
         """
         The Newport ESP-301 command set supports checking for errors,
         specifying different axes and allows for multiple parameters.
@@ -141,6 +148,10 @@ class NewportESP301(Instrument):
             checking. Note that since error-checking is unsupported
             during device programming, ``errcheck`` must be `False`
             during ``PGM`` mode.
+        :param callable parse: If given, called with the response of a
+            query to convert it. Within
+            `~NewportESP301.execute_bulk_command`, the converted response is
+            added to the list of responses when the block exits.
         """
         query_resp = None
         if isinstance(target, NewportESP301Axis):
@@ -153,8 +164,12 @@ class NewportESP301(Instrument):
 
         if self._execute_immediately:
             query_resp = self._execute_cmd(raw_cmd, errcheck)
+            if parse is not None:
+                query_resp = parse(query_resp)
         else:
             self._command_list.append(raw_cmd)
+            if "?" in raw_cmd:
+                self._query_parsers.append(parse)
 
         # This works because "return None" is equivalent to "return".
         return query_resp
@@ -180,16 +195,95 @@ class NewportESP301(Instrument):
             self.sendcmd(raw_cmd)
 
         if errcheck:
-            err_resp = self.query('TB?')
-
-            # pylint: disable=unused-variable
-            code, timestamp, msg = err_resp.split(",")
-            code = int(code)
-            if code != 0:
-                raise NewportError(code)
+            self._check_error()
 
         return query_resp
 
+    def _check_error(self):
+        """
+        Queries the controller for the most recent error with ``TB?`` and
+        raises a `NewportError` if one occurred.
+        """
+        err_resp = self.query('TB?')
+
+        # pylint: disable=unused-variable
+        code, timestamp, msg = err_resp.split(",")
+        code = int(code)
+        if code != 0:
+            raise NewportError(code)
+
+    def _join_commands(self, command_list):
+        """
+        Joins raw commands into as few semicolon-separated lines as
+        possible, such that no line is longer than
+        `~NewportESP301._max_line_length` characters.
+
+        :param list command_list: Raw command strings, as built by
+            `~NewportESP301._newport_cmd`.
+
+        :return: Lines of commands, each of which is a list of the raw
+            commands on that line.
+        :rtype: `list` of `list` of `str`
+        """
+        lines = []
+        length = 0
+        for cmd in command_list:
+            if lines and length + len(cmd) + 1 <= self._max_line_length:
+                lines[-1].append(cmd)
+                length += len(cmd) + 1
+            else:
+                lines.append([cmd])
+                length = len(cmd)
+        return lines
+
+    def _execute_bulk_cmd(self, command_list, errcheck=True):
+        """
+        Sends a list of raw commands to the Newport as semicolon-separated
+        lines, then splits the responses so that each query in
+        ``command_list`` is mapped to its own response.
+
+        :param list command_list: Raw command strings, as built by
+            `~NewportESP301._newport_cmd`.
+        :param bool errcheck: If `True`, the error buffer is checked once
+            after all lines have been executed.
+
+        Each query must return a single value, as responses are mapped
+        to queries by position.
+
+        :return: Responses to the queries in ``command_list``, in the order
+            that the queries were queued.
+        :rtype: `list` of `str`
+        """
+        responses = []
+        for line in self._join_commands(command_list):
+            n_queries = sum("?" in cmd for cmd in line)
+            command_string = ";".join(line)
+            if n_queries:
+                line_responses = self.query(command_string).split(",")
+                # Depending on the firmware, responses may also come back on
+                # separate lines rather than as a single comma-separated
+                # line.
+                while len(line_responses) < n_queries:
+                    line_responses.extend(self.read().split(","))
+                # Responses are matched to queries by position, so a query
+                # returning several fields would shift every later value.
+                if len(line_responses) != n_queries:
+                    raise IOError(
+                        "Expected {} responses to \"{}\", got {}: "
+                        "queries returning several comma-separated values "
+                        "cannot be executed in bulk.".format(
+                            n_queries, command_string, len(line_responses)
+                        )
+                    )
+                responses.extend(resp.strip() for resp in line_responses)
+            else:
+                self.sendcmd(command_string)
+
+        if errcheck:
+            self._check_error()
+
+        return responses
+
     # SPECIFIC COMMANDS ##
 
     def _home(self, axis, search_mode, errcheck=True):
@@ -263,24 +357,132 @@ class NewportESP301(Instrument):
     def execute_bulk_command(self, errcheck=True):
         """
         Context manager to execute multiple commands in a single
-        communication with device
+        communication with device.
+
+        Commands issued within the block are queued rather than sent, and
+        are then sent as semicolon-separated lines, each of at most
+        `~NewportESP301._max_line_length` characters, when the block exits.
+        The error buffer is checked once for the whole batch, rather than
+        after every command. Responses to any queued queries are split
+        and appended, in order, to the list returned by the context manager.
+        Queries that return several comma-separated values, such as ``TB?``,
+        cannot be queued, and raise `IOError` when the block exits.
+
+        Axis properties read within the block return `None`, and their
+        values are instead appended to the list of responses, converted
+        as they would have been by the property.
+
+        Note that axes should be obtained from `NewportESP301.axis` before
+        entering the block, as creating an axis queries the controller.
 
         Example::
 
-            with self.execute_bulk_command():
-                execute commands as normal...
+            >>> axis = controller.axis[0]
+            >>> with controller.execute_bulk_command() as responses:
+            ...     axis.move(0.001, absolute=False)
+            ...     axis.move(0.002, absolute=False)
+            ...     _ = axis.position
+            >>> position = responses[0]
 
-        :param bool errcheck: Boolean to check for errors after each command
-            that is sent to the instrument.
+        :param bool errcheck: Boolean to check for errors after the batch
+            of commands has been sent to the instrument.
+
+        :return: Responses to the queued queries, filled in once the block
+            exits.
+        :rtype: `list`
         """
+        responses = []
         self._execute_immediately = False
-        yield
-        command_string = reduce(
-            lambda x, y: x + ' ; ' + y + ' ; ', self._command_list)
-        # TODO: is _bulk_query_resp getting back to user?
-        self._bulk_query_resp = self._execute_cmd(command_string, errcheck)
-        self._command_list = []
-        self._execute_immediately = True
+        try:
+            yield responses
+            if self._command_list:
+                responses.extend(
+                    resp if parse is None else parse(resp)
+                    for parse, resp in zip(
+                        self._query_parsers,
+                        self._execute_bulk_cmd(self._command_list, errcheck)
+                    )
+                )
+            self._bulk_query_resp = responses
+        finally:
+            self._command_list = []
+            self._query_parsers = []
+            self._execute_immediately = True
+
+    def wait_for_all(self, axes, timeout=None, min_poll_interval=0.005,
+                     max_poll_interval=0.5):
+        """
+        Blocks until all motion along each of the given axes is complete.
+
+        Every polling cycle checks all axes that are still moving with a
+        single compound query. The time between polls is adapted to the
+        longest remaining move, estimated from the distance of each axis to
+        its target and its velocity, so that short moves return promptly and
+        long moves do not flood the connection with queries.
+
+        Example::
+
+            >>> x, y = controller.axis[0], controller.axis[1]
+            >>> x.move(10)
+            >>> y.move(5)
+            >>> controller.wait_for_all([x, y], timeout=30)
+
+        :param axes: Axes to wait on.
+        :type axes: `list` of `NewportESP301Axis`
+        :param timeout: Maximum amount of time to wait before raising an
+            `IOError`. If `None`, this method will wait indefinitely.
+        :type timeout: `float` or `~quantities.Quantity`
+        :param min_poll_interval: Shortest time to sleep between polls.
+        :type min_poll_interval: `float` or `~quantities.Quantity`
+        :param max_poll_interval: Longest time to sleep between polls.
+        :type max_poll_interval: `float` or `~quantities.Quantity`
+        """
+        if timeout is not None:
+            timeout = float(assume_units(timeout, pq.s).rescale(
+                pq.s).magnitude)
+        min_poll_interval = float(assume_units(
+            min_poll_interval, pq.s).rescale(pq.s).magnitude)
+        max_poll_interval = float(assume_units(
+            max_poll_interval, pq.s).rescale(pq.s).magnitude)
+        moving = [axis.axis_id for axis in axes]
+        tic = time()
+
+        # Targets and velocities do not change during a move, so they are
+        # only read once.
+        with self.execute_bulk_command() as responses:
+            for axis_id in moving:
+                self._newport_cmd("PA?", target=axis_id)
+                self._newport_cmd("VA?", target=axis_id)
+        targets = dict(zip(moving, map(float, responses[::2])))
+        velocities = dict(zip(moving, map(float, responses[1::2])))
+
+        while moving:
+            with self.execute_bulk_command() as responses:
+                for axis_id in moving:
+                    self._newport_cmd("MD?", target=axis_id)
+                    self._newport_cmd("TP?", target=axis_id)
+
+            still_moving = []
+            time_left = 0
+            for axis_id, done, position in zip(
+                    moving, responses[::2], responses[1::2]):
+                if int(done):
+                    continue
+                still_moving.append(axis_id)
+                if velocities[axis_id] > 0:
+                    time_left = max(
+                        time_left,
+                        abs(targets[axis_id] - float(position)) /
+                        velocities[axis_id]
+                    )
+            moving = still_moving
+
+            if moving:
+                if timeout is not None and (time() - tic) >= timeout:
+                    raise IOError("Timed out waiting for motion to finish.")
+                if not self._testing:
+                    sleep(min(max(time_left / 2, min_poll_interval),
+                              max_poll_interval))
 
     def run_program(self, program_id):
         """
@@ -326,6 +528,76 @@ class NewportESP301Axis(object):
         11:  pq.urad,
     }
 
+    # Query command and parser for each parameter that can be read from an
+    # axis. Each parser takes the current units of the axis and the raw
+    # response to the query. This table is shared by the properties below
+    # and by the compound queries made by `~NewportESP301Axis._read_params`.
+    _params = {
+        'is_motion_done': ("MD?", lambda u, r: bool(int(r))),
+        'acceleration': ("AC?",
+                         lambda u, r: assume_units(float(r), u / (pq.s**2))),
+        'deceleration': ("AG?",
+                         lambda u, r: assume_units(float(r), u / (pq.s**2))),
+        'estop_deceleration': ("AE?", lambda u, r: assume_units(
+            float(r), u / (pq.s**2))),
+        'jerk': ("JK?", lambda u, r: assume_units(float(r), u / (pq.s**3))),
+        'velocity': ("VA?", lambda u, r: assume_units(float(r), u / pq.s)),
+        'max_velocity': ("VU?",
+                         lambda u, r: assume_units(float(r), u / pq.s)),
+        'max_base_velocity': ("VB?",
+                              lambda u, r: assume_units(float(r), u / pq.s)),
+        'jog_high_velocity': ("JH?",
+                              lambda u, r: assume_units(float(r), u / pq.s)),
+        'jog_low_velocity': ("JW?",
+                             lambda u, r: assume_units(float(r), u / pq.s)),
+        'homing_velocity': ("OH?",
+                            lambda u, r: assume_units(float(r), u / pq.s)),
+        'max_acceleration': ("AU?", lambda u, r: assume_units(
+            float(r), u / (pq.s**2))),
+        'position': ("TP?", lambda u, r: assume_units(float(r), u)),
+        'desired_position': ("DP?", lambda u, r: assume_units(float(r), u)),
+        'desired_velocity': ("DV?",
+                             lambda u, r: assume_units(float(r), u / pq.s)),
+        'home': ("DH?", lambda u, r: assume_units(float(r), u)),
+        'encoder_resolution': ("SU?",
+                               lambda u, r: assume_units(float(r), u)),
+        'full_step_resolution': ("FR?",
+                                 lambda u, r: assume_units(float(r), u)),
+        'left_limit': ("SL?", lambda u, r: assume_units(float(r), u)),
+        'right_limit': ("SR?", lambda u, r: assume_units(float(r), u)),
+        'error_threshold': ("FE?", lambda u, r: assume_units(float(r), u)),
+        'current': ("QI?", lambda u, r: assume_units(float(r), pq.A)),
+        'voltage': ("QV?", lambda u, r: assume_units(float(r), pq.V)),
+        'motor_type': ("QM?", lambda u, r: NewportESP301MotorType(int(r))),
+        'feedback_configuration': ("ZB?", lambda u, r: int(r[:-2], 16)),
+        'position_display_resolution': ("FP?", lambda u, r: int(r)),
+        'trajectory': ("TJ?", lambda u, r: int(r)),
+        'microstep_factor': ("QS?", lambda u, r: int(r)),
+        'hardware_limit_configuration': ("ZH?", lambda u, r: int(r[:-2])),
+        'acceleration_feed_forward': ("AF?", lambda u, r: float(r)),
+        'proportional_gain': ("KP?", lambda u, r: float(r[:-1])),
+        'derivative_gain': ("KD?", lambda u, r: float(r)),
+        'integral_gain': ("KI?", lambda u, r: float(r)),
+        'integral_saturation_gain': ("KS?", lambda u, r: float(r)),
+    }
+
+    # Parameters read by `~NewportESP301Axis.read_setup` and
+    # `~NewportESP301Axis.get_status`, in the order that they are queried.
+    _setup_params = (
+        'motor_type', 'feedback_configuration', 'full_step_resolution',
+        'position_display_resolution', 'current', 'max_velocity',
+        'encoder_resolution', 'acceleration', 'deceleration', 'velocity',
+        'max_acceleration', 'homing_velocity', 'jog_high_velocity',
+        'jog_low_velocity', 'estop_deceleration', 'jerk', 'proportional_gain',
+        'derivative_gain', 'integral_gain', 'integral_saturation_gain',
+        'home', 'microstep_factor', 'acceleration_feed_forward', 'trajectory',
+        'hardware_limit_configuration',
+    )
+
+    _status_params = (
+        'position', 'desired_position', 'desired_velocity', 'is_motion_done',
+    )
+
     def __init__(self, controller, axis_id):
         if not isinstance(controller, NewportESP301):
             raise TypeError("Axis must be controlled by a Newport ESP-301 "
@@ -334,7 +606,15 @@ class NewportESP301Axis(object):
         self._controller = controller
         self._axis_id = axis_id + 1
 
-        self._units = self.units
+        # Axis objects are created on each access to NewportESP301.axis, so
+        # the unit numbers are cached by the controller rather than by the
+        # axis.
+        # pylint: disable=protected-access
+        unit_num = controller._axis_units.get(self._axis_id)
+        if unit_num is None:
+            self.refresh_units()
+        else:
+            self._cache_units(unit_num)
 
     # CONTEXT MANAGERS ##
 
@@ -345,10 +625,14 @@ class NewportESP301Axis(object):
         label (see `NewportESP301Units`), ensuring that the units are properly
         reset at the completion of the context manager.
         """
-        old_units = self._get_units()
+        old_units = self._unit_num
         self._set_units(units)
-        yield
-        self._set_units(old_units)
+        self._cache_units(units)
+        try:
+            yield
+        finally:
+            self._set_units(old_units)
+            self._cache_units(old_units)
 
     # PRIVATE METHODS ##
 
@@ -370,6 +654,21 @@ class NewportESP301Axis(object):
             params=[int(new_units)]
         )
 
+    def _cache_units(self, unit_num):
+        """
+        Stores the integer label for the units of this axis (see
+        `NewportESP301Units`), both on the axis and in the cache held by the
+        controller, along with the corresponding `~quantities.Quantity`.
+
+        The label is cached rather than the `~quantities.Quantity`, as
+        several labels share the same `~quantities.Quantity`.
+        """
+        unit_num = NewportESP301Units(int(unit_num))
+        self._unit_num = unit_num
+        self._units = self._get_pq_unit(unit_num)
+        # pylint: disable=protected-access
+        self._controller._axis_units[self._axis_id] = unit_num
+
     # PROPERTIES ##
 
     @property
@@ -391,7 +690,7 @@ class NewportESP301Axis(object):
 
         :type: `bool`
         """
-        return bool(int(self._newport_cmd("MD?", target=self.axis_id)))
+        return self._query_param("is_motion_done")
 
     @property
     def acceleration(self):
@@ -402,11 +701,7 @@ class NewportESP301Axis(object):
             of current newport unit
         :type: `~quantities.Quantity` or `float`
         """
-
-        return assume_units(
-            float(self._newport_cmd("AC?", target=self.axis_id)),
-            self._units / (pq.s**2)
-        )
+        return self._query_param("acceleration")
 
     @acceleration.setter
     def acceleration(self, newval):
@@ -425,10 +720,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s^2}`
         :type: `~quantities.Quantity` or float
         """
-        return assume_units(
-            float(self._newport_cmd("AG?", target=self.axis_id)),
-            self._units / (pq.s**2)
-        )
+        return self._query_param("deceleration")
 
     @deceleration.setter
     def deceleration(self, newval):
@@ -447,10 +739,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s^2}`
         :type: `~quantities.Quantity` or float
         """
-        return assume_units(
-            float(self._newport_cmd("AE?", target=self.axis_id)),
-            self._units / (pq.s**2)
-        )
+        return self._query_param("estop_deceleration")
 
     @estop_deceleration.setter
     def estop_deceleration(self, decel):
@@ -467,11 +756,7 @@ class NewportESP301Axis(object):
             of current newport unit
         :type: `~quantities.Quantity` or `float`
         """
-
-        return assume_units(
-            float(self._newport_cmd("JK?", target=self.axis_id)),
-            self._units / (pq.s**3)
-        )
+        return self._query_param("jerk")
 
     @jerk.setter
     def jerk(self, jerk):
@@ -488,10 +773,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("VA?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("velocity")
 
     @velocity.setter
     def velocity(self, velocity):
@@ -508,10 +790,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("VU?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("max_velocity")
 
     @max_velocity.setter
     def max_velocity(self, newval):
@@ -530,10 +809,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("VB?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("max_base_velocity")
 
     @max_base_velocity.setter
     def max_base_velocity(self, newval):
@@ -552,10 +828,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("JH?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("jog_high_velocity")
 
     @jog_high_velocity.setter
     def jog_high_velocity(self, newval):
@@ -576,10 +849,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("JW?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("jog_low_velocity")
 
     @jog_low_velocity.setter
     def jog_low_velocity(self, newval):
@@ -600,10 +870,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("OH?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("homing_velocity")
 
     @homing_velocity.setter
     def homing_velocity(self, newval):
@@ -624,10 +891,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\frac{unit}{s^2}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("AU?", target=self.axis_id)),
-            self._units / (pq.s**2)
-        )
+        return self._query_param("max_acceleration")
 
     @max_acceleration.setter
     def max_acceleration(self, newval):
@@ -664,10 +928,7 @@ class NewportESP301Axis(object):
             of current newport unit
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("TP?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("position")
 
     @property
     def desired_position(self):
@@ -678,10 +939,7 @@ class NewportESP301Axis(object):
             of current newport unit
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("DP?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("desired_position")
 
     @property
     def desired_velocity(self):
@@ -692,10 +950,7 @@ class NewportESP301Axis(object):
             of current newport unit/s
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("DP?", target=self.axis_id)),
-            self._units / pq.s
-        )
+        return self._query_param("desired_velocity")
 
     @property
     def home(self):
@@ -707,10 +962,7 @@ class NewportESP301Axis(object):
             of current newport unit
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("DH?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("home")
 
     @home.setter
     def home(self, newval=0):
@@ -725,11 +977,16 @@ class NewportESP301Axis(object):
         """
         Get the units that all commands are in reference to.
 
+        The units are cached when the axis is first accessed, and are kept
+        up to date when they are set through this property,
+        `~NewportESP301Axis.setup_axis` or `~NewportESP301Axis.read_setup`.
+        If the units may have been changed by other means, such as from the
+        front panel, use `~NewportESP301Axis.refresh_units`.
+
         :type: `~quantities.Quantity` with units corresponding to
             units of axis connected  or int which corresponds to Newport
             unit number
         """
-        self._units = self._get_pq_unit(self._get_units())
         return self._units
 
     @units.setter
@@ -737,11 +994,26 @@ class NewportESP301Axis(object):
         if newval is None:
             return
         if isinstance(newval, int):
-            self._units = self._get_pq_unit(NewportESP301Units(int(newval)))
+            newval = NewportESP301Units(int(newval))
         elif isinstance(newval, pq.Quantity):
-            self._units = newval
             newval = self._get_unit_num(newval)
+        else:
+            raise TypeError("Units must be specified as an int or a "
+                            "quantities.Quantity, got {} "
+                            "instead.".format(type(newval)))
         self._set_units(newval)
+        self._cache_units(newval)
+
+    def refresh_units(self):
+        """
+        Queries the units of this axis from the controller, replacing the
+        cached value.
+
+        :return: The units of this axis.
+        :rtype: `~quantities.Quantity`
+        """
+        self._cache_units(self._get_units())
+        return self._units
 
     @property
     def encoder_resolution(self):
@@ -752,11 +1024,7 @@ class NewportESP301Axis(object):
         :units: The number of units per encoder step
         :type: `~quantities.Quantity` or `float`
         """
-
-        return assume_units(
-            float(self._newport_cmd("SU?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("encoder_resolution")
 
     @encoder_resolution.setter
     def encoder_resolution(self, newval):
@@ -775,11 +1043,7 @@ class NewportESP301Axis(object):
         :units: The number of units per encoder step
         :type: `~quantities.Quantity` or `float`
         """
-
-        return assume_units(
-            float(self._newport_cmd("FR?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("full_step_resolution")
 
     @full_step_resolution.setter
     def full_step_resolution(self, newval):
@@ -799,10 +1063,7 @@ class NewportESP301Axis(object):
         :units: The limit in units
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("SL?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("left_limit")
 
     @left_limit.setter
     def left_limit(self, limit):
@@ -818,10 +1079,7 @@ class NewportESP301Axis(object):
         :units: units
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("SR?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("right_limit")
 
     @right_limit.setter
     def right_limit(self, limit):
@@ -837,10 +1095,7 @@ class NewportESP301Axis(object):
         :units: units
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("FE?", target=self.axis_id)),
-            self._units
-        )
+        return self._query_param("error_threshold")
 
     @error_threshold.setter
     def error_threshold(self, newval):
@@ -861,10 +1116,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\text{A}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("QI?", target=self.axis_id)),
-            pq.A
-        )
+        return self._query_param("current")
 
     @current.setter
     def current(self, newval):
@@ -883,10 +1135,7 @@ class NewportESP301Axis(object):
             of current newport :math:`\\text{V}`
         :type: `~quantities.Quantity` or `float`
         """
-        return assume_units(
-            float(self._newport_cmd("QV?", target=self.axis_id)),
-            pq.V
-        )
+        return self._query_param("voltage")
 
     @voltage.setter
     def voltage(self, newval):
@@ -909,10 +1158,7 @@ class NewportESP301Axis(object):
         :type: `int`
         :rtype: `NewportESP301MotorType`
         """
-        return NewportESP301MotorType(int(self._newport_cmd(
-            "QM?",
-            target=self._axis_id
-        )))
+        return self._query_param("motor_type")
 
     @motor_type.setter
     def motor_type(self, newval):
@@ -927,7 +1173,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return int(self._newport_cmd("ZB?", target=self._axis_id)[:-2], 16)
+        return self._query_param("feedback_configuration")
 
     @feedback_configuration.setter
     def feedback_configuration(self, newval):
@@ -942,7 +1188,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return int(self._newport_cmd("FP?", target=self._axis_id))
+        return self._query_param("position_display_resolution")
 
     @position_display_resolution.setter
     def position_display_resolution(self, newval):
@@ -957,7 +1203,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return int(self._newport_cmd("TJ?", target=self._axis_id))
+        return self._query_param("trajectory")
 
     @trajectory.setter
     def trajectory(self, newval):
@@ -972,7 +1218,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return int(self._newport_cmd("QS?", target=self._axis_id))
+        return self._query_param("microstep_factor")
 
     @microstep_factor.setter
     def microstep_factor(self, newval):
@@ -995,7 +1241,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return int(self._newport_cmd("ZH?", target=self._axis_id)[:-2])
+        return self._query_param("hardware_limit_configuration")
 
     @hardware_limit_configuration.setter
     def hardware_limit_configuration(self, newval):
@@ -1010,7 +1256,7 @@ class NewportESP301Axis(object):
 
         :type: `int`
         """
-        return float(self._newport_cmd("AF?", target=self._axis_id))
+        return self._query_param("acceleration_feed_forward")
 
     @acceleration_feed_forward.setter
     def acceleration_feed_forward(self, newval):
@@ -1025,7 +1271,7 @@ class NewportESP301Axis(object):
 
         :type: `float`
         """
-        return float(self._newport_cmd("KP?", target=self._axis_id)[:-1])
+        return self._query_param("proportional_gain")
 
     @proportional_gain.setter
     def proportional_gain(self, newval):
@@ -1040,7 +1286,7 @@ class NewportESP301Axis(object):
 
         :type: `float`
         """
-        return float(self._newport_cmd("KD?", target=self._axis_id))
+        return self._query_param("derivative_gain")
 
     @derivative_gain.setter
     def derivative_gain(self, newval):
@@ -1055,7 +1301,7 @@ class NewportESP301Axis(object):
 
         :type: `float`
         """
-        return float(self._newport_cmd("KI?", target=self._axis_id))
+        return self._query_param("integral_gain")
 
     @integral_gain.setter
     def integral_gain(self, newval):
@@ -1070,7 +1316,7 @@ class NewportESP301Axis(object):
 
         :type: `float`
         """
-        return float(self._newport_cmd("KS?", target=self._axis_id))
+        return self._query_param("integral_saturation_gain")
 
     @integral_saturation_gain.setter
     def integral_saturation_gain(self, newval):
@@ -1330,40 +1576,13 @@ class NewportESP301Axis(object):
             'trajectory'
             'hardware_limit_configuration'
 
+        All parameters are read in a single compound query, split over as
+        few lines as the controller allows, followed by a single error check.
+
         :rtype: dict of `quantities.Quantity`, float and int
         """
 
-        config = dict()
-        config['units'] = self.units
-        config['motor_type'] = self.motor_type
-        config['feedback_configuration'] = self.feedback_configuration
-        config['full_step_resolution'] = self.full_step_resolution
-        config[
-            'position_display_resolution'] = self.position_display_resolution
-        config['current'] = self.current
-        config['max_velocity'] = self.max_velocity
-        config['encoder_resolution'] = self.encoder_resolution
-        config['acceleration'] = self.acceleration
-        config['deceleration'] = self.deceleration
-        config['velocity'] = self.velocity
-        config['max_acceleration'] = self.max_acceleration
-        config['homing_velocity'] = self.homing_velocity
-        config['jog_high_velocity'] = self.jog_high_velocity
-        config['jog_low_velocity'] = self.jog_low_velocity
-        config['estop_deceleration'] = self.estop_deceleration
-        config['jerk'] = self.jerk
-        # config['error_threshold'] = self.error_threshold
-        config['proportional_gain'] = self.proportional_gain
-        config['derivative_gain'] = self.derivative_gain
-        config['integral_gain'] = self.integral_gain
-        config['integral_saturation_gain'] = self.integral_saturation_gain
-        config['home'] = self.home
-        config['microstep_factor'] = self.microstep_factor
-        config['acceleration_feed_forward'] = self.acceleration_feed_forward
-        config['trajectory'] = self.trajectory
-        config[
-            'hardware_limit_configuration'] = self.hardware_limit_configuration
-        return config
+        return self._read_params(self._setup_params)
 
     def get_status(self):
         """
@@ -1374,16 +1593,52 @@ class NewportESP301Axis(object):
             'desired_velocity'
             'is_motion_done'
 
+        As with `~NewportESP301Axis.read_setup`, all values are read in a
+        single compound query.
+
         :rtype: dict
         """
-        status = dict()
-        status['units'] = self.units
-        status['position'] = self.position
-        status['desired_position'] = self.desired_position
-        status['desired_velocity'] = self.desired_velocity
-        status['is_motion_done'] = self.is_motion_done
+        return self._read_params(self._status_params)
+
+    def _query_param(self, key):
+        """
+        Queries a single parameter of this axis, parsing the response using
+        `~NewportESP301Axis._params`.
 
-        return status
+        :param str key: Name of the parameter to query.
+        """
+        cmd, parse = self._params[key]
+        return self._newport_cmd(
+            cmd,
+            target=self.axis_id,
+            parse=lambda resp: parse(self._units, resp)
+        )
+
+    def _read_params(self, keys):
+        """
+        Reads the units of this axis along with each of the given
+        parameters in a single compound query, checking for errors only once.
+
+        :param keys: Sequence of parameter names from
+            `~NewportESP301Axis._params`, such as
+            `NewportESP301Axis._setup_params`.
+
+        :return: Dictionary mapping each key, and ``'units'``, to its parsed
+            value.
+        :rtype: `dict`
+        """
+        with self._controller.execute_bulk_command() as responses:
+            self._newport_cmd("SN?", target=self.axis_id)
+            for key in keys:
+                self._newport_cmd(self._params[key][0], target=self.axis_id)
+
+        self._cache_units(responses[0])
+        values = dict(
+            (key, self._params[key][1](self._units, resp))
+            for key, resp in zip(keys, responses[1:])
+        )
+        values['units'] = self._units
+        return values
 
     @staticmethod
     def _get_pq_unit(num):
@@ -1421,3 +1676,199 @@ class NewportESP301Axis(object):
         :return:
         """
         return self._controller._newport_cmd(cmd, **kwargs)
+
+
+class NewportESP301Program(object):
+
+    """
+    Builds a sequence of moves, waits and velocity changes on the host, and
+    compiles it into stored programs on an ESP-301 controller, such that the
+    whole sequence can then run on the controller without further
+    communication.
+
+    Moves are validated against the travel limits and maximum velocity of
+    each axis before being uploaded. Sequences longer than
+    ``commands_per_program`` are split across consecutive program IDs, with
+    each program executing the next one when it completes, so that running
+    the first program runs the entire sequence.
+
+    Example::
+
+        >>> import numpy as np
+        >>> controller = NewportESP301.open_serial("COM3")
+        >>> x = controller.axis[0]
+        >>> program = NewportESP301Program(controller)
+        >>> program.set_velocity(x, 2)
+        >>> program.move(x, np.linspace(0, 10, 1001))
+        >>> program_ids = program.upload(first_program_id=1)
+        >>> controller.run_program(program_ids[0])
+
+    :param NewportESP301 controller: Controller on which the program will
+        be stored.
+    :param int commands_per_program: Maximum number of commands to store in
+        each program.
+    """
+
+    def __init__(self, controller, commands_per_program=500):
+        if not isinstance(controller, NewportESP301):
+            raise TypeError("Programs must be stored on a Newport ESP-301 "
+                            "motor controller.")
+        if commands_per_program < 2:
+            raise ValueError("Programs must hold at least two commands.")
+        self._controller = controller
+        self._commands_per_program = commands_per_program
+        self._commands = []
+
+    def __len__(self):
+        return len(self._commands)
+
+    @staticmethod
+    def _magnitudes(values, units):
+        return np.atleast_1d(assume_units(values, units).rescale(
+            units).magnitude).astype(float)
+
+    def move(self, axis, positions, absolute=True, wait=True):
+        """
+        Appends one move for each of the given positions.
+
+        :param NewportESP301Axis axis: Axis to be moved.
+        :param positions: Positions to move to along this axis.
+        :type positions: `float`, array-like, or `~quantities.Quantity`
+        :param bool absolute: If `True`, positions are absolute, otherwise
+            each is relative to the end of the previous move.
+        :param bool wait: If `True`, each move waits for motion on this axis
+            to stop before the next command is executed.
+        """
+        cmd = "PA" if absolute else "PR"
+        # pylint: disable=protected-access
+        for position in self._magnitudes(positions, axis._units):
+            self._commands.append((axis.axis_id, cmd, position))
+            if wait:
+                self._commands.append((axis.axis_id, "WS", None))
+
+    def set_velocity(self, axis, velocity):
+        """
+        Appends a change of velocity for the given axis.
+
+        :param NewportESP301Axis axis: Axis whose velocity is set.
+        :param velocity: New velocity for this axis.
+        :type velocity: `float` or `~quantities.Quantity`
+        """
+        # pylint: disable=protected-access
+        velocity = self._magnitudes(velocity, axis._units / pq.s)
+        self._commands.append((axis.axis_id, "VA", velocity[0]))
+
+    def wait(self, duration):
+        """
+        Appends a pause of the given duration.
+
+        :param duration: Time to wait for.
+        :type duration: `float` or `~quantities.Quantity`
+        :units duration: As specified, or assumed to be of units seconds.
+        """
+        duration = float(assume_units(duration, pq.s).rescale(
+            pq.ms).magnitude)
+        self._commands.append((None, "WT", int(round(duration))))
+
+    def validate(self):
+        """
+        Checks every move and velocity change against the travel limits and
+        maximum velocity of each axis, reading these for all of the axes
+        involved in a single compound query.
+
+        Relative moves are checked by following them from the current
+        position of each axis.
+        """
+        axis_ids = sorted(set(
+            axis_id for axis_id, _, _ in self._commands if axis_id is not None
+        ))
+        if not axis_ids:
+            return
+        # pylint: disable=protected-access
+        with self._controller.execute_bulk_command() as responses:
+            for axis_id in axis_ids:
+                for cmd in ("SL?", "SR?", "VU?", "TP?"):
+                    self._controller._newport_cmd(cmd, target=axis_id)
+        values = np.array(responses, dtype=float).reshape(len(axis_ids), 4)
+        limits = dict(zip(axis_ids, values))
+        positions = dict(zip(axis_ids, values[:, 3]))
+
+        for idx, (axis_id, cmd, value) in enumerate(self._commands):
+            left, right, max_velocity, _ = limits.get(axis_id, (0, 0, 0, 0))
+            if cmd in ("PA", "PR"):
+                positions[axis_id] = value if cmd == "PA" else \
+                    positions[axis_id] + value
+                if not left <= positions[axis_id] <= right:
+                    raise ValueError(
+                        "Command {} moves axis {} to {}, outside of its "
+                        "travel limits [{}, {}].".format(
+                            idx, axis_id, positions[axis_id], left, right
+                        )
+                    )
+            elif cmd == "VA" and not 0 < value <= max_velocity:
+                raise ValueError(
+                    "Command {} sets axis {} velocity to {}, outside of "
+                    "(0, {}].".format(idx, axis_id, value, max_velocity)
+                )
+
+    def upload(self, first_program_id=1):
+        """
+        Validates the program, then stores it on the controller starting at
+        the given program ID.
+
+        All of the target programs are erased in a single command line, and
+        the program contents are written without waiting for responses, with
+        errors checked once the upload is complete.
+
+        :param int first_program_id: ID of the first program to store. Must
+            be in ``range(1, 101)``.
+
+        :return: IDs of the stored programs, in order. Running the first of
+            these runs the entire sequence.
+        :rtype: `list` of `int`
+        """
+        if not self._commands:
+            raise ValueError("Cannot upload an empty program.")
+        self.validate()
+
+        # Leave room in each program for the command that chains to the next.
+        per_program = self._commands_per_program - 1
+        chunks = [
+            self._commands[idx:idx + per_program]
+            for idx in range(0, len(self._commands), per_program)
+        ]
+        program_ids = list(range(
+            first_program_id, first_program_id + len(chunks)
+        ))
+        if first_program_id < 1 or program_ids[-1] > 100:
+            raise ValueError("Program IDs must be integers from 1 to 100 "
+                             "(inclusive), but this program requires IDs "
+                             "{} to {}.".format(program_ids[0],
+                                                program_ids[-1]))
+
+        # pylint: disable=protected-access
+        controller = self._controller
+        with controller.execute_bulk_command():
+            for program_id in program_ids:
+                controller._newport_cmd("XX", target=program_id)
+
+        for idx, (program_id, chunk) in enumerate(zip(program_ids, chunks)):
+            raw_cmds = [
+                "{target}{cmd}{param}".format(
+                    target=axis_id if axis_id is not None else "",
+                    cmd=cmd,
+                    param=value if value is not None else ""
+                )
+                for axis_id, cmd, value in chunk
+            ]
+            if idx < len(chunks) - 1:
+                raw_cmds.append("{}EX".format(program_ids[idx + 1]))
+
+            # Error checking is unsupported in programming mode.
+            controller._newport_cmd("EP", target=program_id, errcheck=False)
+            for line in controller._join_commands(raw_cmds):
+                controller.sendcmd(";".join(line))
+            controller._newport_cmd("QP", errcheck=False)
+
+        controller._check_error()
+        return program_ids
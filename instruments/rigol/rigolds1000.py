@@ -11,6 +11,7 @@ from __future__ import division
 from builtins import range
 
 from enum import Enum
+import numpy as np
 
 from instruments.abstract_instruments import (
     Oscilloscope, OscilloscopeChannel, OscilloscopeDataSource
@@ -31,6 +32,19 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
         functional!
     """
 
+    # Commands used while transferring waveforms, which do not change the
+    # waveform preamble.
+    _TRANSFER_CMDS = (":WAV:DATA?",)
+
+    #: Number of bytes requested from the connection at a time while
+    #: transferring waveforms, which can be up to a million points long in
+    #: long-memory mode.
+    WAVEFORM_CHUNK_SIZE = 4096
+
+    def __init__(self, filelike):
+        super(RigolDS1000Series, self).__init__(filelike)
+        self._preamble_cache = {}
+
     # ENUMS #
 
     class AcquisitionType(Enum):
@@ -49,6 +63,21 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
         dc = "DC"
         ground = "GND"
 
+    class MemoryDepth(Enum):
+        """
+        Enum containing valid acquisition memory depths for the Rigol DS1000
+        """
+        normal = "NORMAL"
+        long = "LONG"
+
+    class PointsMode(Enum):
+        """
+        Enum containing valid waveform points modes for the Rigol DS1000
+        """
+        normal = "NORMAL"
+        maximum = "MAXIMUM"
+        raw = "RAW"
+
     # INNER CLASSES #
 
     class DataSource(OscilloscopeDataSource):
@@ -65,14 +94,81 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
             return self._name
 
         def read_waveform(self, bin_format=True):
+            """
+            Reads the waveform of this data source, and scales it into
+            volts and seconds.
+
+            In the normal points mode, the 600 points displayed on the
+            screen are transferred. In the maximum and raw points modes,
+            set by `RigolDS1000Series.waveform_points_mode`, the whole
+            acquisition memory is transferred, which can be up to a million
+            points with a long `RigolDS1000Series.acquire_memory_depth`. Raw
+            mode requires the oscilloscope to be stopped.
+
+            :param bool bin_format: Ignored; waveforms are always
+                transferred in binary.
+            :return: The waveform with both x and y components.
+            :rtype: two item `tuple` of `numpy.ndarray`
+            """
             # TODO: add DIG, FFT.
-            if self.name not in ["CHAN1", "CHAN2", "DIG", "MATH", "FFT"]:
+            if self.name not in ["CHAN1", "CHAN2", "MATH"]:
                 raise NotImplementedError("Rigol DS1000 series does not "
-                                          "supportreading waveforms from "
+                                          "support reading waveforms from "
                                           "{}.".format(self.name))
+            # pylint: disable=protected-access
+            preamble = self._read_preamble()
             self._parent.sendcmd(":WAV:DATA? {}".format(self.name))
-            data = self._parent.binblockread(2)  # TODO: check width
-            return data
+            # Samples are one unsigned byte each.
+            raw = self._parent.binblockread(
+                1, fmt="u1", chunk_size=self._parent.WAVEFORM_CHUNK_SIZE
+            )
+            self._parent._read_terminator()
+            return self._scale_waveform((raw, preamble))
+
+        def _scale_waveform(self, raw):
+            raw, (vscale, voffset, tscale, toffset, srate, mode) = raw
+            # The screen is 10 divisions high, with 25 codes per division
+            # and code 240 at the bottom of the screen.
+            y = (240 - raw.astype(float)) * (vscale / 25) - \
+                (voffset + vscale * 4.6)
+
+            # The screen is 12 divisions wide and centred on the trigger.
+            if mode == RigolDS1000Series.PointsMode.normal:
+                xincr = 12 * tscale / len(raw)
+            else:
+                xincr = 1 / srate
+            x = (np.arange(len(raw)) - len(raw) / 2) * xincr + toffset
+
+            return x, y
+
+        def _read_preamble(self):
+            """
+            Reads the parameters used to scale the waveform of this data
+            source. The parameters are cached by the oscilloscope until a
+            command that could change them is sent.
+
+            :return: The vertical scale and offset, timebase scale and
+                offset, sample rate, and points mode.
+            :rtype: `tuple`
+            """
+            # pylint: disable=protected-access
+            cache = self._parent._preamble_cache
+            if self.name not in cache:
+                parent = self._parent
+                mode = parent.waveform_points_mode
+                # The sample rate can only be queried for the input
+                # channels. The math waveform is computed from the samples
+                # of both input channels, so shares the rate of CHAN1.
+                srate_source = "CHAN1" if self.name == "MATH" else self.name
+                cache[self.name] = (
+                    float(parent.query(":{}:SCAL?".format(self.name))),
+                    float(parent.query(":{}:OFFS?".format(self.name))),
+                    float(parent.query(":TIM:SCAL?")),
+                    float(parent.query(":TIM:OFFS?")),
+                    float(parent.query(":ACQ:SAMP? {}".format(srate_source))),
+                    mode
+                )
+            return cache[self.name]
 
     class Channel(DataSource, OscilloscopeChannel):
         """
@@ -144,6 +240,27 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
         return self.DataSource(parent=self, name="REF")
 
     acquire_type = enum_property(":ACQ:TYPE", AcquisitionType)
+
+    acquire_memory_depth = enum_property(
+        ":ACQ:MEMD",
+        MemoryDepth,
+        doc="""
+        Gets/sets the acquisition memory depth. Long memory acquires up to a
+        million points per channel.
+
+        :type: `RigolDS1000Series.MemoryDepth`
+        """
+    )
+
+    waveform_points_mode = enum_property(
+        ":WAV:POIN:MODE",
+        PointsMode,
+        doc="""
+        Gets/sets which points are transferred when reading waveforms.
+
+        :type: `RigolDS1000Series.PointsMode`
+        """
+    )
     # TODO: implement :ACQ:MODE. This is confusing in the documentation,
     # though.
 
@@ -168,10 +285,30 @@ class RigolDS1000Series(SCPIInstrument, Oscilloscope):
 
     # TODO: implement :ACQ:SAMP in a meaningful way. This should probably be
     #       under Channel, and needs to be unitful.
-    # TODO: I don't understand :ACQ:MEMD yet.
 
     # METHODS ##
 
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the oscilloscope. Any command other than those
+        used to transfer waveforms clears the cached waveform preambles, as
+        it may have changed the acquisition settings.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        if not cmd.startswith(self._TRANSFER_CMDS):
+            self._preamble_cache.clear()
+        super(RigolDS1000Series, self).sendcmd(cmd)
+
+    def clear_preamble_cache(self):
+        """
+        Clears the cached waveform preambles, such that the scaling
+        parameters are read again on the next waveform transfer. This should
+        be called if the acquisition settings have been changed from the
+        front panel.
+        """
+        self._preamble_cache.clear()
+
     def force_trigger(self):
         self.sendcmd(":FORC")
 
@@ -7,6 +7,6 @@ Module containing Lakeshore instruments
 from __future__ import absolute_import
 
 from .srs345 import SRS345
-from .srs830 import SRS830
+from .srs830 import SRS830, SRS830FastStream
 from .srsdg645 import SRSDG645
 from .srsctc100 import SRSCTC100
@@ -26,7 +26,8 @@ from instruments.abstract_instruments.comm import (
     LoopbackCommunicator
 )
 from instruments.util_fns import (
-    bool_property, bounded_unitful_property, enum_property, unitful_property
+    bool_property, bounded_unitful_property, enum_property, unitful_property,
+    RingBufferStream
 )
 
 # CONSTANTS ###################################################################
@@ -100,6 +101,18 @@ class SRS830(SCPIInstrument):
         one_shot = 0
         loop = 1
 
+    class BufferFormat(Enum):
+        """
+        Enum for the formats in which the SRS830 data buffer can be
+        transferred.
+        """
+        #: Comma separated ASCII values, using ``TRCA?``.
+        ascii = "TRCA"
+        #: 4-byte little-endian IEEE floats, using ``TRCB?``.
+        ieee = "TRCB"
+        #: 4-byte non-normalized floats, using ``TRCL?``.
+        compact = "TRCL"
+
     class Mode(Enum):
         """
         Enum containing valid modes for the SRS 830
@@ -341,7 +354,8 @@ class SRS830(SCPIInstrument):
         self.data_transfer = True
         self.start_scan()
 
-    def take_measurement(self, sample_rate, num_samples):
+    def take_measurement(self, sample_rate, num_samples,
+                         data_format=BufferFormat.ieee):
         """
         Wrapper function that allows you to easily take measurements with a
         specified sample rate and number of desired samples.
@@ -357,7 +371,11 @@ class SRS830(SCPIInstrument):
 
         :param `int` num_samples: Number of samples to take.
 
-        :rtype: `list`
+        :param data_format: Format in which the data buffers are transferred.
+            See `~SRS830.read_data_buffer` for more information.
+        :type data_format: `SRS830.BufferFormat` or `str`
+
+        :rtype: `numpy.ndarray`
         """
         if num_samples > 16383:
             raise ValueError('Number of samples cannot exceed 16383.')
@@ -381,11 +399,129 @@ class SRS830(SCPIInstrument):
         except IOError:  # pragma: no cover
             pass
 
-        ch1 = self.read_data_buffer('ch1')
-        ch2 = self.read_data_buffer('ch2')
+        ch1 = self.read_data_buffer('ch1', data_format)
+        ch2 = self.read_data_buffer('ch2', data_format)
 
         return np.array([ch1, ch2])
 
+    def stream_measurement(self, sample_rate, num_samples,
+                           data_format=BufferFormat.ieee, poll_interval=0.1,
+                           timeout=10):
+        """
+        Takes measurements as with `~SRS830.take_measurement`, but reads the
+        data buffers while the scan is running, yielding each block of new
+        samples as soon as it is available. This allows analysis to overlap
+        acquisition, rather than waiting for the whole scan to finish.
+
+        Each block is an array of shape ``(2, n)``, containing the new
+        samples of channels 1 and 2. The whole scan can be assembled using
+        `numpy.hstack`:
+
+        >>> srs = ik.srs.SRS830.open_gpibusb('/dev/ttyUSB0', 1)
+        >>> data = np.hstack(list(srs.stream_measurement(64, 10000)))
+
+        :param `int` sample_rate: Set the desired sample rate of the
+            measurement. See `~SRS830.sample_rate` for more information.
+
+        :param `int` num_samples: Number of samples to take.
+
+        :param data_format: Format in which the data buffers are transferred.
+            See `~SRS830.read_data_buffer` for more information.
+        :type data_format: `SRS830.BufferFormat` or `str`
+
+        :param float poll_interval: Time in seconds to wait before checking
+            the number of stored points again, when no new points are
+            available.
+
+        :param float timeout: Time in seconds to wait for new points to be
+            stored before raising `IOError`.
+
+        :return: Generator of the blocks of new samples.
+        :rtype: `numpy.ndarray`
+        """
+        if num_samples > 16383:
+            raise ValueError('Number of samples cannot exceed 16383.')
+
+        self.init(sample_rate, SRS830.BufferMode['one_shot'])
+        # Data points must not be streamed over the interface while the
+        # buffers are being queried.
+        self.data_transfer = False
+        self.start_scan()
+
+        try:
+            offset = 0
+            deadline = time.time() + timeout
+            while offset < num_samples:
+                count = min(self.num_data_points, num_samples) - offset
+                if count <= 0:
+                    if time.time() > deadline:
+                        raise IOError("Timed out waiting for new points: "
+                                      "{} of {} points were read.".format(
+                                          offset, num_samples))
+                    if not self._testing:
+                        time.sleep(poll_interval)
+                    continue
+                deadline = time.time() + timeout
+                ch1 = self._read_buffer_points(1, offset, count, data_format)
+                ch2 = self._read_buffer_points(2, offset, count, data_format)
+                offset += count
+                yield np.array([ch1, ch2])
+        finally:
+            self.pause()
+
+    def stream_fast(self, sample_width=2, full_scale=None, buffer_size=100000,
+                    chunk_size=4096, num_samples=None, timeout=10):
+        """
+        Enables fast data transfer mode (``FAST 2``) and starts a scan, then
+        reads the resulting real-time stream of samples on a background
+        thread.
+
+        Fast data transfer is only available over GPIB, and is not supported
+        through the Galvant Industries GPIB-USB adapter, which only forwards
+        a response after it is told to read one. A `TypeError` is raised for
+        that adapter and for serial connections.
+
+        In fast mode, each sample of the two displays is sent as it is
+        taken, either as a 2-byte integer when the displays are set to X
+        and Y, or otherwise as a 4-byte value in the non-normalized format
+        of ``TRCL?``. No other commands should be sent to the lock-in until
+        the stream has been stopped.
+
+        Example usage:
+
+        >>> srs = ik.srs.SRS830.open_gpibusb('/dev/ttyUSB0', 1)
+        >>> srs.sample_rate = 512 * pq.Hz
+        >>> with srs.stream_fast(full_scale=1 * pq.mV) as stream:
+        ...     for block in stream:
+        ...         print(block[0].mean(), block[1].mean())
+
+        :param int sample_width: Number of bytes per sample, 2 or 4.
+        :param full_scale: Sensitivity of the lock-in. 2-byte samples are
+            sent as multiples of 1/30000 of full scale, and are returned as
+            fractions of full scale unless this is given.
+        :type full_scale: `~quantities.Quantity` or `float`
+        :param int buffer_size: Number of sample pairs held by the ring
+            buffer.
+        :param int chunk_size: Number of bytes to request from the
+            connection at a time.
+        :param int num_samples: Number of sample pairs to read before
+            stopping, or `None` to read until `SRS830FastStream.stop` is
+            called.
+        :param float timeout: Time in seconds without receiving any data
+            after which the stream gives up, raising `IOError`.
+
+        :rtype: `SRS830FastStream`
+        """
+        if isinstance(self._file, (GPIBCommunicator, SerialCommunicator)):
+            raise TypeError("Fast data transfer requires a GPIB interface "
+                            "which can read continuously, such as VISA.")
+        stream = SRS830FastStream(
+            self, sample_width, full_scale, buffer_size, chunk_size,
+            num_samples, timeout
+        )
+        stream.start()
+        return stream
+
     # OTHER METHODS #
 
     def set_offset_expand(self, mode, offset, expand):
@@ -493,19 +629,25 @@ class SRS830(SCPIInstrument):
 
     _valid_read_data_buffer = {Mode.ch1: 1, Mode.ch2: 2}
 
-    def read_data_buffer(self, channel):
+    def read_data_buffer(self, channel, data_format=BufferFormat.ascii):
         """
         Reads the entire data buffer for a specific channel.
-        Transfer is done in ASCII mode. Although binary would be faster,
-        this is not currently implemented.
 
-        Returns a list of floats containing instrument's measurements.
+        The buffer can be transferred as ASCII, or in one of two binary
+        formats, which are decoded directly into a `numpy.ndarray`. Binary
+        transfers are several times faster than ASCII for large buffers.
+        The ``compact`` format is the fastest for the instrument to send,
+        but has slightly lower precision than ``ieee``.
 
         :param channel: Channel data buffer to read from. Valid channels are
             given by {CH1|CH2}.
         :type channel: `SRS830.Mode` or `str`
 
-        :rtype: `list`
+        :param data_format: Format in which to transfer the buffer. Valid
+            formats are given by {ASCII|IEEE|COMPACT}.
+        :type data_format: `SRS830.BufferFormat` or `str`
+
+        :rtype: `numpy.ndarray`
         """
         if isinstance(channel, str):
             channel = channel.lower()
@@ -518,13 +660,54 @@ class SRS830(SCPIInstrument):
 
         N = self.num_data_points  # Retrieve number of data points stored
 
-        # Query device for entire buffer, returning in ASCII, then
-        # converting to a list of floats before returning to the
-        # calling method
-        return np.fromstring(
-            self.query('TRCA?{},0,{}'.format(channel, N)).strip(),
-            sep=','
-        )
+        return self._read_buffer_points(channel, 0, N, data_format)
+
+    def _read_buffer_points(self, channel, offset, count, data_format):
+        """
+        Reads ``count`` points from the data buffer of a channel, starting at
+        point ``offset``.
+
+        :param int channel: Channel number, 1 or 2.
+        :param int offset: Index of the first point to read.
+        :param int count: Number of points to read.
+        :param data_format: Format in which to transfer the points.
+        :type data_format: `SRS830.BufferFormat` or `str`
+
+        :rtype: `numpy.ndarray`
+        """
+        if isinstance(data_format, str):
+            data_format = data_format.lower()
+            data_format = SRS830.BufferFormat[data_format]
+
+        cmd = '{}?{},{},{}'.format(data_format.value, channel, offset, count)
+        if data_format == SRS830.BufferFormat.ascii:
+            return np.fromstring(self.query(cmd).strip(), sep=',')
+
+        if count == 0:
+            return np.empty(0)
+
+        # Binary transfers have no header or terminator; each point is sent
+        # as 4 bytes, in little-endian order.
+        self.sendcmd(cmd)
+        data = self._read_bytes(4 * count)
+        if data_format == SRS830.BufferFormat.ieee:
+            return np.frombuffer(data, dtype='<f4').astype(np.float64)
+
+        return self._decode_compact(data)
+
+    @staticmethod
+    def _decode_compact(data):
+        """
+        Decodes values in the non-normalized format used by ``TRCL?`` and by
+        fast data transfers. Each value is a 16-bit little-endian mantissa
+        followed by a 16-bit exponent, and is equal to
+        ``mantissa * 2**(exponent - 124)``.
+
+        :param bytes data: Encoded values, 4 bytes each.
+        :rtype: `numpy.ndarray`
+        """
+        raw = np.frombuffer(data, dtype='<i2').reshape(-1, 2)
+        return np.ldexp(raw[:, 0].astype(np.float64), raw[:, 1] - 124)
 
     def clear_data_buffer(self):
         """
@@ -596,3 +779,145 @@ class SRS830(SCPIInstrument):
         ratio = self._valid_channel_ratio[channel - 1][ratio]
 
         self.sendcmd('DDEF {},{},{}'.format(channel, display, ratio))
+
+
+class SRS830FastStream(RingBufferStream):
+
+    """
+    Real-time stream of samples from an `SRS830` in fast data transfer mode,
+    started by `SRS830.stream_fast`.
+
+    Samples are read and decoded on a background thread into a
+    `~instruments.util_fns.RingBuffer`. Iterating over the stream yields
+    each new block of samples as an array of shape ``(2, n)``, containing
+    the samples of displays 1 and 2, until the stream is stopped and all
+    samples have been yielded. Alternatively, `latest` returns the most
+    recent samples at any time.
+
+    The stream can be used as a context manager, in which case it is
+    stopped on exit.
+    """
+
+    _SAMPLE_DTYPE = np.dtype([('ch1', np.float64), ('ch2', np.float64)])
+
+    def __init__(self, parent, sample_width=2, full_scale=None,
+                 buffer_size=100000, chunk_size=4096, num_samples=None,
+                 timeout=10):
+        if sample_width not in (2, 4):
+            raise ValueError("Sample width must be 2 or 4 bytes, got "
+                             "{}.".format(sample_width))
+        super(SRS830FastStream, self).__init__(
+            buffer_size, dtype=self._SAMPLE_DTYPE
+        )
+        self._parent = parent
+        self._sample_width = sample_width
+        self._scale = 1 if full_scale is None else full_scale
+        # Each read is a whole number of sample pairs.
+        pair_size = 2 * sample_width
+        self._chunk_size = max(pair_size, chunk_size // pair_size * pair_size)
+        self._num_samples = num_samples
+        self._timeout = timeout
+        self._bytes_received = 0
+        self._start_time = None
+        self._stop_time = None
+
+    # PROPERTIES #
+
+    @property
+    def bytes_received(self):
+        """
+        Gets the total number of bytes read from the lock-in.
+
+        :type: `int`
+        """
+        return self._bytes_received
+
+    @property
+    def samples_received(self):
+        """
+        Gets the total number of sample pairs read from the lock-in.
+
+        :type: `int`
+        """
+        return self._buffer.total_written
+
+    @property
+    def elapsed(self):
+        """
+        Gets the time, in seconds, since the stream was started, or the
+        total duration of the stream once it has stopped.
+
+        :type: `float`
+        """
+        if self._start_time is None:
+            return 0.0
+        stop_time = self._stop_time
+        if stop_time is None:
+            stop_time = time.time()
+        return stop_time - self._start_time
+
+    @property
+    def samples_per_second(self):
+        """
+        Gets the average number of sample pairs read per second.
+
+        :type: `float`
+        """
+        elapsed = self.elapsed
+        return self.samples_received / elapsed if elapsed > 0 else 0.0
+
+    # METHODS #
+
+    def _on_start(self):
+        self._parent.start_data_transfer()
+        self._start_time = time.time()
+        self._stop_time = None
+
+    def _on_stop(self):
+        # Pauses the scan and disables fast data transfer mode.
+        self._stop_time = time.time()
+        self._parent.pause()
+        self._parent.data_transfer = False
+        # Discard any samples sent before fast mode was disabled.
+        self._parent._file.flush_input()  # pylint: disable=protected-access
+
+    def _convert(self, data):
+        return np.array([data['ch1'], data['ch2']]) * self._scale
+
+    def _decode(self, data):
+        if self._sample_width == 2:
+            values = np.frombuffer(data, dtype='<i2') / 30000
+        else:
+            values = SRS830._decode_compact(data)
+        samples = np.empty(len(values) // 2, dtype=self._SAMPLE_DTYPE)
+        samples['ch1'] = values[0::2]
+        samples['ch2'] = values[1::2]
+        return samples
+
+    def _transfer(self):
+        # pylint: disable=protected-access
+        pair_size = 2 * self._sample_width
+        leftover = bytes()
+        remaining = None
+        if self._num_samples is not None:
+            remaining = self._num_samples * pair_size
+        deadline = time.time() + self._timeout
+        while not self._stop.is_set() and \
+                (remaining is None or remaining > 0):
+            size = self._chunk_size
+            if remaining is not None:
+                size = min(size, remaining)
+            data = self._parent._file.read_raw(size)
+            if not data:
+                if time.time() > deadline:
+                    raise IOError("No data received from the SRS830 for "
+                                  "{} seconds.".format(self._timeout))
+                continue
+            deadline = time.time() + self._timeout
+            self._bytes_received += len(data)
+            if remaining is not None:
+                remaining -= len(data)
+            data = leftover + data
+            n_bytes = len(data) // pair_size * pair_size
+            leftover = data[n_bytes:]
+            self._buffer.extend(self._decode(data[:n_bytes]))
@@ -10,6 +10,8 @@ from __future__ import absolute_import
 from __future__ import division
 from builtins import range
 
+import hashlib
+
 from enum import Enum
 
 import numpy as np
@@ -28,6 +30,14 @@ class TekAWG2000(SCPIInstrument):
     commands documented in the user's guide.
     """
 
+    def __init__(self, filelike):
+        super(TekAWG2000, self).__init__(filelike)
+        self._waveform_name = None
+        # The WFMP parameters are shared by all destinations, while the
+        # waveform data is remembered for each destination name.
+        self._waveform_params = None
+        self._upload_cache = {}
+
     # INNER CLASSES #
 
     class Channel(object):
@@ -190,13 +200,16 @@ class TekAWG2000(SCPIInstrument):
 
         :type: `str`
         """
-        return self.query("DATA:DEST?").strip()
+        name = self.query("DATA:DEST?").strip()
+        self._waveform_name = name.strip('"')
+        return name
 
     @waveform_name.setter
     def waveform_name(self, newval):
         if not isinstance(newval, str):
             raise TypeError("Waveform name must be specified as a string.")
         self.sendcmd('DATA:DEST "{}"'.format(newval))
+        self._waveform_name = newval
 
     @property
     def channel(self):
@@ -217,10 +230,19 @@ class TekAWG2000(SCPIInstrument):
 
     # METHODS #
 
-    def upload_waveform(self, yzero, ymult, xincr, waveform):
+    def upload_waveform(self, yzero, ymult, xincr, waveform, force=False,
+                        chunk_size=4096, progress=None):
         """
         Uploads a waveform from the PC to the instrument.
 
+        The waveform and its parameters are remembered for each destination
+        waveform name (see `TekAWG2000.waveform_name`), so uploading an
+        identical waveform with identical parameters to the same destination
+        again does nothing. The ``WFMP`` parameters are shared by all
+        destinations, and are only sent when they change; the waveform data
+        is sent again whenever its parameters or data differ from those last
+        uploaded to the destination.
+
         :param yzero: Y-axis origin offset
         :type yzero: `float` or `int`
 
@@ -233,7 +255,22 @@ class TekAWG2000(SCPIInstrument):
         :param `numpy.ndarray` waveform: Numpy array of values representing the
             waveform to be uploaded. This array should be normalized. This means
             that all absolute values contained within the array should not
-            exceed 1.
+            exceed 1. The array is not modified.
+
+        :param bool force: If `True`, the waveform and its parameters are
+            uploaded even if they are unchanged.
+
+        :param int chunk_size: Number of bytes of the ``CURVE`` command to
+            write at a time.
+
+        :param progress: Function called after each chunk is written with the
+            number of bytes of the ``CURVE`` command, including its header,
+            written so far and in total.
+        :type progress: `callable`
+
+        :return: `True` if the waveform data was uploaded, or `False` if it
+            was unchanged.
+        :rtype: `bool`
         """
         if not isinstance(yzero, float) and not isinstance(yzero, int):
             raise TypeError("yzero must be specified as a float or int")
@@ -247,18 +284,47 @@ class TekAWG2000(SCPIInstrument):
         if not isinstance(waveform, np.ndarray):
             raise TypeError("waveform must be specified as a numpy array")
 
-        self.sendcmd("WFMP:YZERO {}".format(yzero))
-        self.sendcmd("WFMP:YMULT {}".format(ymult))
-        self.sendcmd("WFMP:XINCR {}".format(xincr))
-
         if np.max(np.abs(waveform)) > 1:
             raise ValueError("The max value for an element in waveform is 1.")
 
-        waveform *= (2**12 - 1)
-        waveform = waveform.astype("<u2").tostring()
-        wfm_header_2 = str(len(waveform))
+        if self._waveform_name is None:
+            _ = self.waveform_name
+
+        data = (waveform * (2**12 - 1)).astype("<u2").tobytes()
+        params = (yzero, ymult, xincr)
+        digest = hashlib.sha1(data).hexdigest()
+        if force:
+            self._waveform_params = None
+            self._upload_cache.pop(self._waveform_name, None)
+
+        if params != self._waveform_params:
+            self.sendcmd("WFMP:YZERO {}".format(yzero))
+            self.sendcmd("WFMP:YMULT {}".format(ymult))
+            self.sendcmd("WFMP:XINCR {}".format(xincr))
+            self._waveform_params = params
+
+        if (params, digest) == self._upload_cache.get(self._waveform_name):
+            return False
+
+        wfm_header_2 = str(len(data))
         wfm_header_1 = len(wfm_header_2)
+        header = "CURVE #{}{}".format(wfm_header_1, wfm_header_2)
+        self._file.sendcmd_raw(
+            header.encode("utf-8") + data + self._terminator_bytes(),
+            chunk_size=chunk_size,
+            progress=progress
+        )
 
-        bin_str = "#{}{}{}".format(wfm_header_1, wfm_header_2, waveform)
+        self._upload_cache[self._waveform_name] = (params, digest)
+        return True
 
-        self.sendcmd("CURVE {}".format(bin_str))
+    def clear_upload_cache(self):
+        """
+        Forgets which waveforms and parameters have been uploaded, such that
+        the next call to `upload_waveform` uploads them even if they are
+        unchanged.
+        This should be called if waveforms have been changed from the front
+        panel.
+        """
+        self._waveform_params = None
+        self._upload_cache.clear()
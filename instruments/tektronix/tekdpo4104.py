@@ -9,6 +9,7 @@ Provides support for the Tektronix DPO 4104 oscilloscope
 from __future__ import absolute_import
 from __future__ import division
 
+from contextlib import contextmanager
 from time import sleep
 from builtins import range, map
 
@@ -102,45 +103,54 @@ class _TekDPO4104DataSource(OscilloscopeDataSource):
         """
 
         # Set the acquisition channel
-        with self:
-
-            # TODO: move this out somewhere more appropriate.
-            old_dat_stop = self._tek.query("DAT:STOP?")
-            self._tek.sendcmd("DAT:STOP {}".format(10**7))
-
-            if not bin_format:
-                # Set data encoding format to ASCII
-                self._tek.sendcmd("DAT:ENC ASCI")
-                sleep(0.02)  # Work around issue with 2.48 firmware.
-                raw = self._tek.query("CURVE?")
-                raw = raw.split(",")  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
-            else:
-                # Set encoding to signed, big-endian
-                self._tek.sendcmd("DAT:ENC RIB")
-                sleep(0.02)  # Work around issue with 2.48 firmware.
-                data_width = self._tek.data_width
-                self._tek.sendcmd("CURVE?")
-                # Read in the binary block, data width of 2 bytes.
-                raw = self._tek.binblockread(data_width)
+        # pylint: disable=protected-access
+        with self, self._tek._whole_record():
+            return self._read_selected_waveform(bin_format)
 
-            yoffs = self._tek.y_offset  # Retrieve Y offset
-            ymult = self._tek.query("WFMP:YMU?")  # Retrieve Y multiplier
-            yzero = self._tek.query("WFMP:YZE?")  # Retrieve Y zero
+    def _read_selected_waveform(self, bin_format=True):
+        """
+        Reads the waveform of this data source, assuming that it has already
+        been selected as the oscilloscope's data source, and that ``DAT:STOP``
+        has been set to transfer the whole record.
+        """
+        if not bin_format:
+            # Set data encoding format to ASCII
+            self._tek.sendcmd("DAT:ENC ASCI")
+            sleep(0.02)  # Work around issue with 2.48 firmware.
+            self._tek.sendcmd("CURVE?")
+            raw = self._tek.read_ascii_values(chunk_size=4096)
+        else:
+            # Set encoding to signed, big-endian
+            self._tek.sendcmd("DAT:ENC RIB")
+            sleep(0.02)  # Work around issue with 2.48 firmware.
+            data_width = self._tek.data_width
+            self._tek.sendcmd("CURVE?")
+            # Read in the binary block, data width of 2 bytes.
+            raw = self._tek.binblockread(data_width)
 
-            y = ((raw - yoffs) * float(ymult)) + float(yzero)
+        yoffs, ymult, yzero, xzero, xincr, ptcnt = self._read_preamble()
 
-            xzero = self._tek.query("WFMP:XZE?")  # Retrieve X zero
-            xincr = self._tek.query("WFMP:XIN?")  # Retrieve X incr
-            # Retrieve number of data points
-            ptcnt = self._tek.query("WFMP:NR_P?")
+        y = ((raw - yoffs) * ymult) + yzero
+        x = np.arange(ptcnt) * xincr + xzero
 
-            x = np.arange(float(ptcnt)) * float(xincr) + float(xzero)
+        return x, y
 
-            self._tek.sendcmd("DAT:STOP {}".format(old_dat_stop))
+    def _read_preamble(self):
+        """
+        Reads the waveform scaling parameters for this data source in a
+        single compound ``WFMP`` query. The parameters are cached by the
+        oscilloscope until a command that could change them is sent.
 
-            return x, y
+        :return: The Y offset, Y multiplier, Y zero, X zero, X increment
+            and number of points.
+        :rtype: `tuple` of `float`
+        """
+        # pylint: disable=protected-access
+        cache = self._tek._preamble_cache
+        if self.name not in cache:
+            resp = self._tek.query("WFMP:YOF?;YMU?;YZE?;XZE?;XIN?;NR_P?")
+            cache[self.name] = tuple(map(float, resp.split(";")))
+        return cache[self.name]
 
     y_offset = _parent_property("y_offset")
 
@@ -196,6 +206,19 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
     >>> [x, y] = tek.channel[0].read_waveform()
     """
 
+    # Commands used while transferring waveforms, which do not change the
+    # waveform preamble.
+    _TRANSFER_CMDS = ("DAT:SOU", "DAT:ENC", "DAT:STOP", "CURVE?")
+
+    # Stop point which makes sure that the whole record is transferred.
+    _WHOLE_RECORD_STOP = 10**7
+
+    def __init__(self, filelike):
+        super(TekDPO4104, self).__init__(filelike)
+        self._preamble_cache = {}
+        self._data_source_name = None
+        self._data_stop = None
+
     # ENUMS #
 
     class Coupling(Enum):
@@ -257,8 +280,14 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
     def data_source(self):
         """
         Gets/sets the the data source for waveform transfer.
+
+        The selected data source is tracked by this object, so that it is
+        only queried from the oscilloscope once, and selecting the data
+        source which is already selected does not send any commands.
         """
-        name = self.query("DAT:SOU?")
+        if self._data_source_name is None:
+            self._data_source_name = self.query("DAT:SOU?")
+        name = self._data_source_name
         if name.startswith("CH"):
             return _TekDPO4104Channel(self, int(name[2:]) - 1)
 
@@ -272,7 +301,10 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
                 newval = newval.value
             elif hasattr(newval, "name"):  # Is a datasource with a name.
                 newval = newval.name
+        if newval == self._data_source_name:
+            return
         self.sendcmd("DAT:SOU {}".format(newval))
+        self._data_source_name = newval
         sleep(0.01)  # Let the instrument catch up.
 
     @property
@@ -351,6 +383,90 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
 
     # METHODS #
 
+    def read_waveforms(self, sources, bin_format=True):
+        """
+        Gets the waveforms of several data sources, which share a single
+        time axis.
+
+        The DPO4104 transfers one data source at a time, so each source is
+        selected and read in turn. The original data source is restored only
+        once, after all of the waveforms have been read, and only if
+        `~instruments.abstract_instruments.Oscilloscope.restore_data_source`
+        is set.
+
+        :param sources: The data sources to read waveforms from.
+        :type sources: `list` of `_TekDPO4104DataSource`
+        :param bool bin_format: If `True`, data is transfered
+            in a binary format. Otherwise, data is transferred in ASCII.
+
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        old_dsrc = self.data_source
+        x = None
+        ys = []
+        try:
+            with self._whole_record():
+                for source in sources:
+                    self.data_source = source
+                    # pylint: disable=protected-access
+                    x, y = source._read_selected_waveform(bin_format)
+                    ys.append(y)
+        finally:
+            if self.restore_data_source:
+                self.data_source = old_dsrc
+        return x, np.vstack(ys)
+
+    @contextmanager
+    def _whole_record(self):
+        """
+        Context manager which sets ``DAT:STOP`` such that the whole record is
+        transferred, and restores the previous stop point on exit.
+
+        The stop point is tracked by this object, in the same way as
+        `~TekDPO4104.data_source`, so that it is only queried from the
+        oscilloscope once, and is not sent when it is already large enough.
+        """
+        if self._data_stop is None:
+            self._data_stop = int(self.query("DAT:STOP?"))
+        old_stop = self._data_stop
+        if old_stop < self._WHOLE_RECORD_STOP:
+            self._set_data_stop(self._WHOLE_RECORD_STOP)
+        try:
+            yield
+        finally:
+            if self._data_stop != old_stop:
+                self._set_data_stop(old_stop)
+
+    def _set_data_stop(self, stop):
+        """
+        Sets the ``DAT:STOP`` point of waveform transfers, and tracks it.
+
+        :param int stop: Index of the last point to transfer.
+        """
+        self.sendcmd("DAT:STOP {}".format(stop))
+        self._data_stop = stop
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the oscilloscope. Any command other than those
+        used to transfer waveforms clears the cached waveform preambles, as
+        it may have changed the acquisition settings.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        if not cmd.startswith(self._TRANSFER_CMDS):
+            self._preamble_cache.clear()
+        super(TekDPO4104, self).sendcmd(cmd)
+
+    def clear_preamble_cache(self):
+        """
+        Clears the cached waveform preambles, such that the scaling
+        parameters are read again on the next waveform transfer. This should
+        be called if the acquisition settings have been changed from the
+        front panel.
+        """
+        self._preamble_cache.clear()
+
     def force_trigger(self):
         """
         Forces a trigger event to occur on the attached oscilloscope.
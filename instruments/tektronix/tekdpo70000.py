@@ -10,11 +10,13 @@ from __future__ import absolute_import
 from __future__ import division
 
 import abc
+from datetime import datetime
 import time
 
-from builtins import range
+from builtins import range, map
 from enum import Enum
 
+import numpy as np
 import quantities as pq
 
 from instruments.abstract_instruments import (
@@ -50,6 +52,17 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
     HOR_DIVS = 10
     VERT_DIVS = 10
 
+    # Commands used while transferring waveforms, which do not change the
+    # vertical scaling of the data sources.
+    _TRANSFER_CMDS = ("DAT:SOU", "DAT:ENC", "DAT:FRAMESTAR",
+                      "DAT:FRAMESTOP", "CURV?")
+
+    def __init__(self, filelike):
+        super(TekDPO70000, self).__init__(filelike)
+        self._data_source_name = None
+        self._encoding_cache = {}
+        self._scaling_cache = {}
+
     # ENUMS #
 
     class AcquisitionMode(Enum):
@@ -160,6 +173,20 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             TekDPO70000.BinaryFormat.float: "f"
         }[binary_format], n_bytes)
 
+    @staticmethod
+    def _parse_timestamp(timestamp):
+        """
+        Parses a FastFrame time stamp, such as
+        ``"02 Mar 2000 20:10:54.542 037 272 620"``, into a `datetime`. Digits
+        beyond microseconds are discarded.
+        """
+        timestamp = timestamp.strip().strip('"')
+        date, fraction = timestamp.split(".", 1)
+        fraction = fraction.replace(" ", "")[:6].ljust(6, "0")
+        return datetime.strptime(
+            "{}.{}".format(date, fraction), "%d %b %Y %H:%M:%S.%f"
+        )
+
     # CLASSES #
 
     class DataSource(OscilloscopeDataSource):
@@ -182,41 +209,95 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             Takes the int16 data and figures out how to make it unitful.
             """
 
+        @abc.abstractmethod
+        def _read_scaling(self):
+            """
+            Queries the vertical settings used by `_scale_raw_data`.
+            """
+
+        def _scaling(self):
+            """
+            Returns the vertical settings of this data source, as read by
+            `_read_scaling`. They are cached by the oscilloscope until a
+            command other than those used to transfer waveforms is sent
+            through `TekDPO70000.sendcmd`.
+            """
+            # pylint: disable=protected-access
+            cache = self._parent._scaling_cache
+            if self.name not in cache:
+                cache[self.name] = self._read_scaling()
+            return cache[self.name]
+
         # pylint: disable=protected-access
         def read_waveform(self, bin_format=True):
             # We want to get the data back in binary, as it's just too much
             # otherwise.
             with self:
-                self._parent.select_fastest_encoding()
-                n_bytes = self._parent.outgoing_n_bytes
-                dtype = self._parent._dtype(
-                    self._parent.outgoing_binary_format,
-                    self._parent.outgoing_byte_order,
-                    n_bytes
-                )
+                n_bytes, dtype = self._parent._waveform_encoding()
                 self._parent.sendcmd("CURV?")
                 raw = self._parent.binblockread(n_bytes, fmt=dtype)
-                # Clear the queue by trying to read.
-                # FIXME: this is a hack-y way of doing so.
-                if hasattr(self._parent._file, 'flush_input'):
-                    self._parent._file.flush_input()
-                else:
-                    self._parent._file.read()
+                self._parent._read_terminator()
 
                 return self._scale_raw_data(raw)
 
-        def __enter__(self):
-            self._old_dsrc = self._parent.data_source
-            if self._old_dsrc != self:
-                # Set the new data source, and let __exit__ cleanup.
-                self._parent.data_source = self
-            else:
-                # There's nothing to do or undo in this case.
-                self._old_dsrc = None
+        def read_fastframes(self, start=1, stop=None):
+            """
+            Reads the frames of a FastFrame (segmented memory) acquisition
+            from this data source, transferring all of the frames in a
+            single binary block.
+
+            The previous frame range, given by
+            `TekDPO70000.data_framestart` and `TekDPO70000.data_framestop`,
+            is restored once the frames have been read.
+
+            :param int start: The first frame to read, counting from 1.
+            :param int stop: The last frame to read, or `None` to read up to
+                the last frame given by `TekDPO70000.horiz_fastframe_count`.
+            :return: The waveform of each frame as a row of a two
+                dimensional array, and the time of each frame's trigger
+                relative to that of the first frame read.
+            :rtype: two item `tuple` of `~quantities.Quantity`
+            """
+            if stop is None:
+                stop = self._parent.horiz_fastframe_count
+            n_frames = stop - start + 1
+            if start < 1 or n_frames < 1:
+                raise ValueError("Invalid frame range {} to {}.".format(
+                    start, stop
+                ))
 
-        def __exit__(self, type, value, traceback):
-            if self._old_dsrc is not None:
-                self._parent.data_source = self._old_dsrc
+            with self:
+                n_bytes, dtype = self._parent._waveform_encoding()
+                old_start = self._parent.data_framestart
+                old_stop = self._parent.data_framestop
+                try:
+                    self._parent.sendcmd("DAT:FRAMESTART {}".format(start))
+                    self._parent.sendcmd("DAT:FRAMESTOP {}".format(stop))
+                    self._parent.sendcmd("CURV?")
+                    raw = self._parent.binblockread(n_bytes, fmt=dtype)
+                    self._parent._read_terminator()
+
+                    timestamps = self._parent.query(
+                        "HOR:FAST:TIMES:ALL:{}? {},{}".format(
+                            self.name, start, n_frames
+                        )
+                    )
+                finally:
+                    self._parent.sendcmd(
+                        "DAT:FRAMESTART {}".format(old_start)
+                    )
+                    self._parent.sendcmd("DAT:FRAMESTOP {}".format(old_stop))
+
+            frames = self._scale_raw_data(raw.reshape(n_frames, -1))
+            timestamps = [
+                TekDPO70000._parse_timestamp(timestamp)
+                for timestamp in timestamps.split(",")
+            ]
+            times = pq.Quantity([
+                (timestamp - timestamps[0]).total_seconds()
+                for timestamp in timestamps
+            ], pq.second)
+            return frames, times
 
     class Math(DataSource):
 
@@ -486,11 +567,15 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             """
         )
 
+        def _read_scaling(self):
+            return self.scale, self.position
+
         def _scale_raw_data(self, data):
             # TODO: incorperate the unit_string somehow
-            return self.scale * (
+            scale, position = self._scaling()
+            return scale * (
                 (TekDPO70000.VERT_DIVS / 2) *
-                data.astype(float) / (2**15) - self.position
+                data.astype(float) / (2**15) - position
             )
 
     class Channel(DataSource, OscilloscopeChannel):
@@ -623,11 +708,15 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             """
         )
 
+        def _read_scaling(self):
+            return self.scale, self.position, self.offset
+
         def _scale_raw_data(self, data):
-            return self.scale * (
+            scale, position, offset = self._scaling()
+            return scale * (
                 (TekDPO70000.VERT_DIVS / 2) *
-                data.astype(float) / (2**15) - self.position
-            ) + self.offset
+                data.astype(float) / (2**15) - position
+            ) + offset
 
     # PROPERTIES ##
 
@@ -783,9 +872,15 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
         through the usual `TekDPO70000.channel`, `TekDPO70000.math`, or
         `TekDPO70000.ref` properties.
 
+        The selected data source is tracked by this object, so that it is
+        only queried from the oscilloscope once, and selecting the data
+        source which is already selected does not send any commands.
+
         :type: `TekDPO70000.Channel` or `TekDPO70000.Math`
         """
-        val = self.query('DAT:SOU?')
+        if self._data_source_name is None:
+            self._data_source_name = self.query('DAT:SOU?')
+        val = self._data_source_name
         if val[0:2] == 'CH':
             out = self.channel[int(val[2]) - 1]
         elif val[0:2] == 'MA':
@@ -801,7 +896,10 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
         if not isinstance(newval, self.DataSource):
             raise TypeError(
                 "{} is not a valid data source.".format(type(newval)))
+        if newval.name == self._data_source_name:
+            return
         self.sendcmd("DAT:SOU {}".format(newval.name))
+        self._data_source_name = newval.name
 
         # Some Tek scopes require this after the DAT:SOU command, or else
         # they will stop responding.
@@ -848,6 +946,23 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
         """
     )
 
+    horiz_fastframe_state = bool_property(
+        'HOR:FAST:STATE',
+        inst_true='1',
+        inst_false='0',
+        doc="""
+        Whether FastFrame (segmented memory) acquisition is enabled. See
+        `TekDPO70000.DataSource.read_fastframes`.
+        """
+    )
+
+    horiz_fastframe_count = int_property(
+        'HOR:FAST:COUN',
+        doc="""
+        The number of frames acquired in FastFrame mode.
+        """
+    )
+
     horiz_interp_ratio = unitless_property(
         'HOR:MAI:INTERPR',
         readonly=True,
@@ -973,6 +1088,94 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
         """
         self.sendcmd("DAT:ENC FAS")
 
+    def _waveform_encoding(self):
+        """
+        Selects the fastest encoding for the current data source, and
+        returns the number of bytes per sample and the `numpy` data type of
+        the resulting binary waveforms.
+
+        The result is cached for each data source, until an encoding setting
+        is changed through `TekDPO70000.sendcmd`.
+
+        :rtype: `tuple` of `int` and `str`
+        """
+        name = self._data_source_name
+        if name is None:
+            name = self.data_source.name
+        if name not in self._encoding_cache:
+            self.select_fastest_encoding()
+            n_bytes = self.outgoing_n_bytes
+            dtype = self._dtype(
+                self.outgoing_binary_format,
+                self.outgoing_byte_order,
+                n_bytes
+            )
+            self._encoding_cache[name] = (n_bytes, dtype)
+        return self._encoding_cache[name]
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the oscilloscope. Commands which change how
+        outgoing waveforms are encoded clear the cached waveform encodings,
+        and any command other than those used to transfer waveforms clears
+        the cached vertical scaling of the data sources, as it may have
+        changed their settings.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        if cmd.startswith(("WFMO:", "DAT:ENC")) and cmd != "DAT:ENC FAS":
+            self._encoding_cache.clear()
+        if not cmd.startswith(self._TRANSFER_CMDS):
+            self._scaling_cache.clear()
+        super(TekDPO70000, self).sendcmd(cmd)
+
+    # pylint: disable=protected-access
+    def read_waveforms(self, sources, bin_format=True):
+        """
+        Gets the waveforms of several data sources in a single binary
+        transfer, by selecting all of the sources at once with ``DAT:SOU``.
+
+        :param sources: The data sources to read waveforms from.
+        :type sources: `list` of `TekDPO70000.DataSource`
+        :param bool bin_format: Ignored; as with
+            `TekDPO70000.DataSource.read_waveform`, waveforms are always
+            transferred in binary.
+        :return: The shared x values, and the y values of each data source
+            as one row of a two-dimensional array.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        sources = list(sources)
+        old_dsrc = self.data_source
+        self._data_source_name = ",".join(source.name for source in sources)
+        self.sendcmd("DAT:SOU {}".format(self._data_source_name))
+        try:
+            n_bytes, dtype = self._waveform_encoding()
+            xzero, xincr = map(float, self.query("WFMO:XZE?;XIN?").split(";"))
+            self.sendcmd("CURV?")
+            raw = []
+            for idx in range(len(sources)):
+                if idx:
+                    self._file.read_raw(1)  # Separator between curves
+                raw.append(self.binblockread(n_bytes, fmt=dtype))
+            self._read_terminator()
+        finally:
+            if self.restore_data_source:
+                self.data_source = old_dsrc
+            else:
+                self.data_source = sources[0]
+
+        # Stacking quantities drops their units, so stack the magnitudes.
+        ys = [
+            source._scale_raw_data(data)
+            for source, data in zip(sources, raw)
+        ]
+        y = pq.Quantity(
+            np.vstack([data.rescale(pq.volt).magnitude for data in ys]),
+            pq.volt
+        )
+        x = np.arange(y.shape[1]) * xincr + xzero
+        return x, y
+
     def force_trigger(self):
         """
         Forces a trigger event to happen for the oscilloscope.
@@ -10,7 +10,7 @@ from __future__ import absolute_import
 from __future__ import division
 import time
 
-from builtins import range, map
+from builtins import range
 from enum import Enum
 
 import numpy as np
@@ -73,10 +73,8 @@ class _TekTDS224DataSource(OscilloscopeDataSource):
             if not bin_format:
                 self._tek.sendcmd('DAT:ENC ASCI')
                                   # Set the data encoding format to ASCII
-                raw = self._tek.query('CURVE?')
-                raw = raw.split(',')  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
+                self._tek.sendcmd('CURVE?')
+                raw = self._tek.read_ascii_values(chunk_size=4096)
             else:
                 self._tek.sendcmd('DAT:ENC RIB')
                                   # Set encoding to signed, big-endian
@@ -38,9 +38,10 @@ from __future__ import division
 from functools import reduce
 
 import time
-from time import sleep
 from datetime import datetime
+from io import BytesIO
 import operator
+import socket
 import struct
 
 from builtins import range, map, round
@@ -53,8 +54,9 @@ from instruments.abstract_instruments import (
     OscilloscopeDataSource,
     Oscilloscope,
 )
+from instruments.abstract_instruments.comm import GPIBCommunicator
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, MinMaxDecimator
 
 # CLASSES #####################################################################
 
@@ -124,15 +126,16 @@ class _TekTDS5xxDataSource(OscilloscopeDataSource):
 
         :rtype: two item `tuple` of `numpy.ndarray`
         """
+        return self._scale_waveform(self._transfer_waveform(bin_format))
+
+    def _transfer_waveform(self, bin_format=True):
         with self:
 
             if not bin_format:
                 # Set the data encoding format to ASCII
                 self._parent.sendcmd('DAT:ENC ASCI')
-                raw = self._parent.query('CURVE?')
-                raw = raw.split(',')  # Break up comma delimited string
-                raw = map(float, raw)  # Convert each list element to int
-                raw = np.array(raw)  # Convert into numpy array
+                self._parent.sendcmd('CURVE?')
+                raw = self._parent.read_ascii_values(chunk_size=4096)
             else:
                 # Set encoding to signed, big-endian
                 self._parent.sendcmd('DAT:ENC RIB')
@@ -144,23 +147,73 @@ class _TekTDS5xxDataSource(OscilloscopeDataSource):
                 # pylint: disable=protected-access
                 self._parent._file.flush_input()  # Flush input buffer
 
-            # Retrieve Y offset
-            yoffs = self._parent.query('WFMP:{}:YOF?'.format(self.name))
-            # Retrieve Y multiply
-            ymult = self._parent.query('WFMP:{}:YMU?'.format(self.name))
-            # Retrieve Y zero
-            yzero = self._parent.query('WFMP:{}:YZE?'.format(self.name))
+            return raw, self._read_preamble()
 
-            y = ((raw - float(yoffs)) * float(ymult)) + float(yzero)
+    def _scale_waveform(self, raw):
+        raw, (yoffs, ymult, yzero, xincr, ptcnt) = raw
 
-            # Retrieve X incr
-            xincr = self._parent.query('WFMP:{}:XIN?'.format(self.name))
-            # Retrieve number of data points
-            ptcnt = self._parent.query('WFMP:{}:NR_P?'.format(self.name))
+        y = ((raw - yoffs) * ymult) + yzero
+        x = np.arange(ptcnt) * xincr
 
-            x = np.arange(float(ptcnt)) * float(xincr)
+        return (x, y)
 
-            return (x, y)
+    def read_waveform_envelope(self, n_bins, chunk_size=65536):
+        """
+        Reads a waveform reduced to the minimum and maximum of each of
+        ``n_bins`` bins, as with `~instruments.util_fns.minmax_decimate`.
+
+        The raw samples are decimated chunk by chunk while they are being
+        transferred, and only the decimated points are scaled, so the full
+        waveform is never held in memory.
+
+        :param int n_bins: The number of bins to reduce the waveform to.
+        :param int chunk_size: Number of bytes to transfer at a time.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        with self:
+            yoffs, ymult, yzero, xincr, ptcnt = self._read_preamble()
+            decimator = MinMaxDecimator(max(1, -(-int(ptcnt) // n_bins)))
+
+            self._parent.sendcmd('DAT:ENC RIB')
+            data_width = self._parent.data_width
+            self._parent.sendcmd('CURVE?')
+            indices = []
+            raw = []
+            for chunk in self._parent.binblockread_chunks(
+                    data_width, chunk_size=chunk_size):
+                chunk_indices, chunk_raw = decimator.update(chunk)
+                indices.append(chunk_indices)
+                raw.append(chunk_raw)
+            chunk_indices, chunk_raw = decimator.finish()
+            indices.append(chunk_indices)
+            raw.append(chunk_raw)
+
+            # pylint: disable=protected-access
+            self._parent._file.flush_input()  # Flush input buffer
+
+        y = ((np.concatenate(raw) - yoffs) * ymult) + yzero
+        x = np.concatenate(indices) * xincr
+
+        return (x, y)
+
+    def _read_preamble(self):
+        """
+        Reads the waveform scaling parameters for this data source in a
+        single compound ``WFMP`` query. The parameters are cached by the
+        oscilloscope until a command that could change them is sent.
+
+        :return: The Y offset, Y multiplier, Y zero, X increment and number
+            of points.
+        :rtype: `tuple` of `float`
+        """
+        # pylint: disable=protected-access
+        cache = self._parent._preamble_cache
+        if self.name not in cache:
+            resp = self._parent.query(
+                'WFMP:{}:YOF?;YMU?;YZE?;XIN?;NR_P?'.format(self.name)
+            )
+            cache[self.name] = tuple(map(float, resp.split(';')))
+        return cache[self.name]
 
 
 class _TekTDS5xxChannel(_TekTDS5xxDataSource, OscilloscopeChannel):
@@ -273,6 +326,15 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
       | Tektronix Document: 070-8709-07
     """
 
+    # Commands used while transferring waveforms, which do not change the
+    # waveform preamble.
+    _TRANSFER_CMDS = ('DAT:SOU', 'DAT:ENC', 'CURVE?')
+
+    def __init__(self, filelike):
+        super(TekTDS5xx, self).__init__(filelike)
+        self._preamble_cache = {}
+        self._data_source_name = None
+
     # ENUMS ##
 
     class Coupling(Enum):
@@ -425,10 +487,16 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
         """
         Gets/sets the the data source for waveform transfer.
 
+        The selected data source is tracked by this object, so that it is
+        only queried from the oscilloscope once, and selecting the data
+        source which is already selected does not send any commands.
+
         :type: `TekTDS5xx.Source` or `_TekTDS5xxDataSource`
         :rtype: '_TekTDS5xxDataSource`
         """
-        name = self.query("DAT:SOU?")
+        if self._data_source_name is None:
+            self._data_source_name = self.query("DAT:SOU?")
+        name = self._data_source_name
         if name.startswith("CH"):
             return _TekTDS5xxChannel(self, int(name[2:]) - 1)
 
@@ -441,8 +509,11 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
         if not isinstance(newval, TekTDS5xx.Source):
             raise TypeError("Source setting must be a `TekTDS5xx.Source`"
                             " value, got {} instead.".format(type(newval)))
+        if newval.value == self._data_source_name:
+            return
 
         self.sendcmd("DAT:SOU {}".format(newval.value))
+        self._data_source_name = newval.value
         time.sleep(0.01)  # Let the instrument catch up.
 
     @property
@@ -583,21 +654,180 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
                              "{} instead".format(type(newval)))
         self.sendcmd('DISPLAY:CLOCK {}'.format(int(newval)))
 
+    def read_waveforms(self, sources, bin_format=True):
+        """
+        Gets the waveforms of several data sources in a single binary
+        transfer, by selecting all of the sources at once with ``DAT:SOU``.
+
+        ASCII transfers read each data source in turn.
+
+        Function returns a tuple (x, y), where x is the shared time axis and
+        each row of y is the waveform of the corresponding data source.
+
+        :param sources: The data sources to read waveforms from.
+        :type sources: `list` of `_TekTDS5xxDataSource`
+        :param bool bin_format: If `True`, data is transfered
+            in a binary format. Otherwise, data is transferred in ASCII.
+
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        if not bin_format:
+            return super(TekTDS5xx, self).read_waveforms(sources, bin_format)
+
+        sources = list(sources)
+        old_dsrc = self.data_source
+        self._data_source_name = ','.join(source.name for source in sources)
+        self.sendcmd('DAT:SOU {}'.format(self._data_source_name))
+        try:
+            self.sendcmd('DAT:ENC RIB')
+            data_width = self.data_width
+            self.sendcmd('CURVE?')
+            raw = []
+            for idx in range(len(sources)):
+                if idx:
+                    self._file.read_raw(1)  # Separator between curves
+                raw.append(self.binblockread(data_width))
+            self._file.flush_input()  # Flush input buffer
+        finally:
+            if self.restore_data_source:
+                self.data_source = old_dsrc
+            else:
+                self.data_source = sources[0]
+
+        # pylint: disable=protected-access
+        preambles = [source._read_preamble() for source in sources]
+        y = np.vstack([
+            ((data - yoffs) * ymult) + yzero
+            for data, (yoffs, ymult, yzero, _, _) in zip(raw, preambles)
+        ])
+        _, _, _, xincr, ptcnt = preambles[0]
+        x = np.arange(ptcnt) * xincr
+
+        return (x, y)
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command to the oscilloscope. Any command other than those
+        used to transfer waveforms clears the cached waveform preambles, as
+        it may have changed the acquisition settings.
+
+        :param str cmd: String containing the command to be sent.
+        """
+        if not cmd.startswith(self._TRANSFER_CMDS):
+            self._preamble_cache.clear()
+        super(TekTDS5xx, self).sendcmd(cmd)
+
+    def clear_preamble_cache(self):
+        """
+        Clears the cached waveform preambles, such that the scaling
+        parameters are read again on the next waveform transfer. This should
+        be called if the acquisition settings have been changed from the
+        front panel.
+        """
+        self._preamble_cache.clear()
+
     def get_hardcopy(self):
         """
         Gets a screenshot of the display
 
-        :rtype: `string`
+        .. seealso:: `TekTDS5xx.save_hardcopy`, which writes the screenshot
+            directly to a file instead of holding it in memory.
+
+        :return: The screenshot as a BMP image.
+        :rtype: `bytes`
+        """
+        sink = BytesIO()
+        self.save_hardcopy(sink)
+        return sink.getvalue()
+
+    def save_hardcopy(self, sink, chunk_size=4096, progress=None,
+                      timeout=10, poll_interval=0.05):
+        """
+        Streams a screenshot of the display, as a BMP image, to a file-like
+        object. The image is read from the oscilloscope in chunks, each of
+        which is written to ``sink`` as soon as it arrives.
+
+        Example usage:
+
+        >>> import instruments as ik
+        >>> tek = ik.tektronix.TekTDS5xx.open_gpibusb("/dev/ttyUSB0", 1)
+        >>> with open("screenshot.bmp", "wb") as bmp:
+        ...     tek.save_hardcopy(bmp, progress=print)
+
+        :param sink: Binary file-like object to write the image to.
+        :param int chunk_size: Maximum number of bytes to read at a time.
+        :param progress: Function called after each chunk with the number of
+            bytes received so far and the total size of the image.
+        :type progress: `callable`
+        :param float timeout: Seconds to wait for the oscilloscope to start
+            sending the image, or to continue sending it, before giving up.
+        :param float poll_interval: Seconds to wait between attempts to read
+            the start of the image.
+        :return: The size of the image in bytes.
+        :rtype: `int`
         """
         self.sendcmd('HARDC:PORT GPI;HARDC:LAY PORT;:HARDC:FORM BMP')
         self.sendcmd('HARDC START')
-        sleep(1)
-        header = self.query("", size=54)
+
+        # Rendering the screenshot takes a while, so poll for its header
+        # rather than waiting a fixed time.
+        self._request_hardcopy_bytes()
+        header = self._read_hardcopy_bytes(54, timeout, poll_interval)
         # Get BMP Length  in kilobytes from DIB header, because file header is
         # bad
         length = reduce(
             operator.mul, struct.unpack('<iihh', header[18:30])) / 8
         length = int(length) + 8  # Add 8 bytes for our monochrome colour table
-        data = header + self.query("", size=length)
+        total = len(header) + length
+
+        sink.write(header)
+        received = len(header)
+        if progress is not None:
+            progress(received, total)
+        while received < total:
+            chunk = self._read_hardcopy_bytes(
+                min(chunk_size, total - received), timeout, poll_interval
+            )
+            sink.write(chunk)
+            received += len(chunk)
+            if progress is not None:
+                progress(received, total)
+
         self._file.flush_input()  # Flush input buffer
+        return total
+
+    def _request_hardcopy_bytes(self):
+        """
+        Tells the Galvant Industries GPIB-USB adapter to ``+read`` the
+        output of the oscilloscope, as it only forwards a response after
+        being told to read one. Nothing is sent over other connections,
+        which forward the output as it arrives. The response is left unread,
+        as the image is binary and is read raw.
+        """
+        if isinstance(self._file, GPIBCommunicator):
+            self._file.query("", size=0)
+
+    def _read_hardcopy_bytes(self, size, timeout, poll_interval):
+        """
+        Reads ``size`` bytes of a hardcopy, polling until they arrive or no
+        data has been received for ``timeout`` seconds. A read which times
+        out on the connection is treated as a poll which returned no data.
+        """
+        data = bytes()
+        deadline = time.time() + timeout
+        while len(data) < size:
+            try:
+                chunk = self._file.read_raw(size - len(data))
+            except socket.timeout:
+                chunk = bytes()
+            if chunk:
+                data += chunk
+                deadline = time.time() + timeout
+            elif time.time() > deadline:
+                raise IOError("Timed out waiting for hardcopy data.")
+            else:
+                if not self._testing:
+                    time.sleep(poll_interval)
+                # Only the GPIB-USB adapter needs to be told to read again.
+                self._request_hardcopy_bytes()
         return data
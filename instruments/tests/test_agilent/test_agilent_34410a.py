@@ -67,15 +67,17 @@ def test_agilent34410a_fetch():
         ik.agilent.Agilent34410a,
         [
             "CONF?",
+            "FORM:DATA REAL,64",
             "FETC?"
         ], [
             "VOLT +1.000000E+01,+3.000000E-06",
-            "+4.27150000E-03,5.27150000E-03"
+            # pylint: disable=no-member
+            b"#216" + bytes.fromhex("3FF0000000000000C000000000000000")
         ]
     ) as dmm:
         data = dmm.fetch()
-        unit_eq(data[0], 4.27150000E-03 * pq.volt)
-        unit_eq(data[1], 5.27150000E-03 * pq.volt)
+        unit_eq(data[0], 1 * pq.volt)
+        unit_eq(data[1], -2 * pq.volt)
 
 
 def test_agilent34410a_read_data():
@@ -83,16 +85,17 @@ def test_agilent34410a_read_data():
         ik.agilent.Agilent34410a,
         [
             "CONF?",
-            "FORM:DATA ASC",
+            "FORM:DATA REAL,64",
             "DATA:REM? 2"
         ], [
             "VOLT +1.000000E+01,+3.000000E-06",
-            "+4.27150000E-03,5.27150000E-03"
+            # pylint: disable=no-member
+            b"#216" + bytes.fromhex("3FF0000000000000C000000000000000")
         ]
     ) as dmm:
         data = dmm.read_data(2)
-        unit_eq(data[0], 4.27150000E-03 * pq.volt)
-        unit_eq(data[1], 5.27150000E-03 * pq.volt)
+        unit_eq(data[0], 1 * pq.volt)
+        unit_eq(data[1], -2 * pq.volt)
 
 
 def test_agilent34410a_read_data_nvmem():
@@ -100,15 +103,44 @@ def test_agilent34410a_read_data_nvmem():
         ik.agilent.Agilent34410a,
         [
             "CONF?",
+            "FORM:DATA REAL,64",
             "DATA:DATA? NVMEM",
         ], [
             "VOLT +1.000000E+01,+3.000000E-06",
-            "+4.27150000E-03,5.27150000E-03"
+            # pylint: disable=no-member
+            b"#216" + bytes.fromhex("3FF0000000000000C000000000000000")
         ]
     ) as dmm:
         data = dmm.read_data_nvmem()
-        unit_eq(data[0], 4.27150000E-03 * pq.volt)
-        unit_eq(data[1], 5.27150000E-03 * pq.volt)
+        unit_eq(data[0], 1 * pq.volt)
+        unit_eq(data[1], -2 * pq.volt)
+
+
+def test_agilent34410a_data_format_sent_once():
+    with expected_protocol(
+        ik.agilent.Agilent34410a,
+        [
+            "CONF?",
+            "FORM:DATA REAL,64",
+            "FETC?",
+            "CONF?",
+            "FETC?",
+            "CONF?",
+            "FORM:DATA ASC",
+            "READ?"
+        ], [
+            "VOLT +1.000000E+01,+3.000000E-06",
+            # pylint: disable=no-member
+            b"#18" + bytes.fromhex("3FF0000000000000"),
+            "VOLT +1.000000E+01,+3.000000E-06",
+            b"#18" + bytes.fromhex("4000000000000000"),
+            "VOLT +1.000000E+01,+3.000000E-06",
+            "+1.86850000E-03"
+        ]
+    ) as dmm:
+        unit_eq(dmm.fetch(), np.array([1]) * pq.volt)
+        unit_eq(dmm.fetch(), np.array([2]) * pq.volt)
+        unit_eq(dmm.read_meter(), +1.86850000E-03 * pq.volt)
 
 
 def test_agilent34410a_read_last_data():
@@ -121,3 +153,37 @@ def test_agilent34410a_read_last_data():
         ]
     ) as dmm:
         unit_eq(dmm.read_last_data(), 1.73730000E-03 * pq.volt)
+
+
+def test_agilent34410a_stream():
+    with expected_protocol(
+        ik.agilent.Agilent34410a,
+        [
+            "CONF?",
+            "INIT",
+            "DATA:POIN?",
+            "DATA:POIN?",
+            "FORM:DATA REAL,64",
+            "R? 2",
+            "DATA:POIN?",
+            "R? 1",
+            "ABOR"
+        ], [
+            "VOLT +1.000000E+01,+3.000000E-06",
+            "+0",
+            "+3",
+            # pylint: disable=no-member
+            b"#216" + bytes.fromhex("3FF0000000000000C000000000000000"),
+            "+1",
+            b"#18" + bytes.fromhex("4008000000000000")
+        ]
+    ) as dmm:
+        with dmm.stream(buffer_size=2, chunk_size=2, count=3) as stream:
+            stream._thread.join()
+            assert stream.readings_transferred == 3
+            assert stream.overflow_count == 1
+            unit_eq(stream.latest(1)[0], 3 * pq.volt)
+            chunks = list(stream)
+            assert all(chunk.units == pq.volt for chunk in chunks)
+            data = np.concatenate([chunk.magnitude for chunk in chunks])
+            assert (data == np.array([-2, 3])).all()
@@ -63,6 +63,22 @@ def test_instrument_binblockread_two_reads():
     np.testing.assert_array_equal(calls_expected, calls_actual)
 
 
+def test_instrument_binblockread_chunked():
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", data[:4], data[4:8], data[8:]]
+    )
+
+    np.testing.assert_array_equal(
+        inst.binblockread(2, chunk_size=4), [0, 1, 2, 3, 4]
+    )
+
+    calls_expected = [1, 1, 2, 4, 4, 2]
+    calls_actual = [call[0][0] for call in inst._file.read_raw.call_args_list]
+    np.testing.assert_array_equal(calls_expected, calls_actual)
+
+
 def test_instrument_binblockread_too_many_reads():
     with pytest.raises(IOError):
         inst = ik.Instrument.open_test()
@@ -74,6 +90,85 @@ def test_instrument_binblockread_too_many_reads():
         _ = inst.binblockread(2)
 
 
+def test_instrument_binblockread_indefinite_length():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [
+            b"#0" + bytes.fromhex("000000010002"),
+        ],
+        sep="\n"
+    ) as inst:
+        np.testing.assert_array_equal(inst.binblockread(2, count=3), [0, 1, 2])
+
+
+def test_instrument_binblockread_indefinite_length_no_count():
+    with pytest.raises(IOError):
+        inst = ik.Instrument.open_test()
+        inst._file.read_raw = mock.MagicMock(side_effect=[b"#", b"0"])
+
+        _ = inst.binblockread(2)
+
+
+def test_instrument_read_ascii_values():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [
+            "1,2.5,-3"
+        ],
+        sep="\n"
+    ) as inst:
+        np.testing.assert_array_equal(inst.read_ascii_values(), [1, 2.5, -3])
+
+
+def test_instrument_read_ascii_values_chunked():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [
+            "1,223,-4",
+            "next"
+        ],
+        sep="\n"
+    ) as inst:
+        np.testing.assert_array_equal(
+            inst.read_ascii_values(chunk_size=4),
+            [1, 223, -4]
+        )
+        # The following response is left unread.
+        assert inst.read() == "next"
+
+
+def test_instrument_read_ascii_values_chunked_stops_at_terminator():
+    inst = ik.Instrument.open_test()
+    inst._file.read_raw_until = mock.MagicMock(
+        side_effect=[b"1,22", b"3\n"]
+    )
+
+    np.testing.assert_array_equal(
+        inst.read_ascii_values(chunk_size=4),
+        [1, 223]
+    )
+    inst._file.read_raw_until.assert_called_with(b"\n", 4)
+    assert inst._file.read_raw_until.call_count == 2
+
+
+def test_instrument_read_ascii_values_chunked_split_terminator():
+    inst = ik.Instrument.open_test()
+    inst.terminator = "\r\n"
+    inst._file.read_raw_until = mock.MagicMock(
+        side_effect=[b"1,2\r", b"\n"]
+    )
+
+    np.testing.assert_array_equal(
+        inst.read_ascii_values(chunk_size=4),
+        [1, 2]
+    )
+    inst._file.read_raw_until.assert_called_with(b"\n", 4)
+    assert inst._file.read_raw_until.call_count == 2
+
+
 def test_instrument_binblockread_bad_block_start():
     with pytest.raises(IOError):
         inst = ik.Instrument.open_test()
@@ -784,3 +879,17 @@ def test_instrument_prompt():
 
     inst.prompt = None
     assert inst.prompt is None
+
+
+def test_instrument_binblockread_chunks():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [
+            b"#210" + bytes.fromhex("00000001000200030004"),
+        ],
+        sep="\n"
+    ) as inst:
+        chunks = list(inst.binblockread_chunks(2, chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [1, 1, 1, 1, 1]
+        np.testing.assert_array_equal(np.concatenate(chunks), [0, 1, 2, 3, 4])
@@ -219,6 +219,15 @@ def test_gpibusbcomm_read_raw():
     comm._file.read_raw.assert_called_with(3)
 
 
+def test_gpibusbcomm_read_raw_until():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+    comm._file.read_raw_until = mock.MagicMock(return_value=b"ab\n")
+
+    assert comm.read_raw_until(b"\n", 10) == b"ab\n"
+    comm._file.read_raw_until.assert_called_with(b"\n", 10)
+
+
 def test_gpibusbcomm_write_raw():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 5
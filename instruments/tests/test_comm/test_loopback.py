@@ -99,6 +99,24 @@ def test_loopbackcomm_read_raw_2char_terminator():
     assert mock_stdin.read.call_count == 5
 
 
+def test_loopbackcomm_read_raw_until():
+    mock_stdin = mock.MagicMock()
+    mock_stdin.read.side_effect = [b"a", b"b", b"\n", b"c"]
+    comm = LoopbackCommunicator(stdin=mock_stdin)
+
+    assert comm.read_raw_until(b"\n", 10) == b"ab\n"
+    assert mock_stdin.read.call_count == 3
+
+
+def test_loopbackcomm_read_raw_until_size():
+    mock_stdin = mock.MagicMock()
+    mock_stdin.read.side_effect = [b"a", b"b", b"c"]
+    comm = LoopbackCommunicator(stdin=mock_stdin)
+
+    assert comm.read_raw_until(b"\n", 2) == b"ab"
+    assert mock_stdin.read.call_count == 2
+
+
 def test_loopbackcomm_write_raw():
     mock_stdout = mock.MagicMock()
     comm = LoopbackCommunicator(stdout=mock_stdout)
@@ -118,6 +118,15 @@ def test_serialcomm_read_raw_timeout():
         _ = comm.read_raw(-1)
 
 
+def test_serialcomm_read_raw_until():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._conn.read_until = mock.MagicMock(return_value=b"ab\n")
+
+    assert comm.read_raw_until(b"\n", 10) == b"ab\n"
+    comm._conn.read_until.assert_called_with(b"\n", 10)
+
+
 def test_serialcomm_write_raw():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
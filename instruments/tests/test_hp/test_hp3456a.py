@@ -485,3 +485,49 @@ def test_hp3456a_register_write_bad_register():
             sep="\r"
         ) as dmm:
             dmm._register_write(dmm.Register.mean, 1)
+
+
+def test_hp3456a_measure_statistics():
+    with expected_protocol(
+        ik.hp.HP3456a,
+        [
+            "HO0T4SO1",
+            "S0F1",
+            "M2",
+            "W100STN",
+            "T3",
+            "REC",
+            "REC",
+            "REM",
+            "REV"
+        ], [
+            "+50.00000E+0",
+            "+100.0000E+0",
+            "+102.1000E-3",
+            "+1.000000E-6"
+        ],
+        sep="\r"
+    ) as dmm:
+        mean, variance, count = dmm.measure_statistics(100, dmm.Mode.dcv)
+        assert mean == +102.1000E-3 * pq.volt
+        assert variance == +1.000000E-6 * pq.volt ** 2
+        assert count == 100
+        assert isinstance(count, int)
+
+
+def test_hp3456a_measure_statistics_timeout():
+    with pytest.raises(IOError):
+        with expected_protocol(
+            ik.hp.HP3456a,
+            [
+                "HO0T4SO1",
+                "M2",
+                "W100STN",
+                "T3",
+                "REC"
+            ], [
+                "+50.00000E+0"
+            ],
+            sep="\r"
+        ) as dmm:
+            dmm.measure_statistics(100, timeout=-1)
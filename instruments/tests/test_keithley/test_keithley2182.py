@@ -123,13 +123,34 @@ def test_units():
         units = str(inst.units.units).split()[1]
         assert units == "degC"
 
-        units = str(inst.units.units).split()[1]
+        units = str(inst.refresh_units().units).split()[1]
         assert units == "degF"
 
-        units = str(inst.units.units).split()[1]
+        units = str(inst.refresh_units().units).split()[1]
         assert units == "K"
 
+        assert inst.refresh_units() == pq.volt
+
+
+def test_units_cached():
+    with expected_protocol(
+        ik.keithley.Keithley2182,
+        [
+            "SENS:FUNC?",
+            "UNIT:TEMP K",
+            "SENS:FUNC?",
+            "UNIT:TEMP?"
+        ],
+        [
+            "VOLT",
+            "TEMP",
+            "K"
+        ]
+    ) as inst:
         assert inst.units == pq.volt
+        assert inst.units == pq.volt
+        inst.sendcmd("UNIT:TEMP K")
+        assert inst.units == pq.kelvin
 
 
 def test_fetch():
@@ -235,3 +256,112 @@ def test_relative_set_wrong_type():
             []
         ) as inst:
             inst.relative = "derp"
+
+
+def test_arm_buffer():
+    with expected_protocol(
+        ik.keithley.Keithley2182,
+        [
+            "TRAC:CLE",
+            "TRAC:POIN 100",
+            "TRAC:FEED SENS",
+            "TRAC:FEED:CONT NEXT",
+            "TRIG:COUN 100",
+            "INIT"
+        ],
+        []
+    ) as inst:
+        inst.arm_buffer(100)
+
+
+def test_arm_buffer_invalid_count():
+    with pytest.raises(ValueError):
+        inst = ik.keithley.Keithley2182.open_test()
+        inst.arm_buffer(1)
+
+
+def test_read_buffer():
+    with expected_protocol(
+        ik.keithley.Keithley2182,
+        [
+            "TRAC:POIN:ACT?",
+            "FORM:DATA REAL,64",
+            "FORM:BORD NORM",
+            "TRAC:DATA?",
+            "SENS:FUNC?",
+            "FORM:DATA ASC",
+            "FETC?"
+        ],
+        [
+            "2",
+            b"#0" + np.array([1.5, -2.5], dtype=">f8").tobytes(),
+            "VOLT",
+            "1.234"
+        ]
+    ) as inst:
+        np.testing.assert_array_equal(
+            inst.read_buffer(), [1.5, -2.5] * pq.volt
+        )
+        np.testing.assert_array_equal(inst.fetch(), [1.234] * pq.volt)
+
+
+def test_stream():
+    with expected_protocol(
+        ik.keithley.Keithley2182,
+        [
+            "SENS:FUNC?",
+            "TRAC:CLE",
+            "TRAC:POIN 2",
+            "TRAC:FEED SENS",
+            "TRAC:FEED:CONT NEXT",
+            "TRIG:COUN 2",
+            "INIT",
+            "TRAC:POIN:ACT?",
+            "TRAC:POIN:ACT?",
+            "FORM:DATA REAL,64",
+            "FORM:BORD NORM",
+            "TRAC:DATA?",
+            "TRAC:CLE",
+            "TRAC:POIN 2",
+            "TRAC:FEED SENS",
+            "TRAC:FEED:CONT NEXT",
+            "TRIG:COUN 2",
+            "INIT",
+            "TRAC:POIN:ACT?",
+            "TRAC:DATA?"
+        ],
+        [
+            "VOLT",
+            "1",
+            "2",
+            b"#0" + np.array([1, 2], dtype=">f8").tobytes(),
+            "2",
+            b"#0" + np.array([3, 4], dtype=">f8").tobytes()
+        ]
+    ) as inst:
+        chunks = list(inst.stream(buffer_size=2, count=3))
+        assert len(chunks) == 2
+        np.testing.assert_array_equal(chunks[0], [1, 2] * pq.volt)
+        np.testing.assert_array_equal(chunks[1], [3] * pq.volt)
+
+
+def test_stream_timeout():
+    with expected_protocol(
+        ik.keithley.Keithley2182,
+        [
+            "SENS:FUNC?",
+            "TRAC:CLE",
+            "TRAC:POIN 2",
+            "TRAC:FEED SENS",
+            "TRAC:FEED:CONT NEXT",
+            "TRIG:COUN 2",
+            "INIT",
+            "TRAC:POIN:ACT?"
+        ],
+        [
+            "VOLT",
+            "0"
+        ]
+    ) as inst:
+        with pytest.raises(IOError):
+            _ = list(inst.stream(buffer_size=2, count=2, timeout=0))
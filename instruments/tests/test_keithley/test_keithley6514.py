@@ -8,6 +8,7 @@ Unit tests for the Keithley 6514 electrometer
 
 from __future__ import absolute_import
 
+import numpy as np
 import quantities as pq
 import pytest
 
@@ -233,3 +234,62 @@ def test_read():
         reading, timestamp = inst.read_measurements()
         assert reading == 1.0 * pq.volt
         assert timestamp == 1234
+
+
+def test_arm_buffer():
+    with expected_protocol(
+        ik.keithley.Keithley6514,
+        [
+            "TRAC:CLE",
+            "TRAC:POIN 100",
+            "TRAC:FEED SENS",
+            "TRAC:FEED:CONT NEXT",
+            "TRIG:COUN 100",
+            "INIT"
+        ],
+        []
+    ) as inst:
+        inst.arm_buffer(100)
+
+
+def test_arm_buffer_invalid_count():
+    with pytest.raises(ValueError):
+        inst = ik.keithley.Keithley6514.open_test()
+        inst.arm_buffer(2501)
+
+
+def test_read_buffer():
+    data = np.array(
+        [(1.5, 0.25, 3), (-2.5, 0.5, 0)],
+        dtype=[("reading", ">f8"), ("timestamp", ">f8"), ("status", ">f8")]
+    ).tobytes()
+    with expected_protocol(
+        ik.keithley.Keithley6514,
+        [
+            "TRAC:POIN:ACT?",
+            "FORM:DATA REAL,64",
+            "FORM:ELEM READ,TIME,STAT",
+            "FORM:BORD NORM",
+            "TRAC:DATA?",
+            "TRAC:POIN:ACT?",
+            "TRAC:DATA?",
+            "FORM:DATA ASC",
+            "FETC?",
+            "FUNCTION?"
+        ],
+        [
+            "2",
+            b"#0" + data,
+            "1",
+            b"#0" + data[:24],
+            "1.0,1234,5678",
+            '"VOLT:DC"'
+        ]
+    ) as inst:
+        buf = inst.read_buffer()
+        assert buf.dtype == inst.BUFFER_DTYPE
+        assert (buf["reading"] == np.array([1.5, -2.5])).all()
+        assert (buf["timestamp"] == np.array([0.25, 0.5])).all()
+        assert (buf["status"] == np.array([3, 0])).all()
+        assert len(inst.read_buffer()) == 1
+        assert inst.fetch()[0] == 1.0 * pq.volt
@@ -8,11 +8,16 @@ Unit tests for the Newport ESP 301 axis controller
 
 from __future__ import absolute_import
 
+import quantities as pq
+import pytest
+
 import instruments as ik
 from instruments.tests import expected_protocol
 
 # TESTS #######################################################################
 
+# pylint: disable=protected-access
+
 
 def test_axis_returns_axis_class():
     with expected_protocol(
@@ -29,3 +34,407 @@ def test_axis_returns_axis_class():
     ) as inst:
         axis = inst.axis[0]
         assert isinstance(axis, ik.newport.NewportESP301Axis) is True
+
+
+def test_execute_bulk_command():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1TP?;1PA1.0;1VA?",
+            "TB?"  # single error check for the whole batch
+        ],
+        [
+            "0.5,2.0",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        with inst.execute_bulk_command() as responses:
+            inst._newport_cmd("TP?", target=1)
+            inst._newport_cmd("PA", target=1, params=[1.0])
+            inst._newport_cmd("VA?", target=1)
+            assert responses == []
+        assert responses == ["0.5", "2.0"]
+
+
+def test_execute_bulk_command_axis_properties():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1TP?;1PA1.0;1MD?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "0.5,1",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        axis = inst.axis[0]
+        with inst.execute_bulk_command() as responses:
+            assert axis.position is None
+            inst._newport_cmd("PA", target=1, params=[1.0])
+            assert axis.is_motion_done is None
+        assert responses == [0.5 * pq.mm, True]
+        assert responses[0].units == pq.mm
+
+
+def test_execute_bulk_command_multiple_field_response():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1TP?;TB?;1VA?"
+        ],
+        [
+            "0.5,0, 0, NO ERROR,2.0"
+        ],
+        sep="\r"
+    ) as inst:
+        with pytest.raises(IOError):
+            with inst.execute_bulk_command():
+                inst._newport_cmd("TP?", target=1)
+                inst._newport_cmd("TB?")
+                inst._newport_cmd("VA?", target=1)
+
+
+def test_execute_bulk_command_no_queries():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1PA1.0;2PA2.0",
+            "TB?"
+        ],
+        [
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        with inst.execute_bulk_command() as responses:
+            inst._newport_cmd("PA", target=1, params=[1.0])
+            inst._newport_cmd("PA", target=2, params=[2.0])
+        assert responses == []
+
+
+def test_axis_get_status():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1SN?;1TP?;1DP?;1DV?;1MD?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "2,1.5,2.5,2.5,1",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        status = inst.axis[0].get_status()
+        assert status['units'] == pq.mm
+        assert status['position'] == 1.5 * pq.mm
+        assert status['desired_position'] == 2.5 * pq.mm
+        assert status['desired_velocity'] == 2.5 * pq.mm / pq.s
+        assert status['is_motion_done'] is True
+
+
+def test_axis_read_setup():
+    cmds = ["1" + cmd for cmd in [
+        "SN?", "QM?", "ZB?", "FR?", "FP?", "QI?", "VU?", "SU?", "AC?", "AG?",
+        "VA?", "AU?", "OH?", "JH?", "JW?", "AE?", "JK?", "KP?", "KD?", "KI?",
+        "KS?", "DH?", "QS?", "AF?", "TJ?", "ZH?"
+    ]]
+    resps = [
+        "2", "1", "1FH", "0.1", "3", "1.5", "10", "0.01", "4", "5",
+        "2", "8", "1", "3", "0.5", "9", "7", "0.2S", "0.3", "0.4",
+        "0.5", "0", "100", "0.6", "1", "24H"
+    ]
+    # The 26 queries do not fit on a single 80 character line, and so are
+    # split over two lines.
+    line_1 = ";".join(cmds[:16])
+    line_2 = ";".join(cmds[16:])
+    assert len(line_1) <= 80
+    assert len(line_1) + len(cmds[16]) + 1 > 80
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            line_1,
+            line_2,
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            ",".join(resps[:16]),
+            ",".join(resps[16:]),
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        config = inst.axis[0].read_setup()
+        assert config['units'] == pq.mm
+        assert config['motor_type'] == \
+            ik.newport.newportesp301.NewportESP301MotorType.dc_servo
+        assert config['feedback_configuration'] == 1
+        assert config['current'] == 1.5 * pq.A
+        assert config['max_velocity'] == 10 * pq.mm / pq.s
+        assert config['acceleration'] == 4 * pq.mm / pq.s**2
+        assert config['jerk'] == 7 * pq.mm / pq.s**3
+        assert config['proportional_gain'] == 0.2
+        assert config['microstep_factor'] == 100
+        assert config['hardware_limit_configuration'] == 2
+        assert len(config) == 26
+
+
+def test_axis_desired_velocity():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1DV?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "2.5",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        assert inst.axis[0].desired_velocity == 2.5 * pq.mm / pq.s
+
+
+def test_axis_units_cached():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1TP?",
+            "TB?",
+            "1SN3",
+            "TB?",
+            "1SN?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "1.5",
+            "0,0,0",
+            "0,0,0",
+            "7",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        assert inst.axis[0].units == pq.mm
+        # Accessing the axis again does not re-query the units.
+        assert inst.axis[0].position == 1.5 * pq.mm
+        inst.axis[0].units = pq.um
+        assert inst.axis[0].units == pq.um
+        assert inst.axis[0].refresh_units() == pq.deg
+        assert inst.axis[0].units == pq.deg
+
+
+def test_axis_encoder_position_restores_motor_step_units():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1SN0",
+            "TB?",
+            "1TP?",
+            "TB?",
+            "1SN1",
+            "TB?"
+        ],
+        [
+            "1",
+            "0,0,0",
+            "0,0,0",
+            "250",
+            "0,0,0",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        axis = inst.axis[0]
+        assert axis.encoder_position == 250 * pq.count
+        assert axis._unit_num == \
+            ik.newport.newportesp301.NewportESP301Units.motor_step
+
+
+def test_axis_units_invalid_type():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        with pytest.raises(TypeError):
+            inst.axis[0].units = "mm"
+
+
+def test_wait_for_all():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "2SN?",
+            "TB?",
+            "1PA?;1VA?;2PA?;2VA?",
+            "TB?",
+            "1MD?;1TP?;2MD?;2TP?",
+            "TB?",
+            "2MD?;2TP?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "2",
+            "0,0,0",
+            "10,1,5,1",
+            "0,0,0",
+            "1,10,0,4",
+            "0,0,0",
+            "1,5",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        inst.wait_for_all([inst.axis[0], inst.axis[1]], timeout=10)
+
+
+def test_wait_for_all_timeout():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1PA?;1VA?",
+            "TB?",
+            "1MD?;1TP?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "10,1",
+            "0,0,0",
+            "0,4",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        with pytest.raises(IOError):
+            inst.wait_for_all([inst.axis[0]], timeout=0)
+
+
+def test_program_upload():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1SL?;1SR?;1VU?;1TP?",
+            "TB?",
+            "3XX;4XX",
+            "TB?",
+            "3EP",
+            "1VA2.0;1PA0.0;1WS;4EX",
+            "QP",
+            "4EP",
+            "1PR5.0;WT10",
+            "QP",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "-10,10,5,0",
+            "0,0,0",
+            "0,0,0",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        axis = inst.axis[0]
+        program = ik.newport.NewportESP301Program(
+            inst, commands_per_program=4
+        )
+        program.set_velocity(axis, 2)
+        program.move(axis, [0])
+        program.move(axis, 5 * pq.mm, absolute=False, wait=False)
+        program.wait(10 * pq.ms)
+        assert len(program) == 5
+        assert program.upload(first_program_id=3) == [3, 4]
+
+
+def test_program_validate_limits():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1SL?;1SR?;1VU?;1TP?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "-10,10,5,0",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        axis = inst.axis[0]
+        program = ik.newport.NewportESP301Program(inst)
+        program.move(axis, [5, 10, 15])
+        with pytest.raises(ValueError):
+            program.upload()
+
+
+def test_program_too_many_programs():
+    with expected_protocol(
+        ik.newport.NewportESP301,
+        [
+            "1SN?",
+            "TB?",
+            "1SL?;1SR?;1VU?;1TP?",
+            "TB?"
+        ],
+        [
+            "2",
+            "0,0,0",
+            "-10,10,5,0",
+            "0,0,0"
+        ],
+        sep="\r"
+    ) as inst:
+        axis = inst.axis[0]
+        program = ik.newport.NewportESP301Program(
+            inst, commands_per_program=2
+        )
+        program.move(axis, [1, 2, 3], wait=False)
+        with pytest.raises(ValueError):
+            program.upload(first_program_id=99)
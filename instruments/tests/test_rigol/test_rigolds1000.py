@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Rigol DS1000
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+from builtins import bytes
+
+import numpy as np
+
+import instruments as ik
+from instruments.tests import expected_protocol
+
+# TESTS ######################################################################
+
+
+def test_rigolds1000_read_waveform():
+    block = bytes.fromhex("F0DCC8B4")
+    with expected_protocol(
+        ik.rigol.RigolDS1000Series,
+        [
+            ":WAV:POIN:MODE?",
+            ":CHAN1:SCAL?",
+            ":CHAN1:OFFS?",
+            ":TIM:SCAL?",
+            ":TIM:OFFS?",
+            ":ACQ:SAMP? CHAN1",
+            ":WAV:DATA? CHAN1",
+            ":WAV:DATA? CHAN1",
+        ], [
+            "NORMAL",
+            "2.5",
+            "-11.5",
+            "1",
+            "0.5",
+            "1e3",
+            b"#14" + block,
+            b"#14" + block,
+        ]
+    ) as rigol:
+        for _ in range(2):
+            x, y = rigol.channel[0].read_waveform()
+            np.testing.assert_allclose(x, [-5.5, -2.5, 0.5, 3.5])
+            np.testing.assert_allclose(y, [0, 2, 4, 6])
+
+
+def test_rigolds1000_read_waveform_raw_mode():
+    block = bytes.fromhex("F0DCC8B4")
+    with expected_protocol(
+        ik.rigol.RigolDS1000Series,
+        [
+            ":WAV:POIN:MODE RAW",
+            ":WAV:POIN:MODE?",
+            ":CHAN2:SCAL?",
+            ":CHAN2:OFFS?",
+            ":TIM:SCAL?",
+            ":TIM:OFFS?",
+            ":ACQ:SAMP? CHAN2",
+            ":WAV:DATA? CHAN2",
+        ], [
+            "RAW",
+            "2.5",
+            "-11.5",
+            "1",
+            "0",
+            "1e3",
+            b"#14" + block,
+        ]
+    ) as rigol:
+        rigol.waveform_points_mode = rigol.PointsMode.raw
+        x, y = rigol.channel[1].read_waveform()
+        np.testing.assert_allclose(x, [-2e-3, -1e-3, 0, 1e-3])
+        np.testing.assert_allclose(y, [0, 2, 4, 6])
+
+
+def test_rigolds1000_read_waveform_math():
+    block = bytes.fromhex("F0DCC8B4")
+    with expected_protocol(
+        ik.rigol.RigolDS1000Series,
+        [
+            ":WAV:POIN:MODE?",
+            ":MATH:SCAL?",
+            ":MATH:OFFS?",
+            ":TIM:SCAL?",
+            ":TIM:OFFS?",
+            ":ACQ:SAMP? CHAN1",
+            ":WAV:DATA? MATH",
+        ], [
+            "NORMAL",
+            "2.5",
+            "-11.5",
+            "1",
+            "0.5",
+            "1e3",
+            b"#14" + block,
+        ]
+    ) as rigol:
+        x, y = rigol.math.read_waveform()
+        np.testing.assert_allclose(x, [-5.5, -2.5, 0.5, 3.5])
+        np.testing.assert_allclose(y, [0, 2, 4, 6])
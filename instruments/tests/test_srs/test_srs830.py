@@ -13,7 +13,9 @@ import numpy as np
 import pytest
 
 import instruments as ik
+from instruments.abstract_instruments.comm import GPIBCommunicator
 from instruments.tests import expected_protocol
+from .. import mock
 
 # TESTS #######################################################################
 
@@ -243,6 +245,33 @@ def test_start_data_transfer():
 
 
 def test_take_measurement():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "REST",
+            "SRAT 4",
+            "SEND 0",
+            "FAST 2",
+            "STRD",
+            "PAUS",
+            "SPTS?",
+            "SPTS?",
+            "TRCB?1,0,2",
+            "SPTS?",
+            "TRCB?2,0,2"
+        ],
+        [
+            "2",
+            "2",
+            np.array([1.25, 5.5], dtype="<f4").tobytes() + b"2",
+            np.array([0.5, -5.25], dtype="<f4").tobytes()
+        ]
+    ) as inst:
+        resp = inst.take_measurement(sample_rate=1, num_samples=2)
+        np.testing.assert_array_equal(resp, [[1.25, 5.5], [0.5, -5.25]])
+
+
+def test_take_measurement_ascii():
     with expected_protocol(
         ik.srs.SRS830,
         [
@@ -266,10 +295,83 @@ def test_take_measurement():
             "0.456,5.321"
         ]
     ) as inst:
-        resp = inst.take_measurement(sample_rate=1, num_samples=2)
+        resp = inst.take_measurement(
+            sample_rate=1, num_samples=2, data_format="ascii"
+        )
         np.testing.assert_array_equal(resp, [[1.234, 5.678], [0.456, 5.321]])
 
 
+def test_stream_measurement():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "REST",
+            "SRAT 4",
+            "SEND 0",
+            "FAST 0",
+            "STRD",
+            "SPTS?",
+            "SPTS?",
+            "TRCB?1,0,2",
+            "TRCB?2,0,2",
+            "SPTS?",
+            "TRCB?1,2,1",
+            "TRCB?2,2,1",
+            "PAUS"
+        ],
+        [
+            "0",
+            "2",
+            np.array([1, 2], dtype="<f4").tobytes() +
+            np.array([3, 4], dtype="<f4").tobytes() + b"5",
+            np.array([5], dtype="<f4").tobytes() +
+            np.array([6], dtype="<f4").tobytes()
+        ]
+    ) as inst:
+        blocks = list(inst.stream_measurement(sample_rate=1, num_samples=3))
+        assert len(blocks) == 2
+        np.testing.assert_array_equal(blocks[0], [[1, 2], [3, 4]])
+        np.testing.assert_array_equal(blocks[1], [[5], [6]])
+
+
+def test_stream_measurement_timeout():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "REST",
+            "SRAT 4",
+            "SEND 0",
+            "FAST 0",
+            "STRD",
+            "SPTS?",
+            "TRCB?1,0,1",
+            "TRCB?2,0,1",
+            "SPTS?",
+            "PAUS"
+        ],
+        [
+            "1",
+            np.array([1], dtype="<f4").tobytes() +
+            np.array([2], dtype="<f4").tobytes() + b"1"
+        ]
+    ) as inst:
+        stream = inst.stream_measurement(sample_rate=1, num_samples=2,
+                                         timeout=0)
+        np.testing.assert_array_equal(next(stream), [[1], [2]])
+        with pytest.raises(IOError):
+            _ = next(stream)
+
+
+def test_stream_measurement_invalid_num_samples():
+    with pytest.raises(ValueError):
+        with expected_protocol(
+            ik.srs.SRS830,
+            [],
+            []
+        ) as inst:
+            _ = list(inst.stream_measurement(sample_rate=1, num_samples=16384))
+
+
 def test_take_measurement_invalid_num_samples():
     with pytest.raises(ValueError):
         with expected_protocol(
@@ -468,6 +570,40 @@ def test_read_data_buffer_mode_as_str():
         np.testing.assert_array_equal(data, expected)
 
 
+def test_read_data_buffer_ieee():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "SPTS?",
+            "TRCB?2,0,3"
+        ],
+        [
+            "3",
+            np.array([1.5, -2.25, 1e-6], dtype="<f4").tobytes()
+        ]
+    ) as inst:
+        data = inst.read_data_buffer(
+            channel=inst.Mode.ch2, data_format=inst.BufferFormat.ieee
+        )
+        np.testing.assert_allclose(data, [1.5, -2.25, 1e-6])
+
+
+def test_read_data_buffer_compact():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "SPTS?",
+            "TRCL?1,0,2"
+        ],
+        [
+            "2",
+            np.array([[3, 124], [-5, 122]], dtype="<i2").tobytes()
+        ]
+    ) as inst:
+        data = inst.read_data_buffer(channel="ch1", data_format="compact")
+        np.testing.assert_array_equal(data, [3, -1.25])
+
+
 def test_read_data_buffer_invalid_mode():
     with pytest.raises(ValueError):
         with expected_protocol(
@@ -559,3 +695,88 @@ def test_set_channel_display_invalid_ratio():
                 display=inst.Mode.x,
                 ratio=inst.Mode.xnoise
             )
+
+
+def test_stream_fast():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "FAST 2",
+            "STRD",
+            "PAUS",
+            "FAST 0"
+        ],
+        [
+            np.array([15000, -30000, 3000, 6000, 0], dtype="<i2").tobytes()
+        ]
+    ) as inst:
+        stream = inst.stream_fast(
+            full_scale=2 * pq.mV, buffer_size=4, chunk_size=6, num_samples=2
+        )
+        stream._thread.join()
+        assert stream.samples_received == 2
+        assert stream.bytes_received == 8
+        assert stream.overflow_count == 0
+        assert stream.samples_per_second > 0
+        latest = stream.latest(1)
+        assert latest.units == pq.mV
+        np.testing.assert_allclose(latest.magnitude, [[0.2], [0.4]])
+        blocks = list(stream)
+        np.testing.assert_allclose(
+            np.hstack([block.magnitude for block in blocks]),
+            [[1, 0.2], [-2, 0.4]]
+        )
+        stream.stop()
+        assert not stream.running
+
+
+def test_stream_fast_compact():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "FAST 2",
+            "STRD",
+            "PAUS",
+            "FAST 0"
+        ],
+        [
+            np.array([[3, 124], [-5, 122]], dtype="<i2").tobytes()
+        ]
+    ) as inst:
+        with inst.stream_fast(sample_width=4, num_samples=1) as stream:
+            np.testing.assert_array_equal(
+                np.hstack(list(stream)), [[3], [-1.25]]
+            )
+            assert stream.overflow_count == 0
+
+
+def test_stream_fast_timeout():
+    with expected_protocol(
+        ik.srs.SRS830,
+        [
+            "FAST 2",
+            "STRD",
+            "PAUS",
+            "FAST 0"
+        ],
+        []
+    ) as inst:
+        stream = inst.stream_fast(num_samples=1, timeout=0)
+        with pytest.raises(IOError):
+            _ = list(stream)
+        stream.stop()
+        assert stream.samples_received == 0
+
+
+def test_stream_fast_gpibusb_unsupported():
+    adapter = mock.MagicMock()
+    adapter.query.return_value = "5"
+    inst = ik.srs.SRS830(GPIBCommunicator(adapter, 1))
+    with pytest.raises(TypeError):
+        inst.stream_fast()
+
+
+def test_stream_fast_invalid_sample_width():
+    with pytest.raises(ValueError):
+        inst = ik.srs.SRS830.open_test()
+        inst.stream_fast(sample_width=3)
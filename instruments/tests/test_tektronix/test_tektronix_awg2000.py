@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Tektronix AWG2000
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+
+import numpy as np
+
+import instruments as ik
+from instruments.tests import expected_protocol
+
+# TESTS ######################################################################
+
+
+def test_tekawg2000_upload_waveform():
+    waveform = np.array([0, 0.5, 1])
+    data = (waveform * 4095).astype("<u2").tobytes()
+    with expected_protocol(
+        ik.tektronix.TekAWG2000,
+        [
+            "DATA:DEST?",
+            "WFMP:YZERO 0",
+            "WFMP:YMULT 1",
+            "WFMP:XINCR 0.001",
+            b"CURVE #16" + data,
+            'DATA:DEST "OTHER"',
+            b"CURVE #16" + data,
+            "WFMP:YZERO 0",
+            "WFMP:YMULT 2",
+            "WFMP:XINCR 0.001",
+            b"CURVE #16" + data,
+        ], [
+            '"MAIN"'
+        ]
+    ) as tek:
+        progress = []
+        assert tek.upload_waveform(
+            0, 1, 0.001, waveform, chunk_size=4,
+            progress=lambda sent, total: progress.append((sent, total))
+        )
+        assert progress == [(4, 16), (8, 16), (12, 16), (16, 16)]
+        np.testing.assert_array_equal(waveform, [0, 0.5, 1])
+        # Uploading the same waveform again does nothing.
+        assert not tek.upload_waveform(0, 1, 0.001, waveform)
+
+        tek.waveform_name = "OTHER"
+        # The parameters are shared by all destinations, so are not re-sent.
+        assert tek.upload_waveform(0, 1, 0.001, waveform)
+        # New parameters change the waveform, so the data is sent again.
+        assert tek.upload_waveform(0, 2, 0.001, waveform.copy())
+
+
+def test_tekawg2000_upload_waveform_params_shared():
+    waveform = np.array([0, 1])
+    other = np.array([1, 0])
+    with expected_protocol(
+        ik.tektronix.TekAWG2000,
+        [
+            'DATA:DEST "A"',
+            "WFMP:YZERO 0",
+            "WFMP:YMULT 1",
+            "WFMP:XINCR 0.001",
+            b"CURVE #14" + (waveform * 4095).astype("<u2").tobytes(),
+            'DATA:DEST "B"',
+            "WFMP:YZERO 1.0",
+            "WFMP:YMULT 2.0",
+            "WFMP:XINCR 0.001",
+            b"CURVE #14" + (waveform * 4095).astype("<u2").tobytes(),
+            'DATA:DEST "A"',
+            "WFMP:YZERO 0",
+            "WFMP:YMULT 1",
+            "WFMP:XINCR 0.001",
+            b"CURVE #14" + (other * 4095).astype("<u2").tobytes(),
+        ], [
+        ]
+    ) as tek:
+        tek.waveform_name = "A"
+        assert tek.upload_waveform(0, 1, 0.001, waveform)
+        tek.waveform_name = "B"
+        assert tek.upload_waveform(1.0, 2.0, 0.001, waveform)
+        tek.waveform_name = "A"
+        assert tek.upload_waveform(0, 1, 0.001, other)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Tektronix DPO4104
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+from builtins import bytes
+
+import numpy as np
+
+import instruments as ik
+from instruments.tests import expected_protocol
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+def test_tekdpo4104_read_waveform_caches_preamble():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekDPO4104,
+        [
+            "DAT:SOU?",
+            "DAT:STOP?",
+            "DAT:STOP 10000000",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:YOF?;YMU?;YZE?;XZE?;XIN?;NR_P?",
+            "DAT:STOP 2500",
+            "DAT:STOP 10000000",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "DAT:STOP 2500",
+        ], [
+            "CH1",
+            "2500",
+            "2",
+            "#210" + block + "0;2;1;-1;0.5;5",
+            "2",
+            "#210" + block
+        ]
+    ) as tek:
+        for _ in range(2):
+            (x, y) = tek.channel[0].read_waveform()
+            assert (x == np.arange(5) * 0.5 - 1).all()
+            assert (y == np.arange(5) * 2 + 1).all()
+
+
+def test_tekdpo4104_read_waveforms():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekDPO4104,
+        [
+            "DAT:SOU?",
+            "DAT:STOP?",
+            "DAT:SOU CH1",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:YOF?;YMU?;YZE?;XZE?;XIN?;NR_P?",
+            "DAT:SOU CH2",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:YOF?;YMU?;YZE?;XZE?;XIN?;NR_P?",
+            "DAT:SOU CH3",
+        ], [
+            "CH3",
+            "10000000",
+            "2",
+            "#210" + block + "0;1;0;0;1;5",
+            "2",
+            "#210" + block + "0;2;1;0;1;5",
+        ]
+    ) as tek:
+        x, y = tek.read_waveforms([tek.channel[0], tek.channel[1]])
+        assert (x == np.arange(5)).all()
+        assert (y == [np.arange(5), np.arange(5) * 2 + 1]).all()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Tektronix DPO70000
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+from builtins import bytes
+
+import numpy as np
+import quantities as pq
+
+import instruments as ik
+from instruments.tests import expected_protocol
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+def test_tekdpo70000_read_waveforms():
+    block = bytes.fromhex("0000400000004000").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekDPO70000,
+        [
+            "DAT:SOU?",
+            "DAT:SOU CH1,CH2",
+            "DAT:ENC FAS",
+            "WFMO:BYT_N?",
+            "WFMO:BN_F?",
+            "WFMO:BYT_O?",
+            "WFMO:XZE?;XIN?",
+            "CURV?",
+            "DAT:SOU CH1",
+            "CH1:SCALE?",
+            "CH1:POS?",
+            "CH1:OFFS?",
+            "CH2:SCALE?",
+            "CH2:POS?",
+            "CH2:OFFS?",
+        ], [
+            "CH1",
+            "2",
+            "RI",
+            "MSB",
+            "-1;0.5",
+            "#14" + block[:4] + ";#14" + block[4:],
+            "1",
+            "0",
+            "0",
+            "2",
+            "0",
+            "1"
+        ]
+    ) as tek:
+        x, y = tek.read_waveforms([tek.channel[0], tek.channel[1]])
+        assert (x == [-1, -0.5]).all()
+        assert y.units == pq.volt
+        assert (y.magnitude == [[0, 2.5], [1, 6]]).all()
+
+
+def test_tekdpo70000_data_source_restored():
+    with expected_protocol(
+        ik.tektronix.TekDPO70000,
+        [
+            "DAT:SOU?",
+            "DAT:SOU CH2",
+            "DAT:SOU CH1",
+        ], [
+            "CH1",
+        ]
+    ) as tek:
+        with tek.channel[1]:
+            assert tek.data_source == tek.channel[1]
+        assert tek.data_source == tek.channel[0]
+        with tek.channel[0]:
+            pass
+
+
+def test_tekdpo70000_read_waveform_caches_encoding_and_scaling():
+    block = bytes.fromhex("00004000").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekDPO70000,
+        [
+            "DAT:SOU?",
+            "DAT:ENC FAS",
+            "WFMO:BYT_N?",
+            "WFMO:BN_F?",
+            "WFMO:BYT_O?",
+            "CURV?",
+            "CH1:SCALE?",
+            "CH1:POS?",
+            "CH1:OFFS?",
+            "CURV?",
+            "WFMO:BYT_O LSB",
+        ], [
+            "CH1",
+            "2",
+            "RI",
+            "MSB",
+            "#14" + block,
+            "1",
+            "0",
+            "0",
+            "#14" + block,
+        ]
+    ) as tek:
+        for _ in range(2):
+            y = tek.channel[0].read_waveform()
+            assert (y.magnitude == [0, 2.5]).all()
+        tek.outgoing_byte_order = tek.ByteOrder.little_endian
+        assert tek._encoding_cache == {}
+        assert tek._scaling_cache == {}
+
+
+def test_tekdpo70000_read_fastframes():
+    block = bytes.fromhex("0000400000004000").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekDPO70000,
+        [
+            "HOR:FAST:COUN?",
+            "DAT:SOU?",
+            "DAT:ENC FAS",
+            "WFMO:BYT_N?",
+            "WFMO:BN_F?",
+            "WFMO:BYT_O?",
+            "DAT:FRAMESTAR?",
+            "DAT:FRAMESTOP?",
+            "DAT:FRAMESTART 1",
+            "DAT:FRAMESTOP 2",
+            "CURV?",
+            "HOR:FAST:TIMES:ALL:CH1? 1,2",
+            "DAT:FRAMESTART 3",
+            "DAT:FRAMESTOP 5",
+            "CH1:SCALE?",
+            "CH1:POS?",
+            "CH1:OFFS?",
+        ], [
+            "2",
+            "CH1",
+            "2",
+            "RI",
+            "MSB",
+            "3",
+            "5",
+            "#18" + block,
+            '"02 Mar 2000 20:10:54.542 037 272 620",'
+            '"02 Mar 2000 20:10:54.542 537 272 620"',
+            "1",
+            "0",
+            "0",
+        ]
+    ) as tek:
+        frames, times = tek.channel[0].read_fastframes()
+        assert frames.shape == (2, 2)
+        assert (frames.magnitude == [[0, 2.5], [0, 2.5]]).all()
+        assert times.units == pq.second
+        np.testing.assert_allclose(times.magnitude, [0, 500e-6])
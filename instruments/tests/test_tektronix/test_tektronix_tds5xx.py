@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Tektronix TDS5xx
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+from builtins import bytes, range
+from io import BytesIO
+import socket
+import struct
+
+import numpy as np
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import GPIBCommunicator
+from instruments.tests import expected_protocol
+from .. import mock
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+def test_tektds5xx_read_waveform_caches_preamble():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:CH1:YOF?;YMU?;YZE?;XIN?;NR_P?",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+        ], [
+            "CH1",
+            "2",
+            "#210" + block + "0;2;1;0.5;5",
+            "2",
+            "#210" + block
+        ]
+    ) as tek:
+        for _ in range(2):
+            (x, y) = tek.channel[0].read_waveform()
+            assert (x == np.arange(5) * 0.5).all()
+            assert (y == np.arange(5) * 2 + 1).all()
+
+
+def test_tektds5xx_sendcmd_clears_preamble_cache():
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:ENC RIB",
+            "DATA:WIDTH 1"
+        ], [
+        ]
+    ) as tek:
+        tek._preamble_cache["CH1"] = (0, 1, 0, 1, 5)
+        tek.sendcmd("DAT:ENC RIB")
+        assert "CH1" in tek._preamble_cache
+        tek.data_width = 1
+        assert tek._preamble_cache == {}
+
+
+def test_tektds5xx_read_waveforms():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:SOU CH1,CH2",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "DAT:SOU CH1",
+            "WFMP:CH1:YOF?;YMU?;YZE?;XIN?;NR_P?",
+            "WFMP:CH2:YOF?;YMU?;YZE?;XIN?;NR_P?",
+        ], [
+            "CH1",
+            "2",
+            "#210" + block + ";#210" + block + "0;1;0;0.5;5",
+            "0;2;1;0.5;5"
+        ]
+    ) as tek:
+        x, y = tek.read_waveforms([tek.channel[0], tek.channel[1]])
+        assert (x == np.arange(5) * 0.5).all()
+        assert y.shape == (2, 5)
+        assert (y[0] == np.arange(5)).all()
+        assert (y[1] == np.arange(5) * 2 + 1).all()
+
+
+def test_tektds5xx_acquire_waveforms():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:CH1:YOF?;YMU?;YZE?;XIN?;NR_P?",
+        ] + [
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+        ] * 2, [
+            "CH1",
+            "2",
+            "#210" + block + "0;2;1;0.5;5",
+            "2",
+            "#210" + block + "2",
+            "#210" + block
+        ]
+    ) as tek:
+        stats = ik.abstract_instruments.AcquisitionStatistics()
+        frames = list(tek.acquire_waveforms(
+            tek.channel[0], n_frames=3, stats=stats
+        ))
+        assert len(frames) == 3
+        for x, y in frames:
+            assert (x == np.arange(5) * 0.5).all()
+            assert (y == np.arange(5) * 2 + 1).all()
+        assert stats.frames_transferred == 3
+        assert stats.frames_yielded == 3
+        assert stats.frames_dropped == 0
+
+
+def test_tektds5xx_acquire_waveforms_transfer_error():
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+        ], [
+            "CH1",
+            "2",
+            "garbage"
+        ]
+    ) as tek:
+        with pytest.raises(IOError):
+            list(tek.acquire_waveforms(tek.channel[0], n_frames=2))
+
+
+def test_tektds5xx_acquire_waveforms_bad_drop_policy():
+    with expected_protocol(ik.tektronix.TekTDS5xx, [], []) as tek:
+        with pytest.raises(ValueError):
+            tek.acquire_waveforms(tek.channel[0], drop_policy="never")
+
+
+def test_tektds5xx_acquire_waveforms_bad_queue_size():
+    with expected_protocol(ik.tektronix.TekTDS5xx, [], []) as tek:
+        with pytest.raises(ValueError):
+            tek.acquire_waveforms(tek.channel[0], queue_size=0)
+
+
+def test_tektds5xx_acquire_waveforms_bad_n_frames():
+    with expected_protocol(ik.tektronix.TekTDS5xx, [], []) as tek:
+        with pytest.raises(ValueError):
+            tek.acquire_waveforms(tek.channel[0], n_frames=-1)
+
+
+def test_tektds5xx_acquire_waveforms_bad_transform():
+    with expected_protocol(ik.tektronix.TekTDS5xx, [], []) as tek:
+        with pytest.raises(TypeError):
+            tek.acquire_waveforms(tek.channel[0], transform="minmax")
+
+
+def test_tektds5xx_read_waveform_ascii():
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:ENC ASCI",
+            "CURVE?",
+            "WFMP:CH1:YOF?;YMU?;YZE?;XIN?;NR_P?",
+        ], [
+            "CH1",
+            "0,1,2,3,4",
+            "0;2;1;0.5;5"
+        ]
+    ) as tek:
+        (x, y) = tek.channel[0].read_waveform(bin_format=False)
+        assert (x == np.arange(5) * 0.5).all()
+        assert (y == np.arange(5) * 2 + 1).all()
+
+
+def test_tektds5xx_data_source_tracked():
+    block = bytes.fromhex("00000001000200030004").decode("utf-8")
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "DAT:SOU CH2",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+            "WFMP:CH2:YOF?;YMU?;YZE?;XIN?;NR_P?",
+        ], [
+            "CH1",
+            "2",
+            "#210" + block + "0;2;1;0.5;5",
+        ]
+    ) as tek:
+        tek.restore_data_source = False
+        tek.channel[1].read_waveform()
+        assert tek.data_source == tek.channel[1]
+        # Selecting the current data source again sends nothing.
+        tek.data_source = tek.channel[1]
+
+
+def test_tektds5xx_save_hardcopy():
+    header = bytearray(54)
+    header[0:2] = b"BM"
+    header[18:30] = struct.pack('<iihh', 8, 2, 1, 1)
+    image = bytes(header) + bytes(range(10))
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "HARDC:PORT GPI;HARDC:LAY PORT;:HARDC:FORM BMP",
+            "HARDC START"
+        ], [
+            image
+        ]
+    ) as tek:
+        sink = BytesIO()
+        progress = []
+        assert tek.save_hardcopy(
+            sink, chunk_size=4,
+            progress=lambda done, total: progress.append((done, total))
+        ) == 64
+        assert sink.getvalue() == image
+        assert progress == [(54, 64), (58, 64), (62, 64), (64, 64)]
+
+
+def test_tektds5xx_save_hardcopy_gpibusb():
+    header = bytearray(54)
+    header[0:2] = b"BM"
+    header[18:30] = struct.pack('<iihh', 8, 2, 1, 1)
+    image = bytes(header) + bytes(range(10))
+    adapter = mock.MagicMock()
+    adapter.query.return_value = "5"
+    adapter.read_raw.side_effect = [image[:54], image[54:]]
+    tek = ik.tektronix.TekTDS5xx(GPIBCommunicator(adapter, 1))
+
+    sink = BytesIO()
+    assert tek.save_hardcopy(sink, chunk_size=16) == 64
+    assert sink.getvalue() == image
+    # The adapter must be told to read the image from the oscilloscope.
+    assert mock.call("+read") in adapter.sendcmd.call_args_list
+
+
+def test_tektds5xx_save_hardcopy_socket_timeout():
+    header = bytearray(54)
+    header[0:2] = b"BM"
+    header[18:30] = struct.pack('<iihh', 8, 2, 1, 1)
+    image = bytes(header) + bytes(range(10))
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "HARDC:PORT GPI;HARDC:LAY PORT;:HARDC:FORM BMP",
+            "HARDC START"
+        ], [
+        ]
+    ) as tek:
+        # Sockets raise rather than returning no data while the image is
+        # being rendered.
+        with mock.patch.object(tek._file, "read_raw", side_effect=[
+                socket.timeout(), image[:54], image[54:]
+        ]):
+            sink = BytesIO()
+            assert tek.save_hardcopy(sink) == 64
+        assert sink.getvalue() == image
+
+
+def test_tektds5xx_save_hardcopy_timeout():
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "HARDC:PORT GPI;HARDC:LAY PORT;:HARDC:FORM BMP",
+            "HARDC START"
+        ], [
+        ]
+    ) as tek:
+        with pytest.raises(IOError):
+            tek.save_hardcopy(BytesIO(), timeout=0)
+
+
+def test_tektds5xx_read_waveform_envelope():
+    block = bytes.fromhex("0000000500010001fffd000200020002000900000000")
+    with expected_protocol(
+        ik.tektronix.TekTDS5xx,
+        [
+            "DAT:SOU?",
+            "WFMP:CH1:YOF?;YMU?;YZE?;XIN?;NR_P?",
+            "DAT:ENC RIB",
+            "DATA:WIDTH?",
+            "CURVE?",
+        ], [
+            "CH1",
+            "0;2;1;0.5;11",
+            "2",
+            b"#222" + block
+        ]
+    ) as tek:
+        x, y = tek.channel[0].read_waveform_envelope(3, chunk_size=3)
+        np.testing.assert_array_equal(x, [0, 0.5, 2, 2.5, 4, 4.5])
+        np.testing.assert_array_equal(y, [1, 11, -5, 5, 19, 1])
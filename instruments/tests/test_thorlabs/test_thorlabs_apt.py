@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module containing tests for the Thorlabs APT devices
+"""
+
+# IMPORTS ####################################################################
+
+from __future__ import absolute_import
+from io import BytesIO
+import struct
+
+import numpy as np
+import pytest
+
+import instruments as ik
+from instruments.thorlabs import _cmds, _packets
+from .. import mock
+
+# TESTS ######################################################################
+
+# pylint: disable=protected-access
+
+
+def _piezo_channel():
+    """
+    Opens a loopback piezo stage, and returns its first channel along with
+    the stream that the stage writes to. Anything written while the stage
+    was opened, such as the request for hardware information, is discarded.
+    """
+    stdout = BytesIO()
+    apt = ik.thorlabs.APTPiezoStage.open_test(BytesIO(), stdout)
+    stdout.seek(0)
+    stdout.truncate()
+    return ik.thorlabs.APTPiezoStage.PiezoChannel(apt, 0), stdout
+
+
+def _output_position_packet(pos):
+    return _packets.ThorLabsPacket(
+        message_id=_cmds.ThorLabsCommands.PZ_SET_OUTPUTPOS,
+        param1=None,
+        param2=None,
+        dest=0x50,
+        source=0x01,
+        data=struct.pack('<HH', 1, pos)
+    ).pack()
+
+
+def test_apt_piezo_stream_output_positions():
+    channel, stdout = _piezo_channel()
+    write_raw = mock.MagicMock(wraps=channel._apt._file.write_raw)
+    channel._apt._file.write_raw = write_raw
+
+    assert channel.stream_output_positions([0, 1, 32767]) is None
+    assert stdout.getvalue() == b"".join(
+        _output_position_packet(pos) for pos in [0, 1, 32767]
+    )
+    # Without pacing or readback, the packets are written in a single call.
+    assert write_raw.call_count == 1
+
+
+def test_apt_piezo_stream_output_positions_no_pacing_when_testing():
+    channel, stdout = _piezo_channel()
+    with mock.patch("instruments.thorlabs.thorlabsapt.time.sleep") as sleep:
+        channel.stream_output_positions([10, 20, 30], rate=1)
+    sleep.assert_not_called()
+    assert stdout.getvalue() == b"".join(
+        _output_position_packet(pos) for pos in [10, 20, 30]
+    )
+
+
+def test_apt_piezo_stream_output_positions_readback():
+    channel, stdout = _piezo_channel()
+    with mock.patch.object(
+        ik.thorlabs.APTPiezoStage.PiezoChannel,
+        "output_position",
+        new_callable=mock.PropertyMock,
+        side_effect=[200, 400]
+    ) as output_position:
+        readback = channel.stream_output_positions(
+            [100, 200, 300, 400, 500], readback_every=2
+        )
+    np.testing.assert_array_equal(readback, [200, 400])
+    assert readback.dtype == np.uint16
+    assert output_position.call_count == 2
+    assert stdout.getvalue() == b"".join(
+        _output_position_packet(pos) for pos in [100, 200, 300, 400, 500]
+    )
+
+
+def test_apt_piezo_stream_output_positions_not_integers():
+    channel, _ = _piezo_channel()
+    with pytest.raises(TypeError):
+        channel.stream_output_positions([0.5, 1.5])
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(positions=[[0, 1], [2, 3]]),
+    dict(positions=[-1, 0]),
+    dict(positions=[0, 32768]),
+    dict(positions=[0, 1], rate=0),
+    dict(positions=[0, 1], readback_every=0),
+])
+def test_apt_piezo_stream_output_positions_invalid(kwargs):
+    channel, stdout = _piezo_channel()
+    with pytest.raises(ValueError):
+        channel.stream_output_positions(**kwargs)
+    assert stdout.getvalue() == b""
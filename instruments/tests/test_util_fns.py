@@ -11,14 +11,19 @@ from __future__ import absolute_import
 from builtins import range
 
 from enum import Enum
+import numpy as np
 import quantities as pq
 import pytest
 
 from instruments.util_fns import (
     ProxyList,
     assume_units, convert_temperature,
-    setattr_expression
+    setattr_expression,
+    parse_ascii_values, parse_ascii_chunks,
+    minmax_decimate, lttb_downsample, MinMaxDecimator,
+    RingBuffer, RingBufferStream
 )
+from . import mock
 
 # TEST CASES #################################################################
 
@@ -212,3 +217,156 @@ def test_setattr_expression_both():
     a = A()
     setattr_expression(a, 'b[0].x', 'foo')
     assert a.b[0].x == 'foo'
+
+
+def test_parse_ascii_values():
+    np.testing.assert_array_equal(
+        parse_ascii_values("1,-2.5, +3E-1\n4e2\n"),
+        [1, -2.5, 0.3, 400]
+    )
+    np.testing.assert_array_equal(
+        parse_ascii_values(b"1;2;3", dtype=int, sep=";"),
+        [1, 2, 3]
+    )
+    assert parse_ascii_values("").size == 0
+
+
+def test_parse_ascii_values_bad_data():
+    with pytest.raises(ValueError):
+        parse_ascii_values("1,a,3")
+
+
+def test_parse_ascii_values_truncated():
+    # numpy < 2 stops parsing at invalid data instead of raising.
+    with mock.patch("instruments.util_fns.np.fromstring",
+                    return_value=np.array([1.0])):
+        with pytest.raises(ValueError):
+            parse_ascii_values("1,a,3")
+
+
+def test_parse_ascii_chunks():
+    chunks = [b"1.5,2", b"5,-3", b"", b",4\n5", b"6"]
+    np.testing.assert_array_equal(
+        parse_ascii_chunks(chunks),
+        [1.5, 25, -3, 4, 56]
+    )
+
+
+def test_minmax_decimate():
+    x = np.arange(10)
+    y = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0]) * pq.volt
+    x_dec, y_dec = minmax_decimate(x, y, 3)
+    np.testing.assert_array_equal(x_dec, [0, 1, 4, 5, 8, 9])
+    np.testing.assert_array_equal(y_dec.magnitude, [0, 5, -3, 2, 9, 0])
+    assert y_dec.units == pq.volt
+
+
+def test_minmax_decimate_short_waveform():
+    x, y = np.arange(4), np.arange(4)
+    assert minmax_decimate(x, y, 2)[1] is y
+
+
+def test_minmax_decimator_chunks():
+    y = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0])
+    decimator = MinMaxDecimator(4)
+    results = [decimator.update(y[:3]), decimator.update(y[3:]),
+               decimator.finish()]
+    indices = np.concatenate([idx for idx, _ in results])
+    values = np.concatenate([val for _, val in results])
+    np.testing.assert_array_equal(indices, [0, 1, 4, 5, 8, 9])
+    np.testing.assert_array_equal(values, y[indices])
+
+
+def test_lttb_downsample():
+    x = np.arange(10)
+    y = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0])
+    x_dec, y_dec = lttb_downsample(x, y, 4)
+    np.testing.assert_array_equal(x_dec, [0, 4, 8, 9])
+    np.testing.assert_array_equal(y_dec, [0, -3, 9, 0])
+    with pytest.raises(ValueError):
+        lttb_downsample(x, y, 2)
+
+
+def test_ring_buffer():
+    buf = RingBuffer(4)
+    buf.extend([1, 2, 3])
+    assert len(buf) == 3
+    assert (buf.read(max_count=2) == np.array([1, 2])).all()
+    buf.extend([4, 5, 6])
+    assert len(buf) == 4
+    assert (buf.latest(2) == np.array([5, 6])).all()
+    assert buf.overflow_count == 0
+    buf.extend(np.arange(7, 13))
+    assert buf.total_written == 12
+    assert buf.overflow_count == 6
+    assert (buf.read() == np.array([9, 10, 11, 12])).all()
+    assert len(buf.read()) == 0
+
+
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError):
+        _ = RingBuffer(0)
+
+
+class _CountingStream(RingBufferStream):
+    """
+    Stream transferring ``blocks`` of data, then raising ``error`` if it is
+    not `None`.
+    """
+
+    def __init__(self, blocks, error=None):
+        super(_CountingStream, self).__init__(10, poll_interval=0.01)
+        self.blocks = blocks
+        self.error = error
+        self.events = []
+
+    def _on_start(self):
+        self.events.append("start")
+
+    def _on_stop(self):
+        self.events.append("stop")
+
+    def _convert(self, data):
+        return 2 * data
+
+    def _transfer(self):
+        for block in self.blocks:
+            self._buffer.extend(block)
+        if self.error is not None:
+            raise self.error
+
+
+def test_ring_buffer_stream():
+    stream = _CountingStream([[1, 2], [3]])
+    with stream:
+        stream.start()
+        assert stream.events == ["start"]
+        data = np.concatenate(list(stream))
+        np.testing.assert_array_equal(data, [2, 4, 6])
+        np.testing.assert_array_equal(stream.latest(2), [4, 6])
+        assert stream.overflow_count == 0
+        assert not stream.running
+    assert stream.events == ["start", "stop"]
+
+
+def test_ring_buffer_stream_already_running():
+    stream = _CountingStream([])
+    stream._thread = mock.MagicMock()  # pylint: disable=protected-access
+    stream._thread.is_alive.return_value = True
+    with pytest.raises(RuntimeError):
+        stream.start()
+
+
+def test_ring_buffer_stream_error_iterating():
+    stream = _CountingStream([[1]], error=IOError("link lost"))
+    stream.start()
+    with pytest.raises(IOError):
+        _ = list(stream)
+
+
+def test_ring_buffer_stream_error_stopping():
+    stream = _CountingStream([], error=IOError("link lost"))
+    stream.start()
+    with pytest.raises(IOError):
+        stream.stop()
+    assert stream.events == ["start", "stop"]
@@ -12,8 +12,10 @@ from __future__ import division
 import re
 import struct
 import logging
+import time
 
 from builtins import range
+import numpy as np
 import quantities as pq
 
 from instruments.thorlabs import _abstract, _packets, _cmds
@@ -403,6 +405,98 @@ class APTPiezoStage(APTPiezoDevice):
             )
             self._apt.sendpacket(pkt)
 
+        def stream_output_positions(self, positions, rate=None,
+                                    readback_every=None):
+            """
+            Streams a sequence of output positions to the piezo channel,
+            writing the ``PZ_SET_OUTPUTPOS`` packets back-to-back rather than
+            building and sending each packet through `output_position`.
+
+            All packets are packed up front, so that the time spent between
+            setpoints is limited to the write itself and, if requested, the
+            pacing delay. If neither ``rate`` nor ``readback_every`` is given,
+            all of the packets are written in a single call.
+
+            Example usage:
+
+            >>> import numpy as np
+            >>> import instruments as ik
+            >>> stage = ik.thorlabs.APTPiezoStage.open_serial("/dev/ttyUSB0")
+            >>> ramp = np.linspace(0, 32767, 1000).astype(int)
+            >>> readback = stage.channel[0].stream_output_positions(
+            ...     ramp, rate=500, readback_every=100)
+
+            :param positions: Output positions to be sent, in the range
+                0 to 32767 (0 to 100% of the maximum travel).
+            :type positions: array-like of `int`
+            :param float rate: Target setpoint rate in Hz. If `None`, the
+                setpoints are sent as fast as the connection allows.
+            :param int readback_every: If not `None`, the output position is
+                queried after every ``readback_every`` setpoints and recorded.
+
+            :return: The read back output positions, or `None` if
+                ``readback_every`` is `None`.
+            :rtype: `numpy.ndarray` of `int`
+            """
+            # pylint: disable=protected-access
+            positions = np.asarray(positions)
+            if not np.issubdtype(positions.dtype, np.integer):
+                raise TypeError("Output positions must be integers, got "
+                                "{} instead.".format(positions.dtype))
+            if positions.ndim != 1:
+                raise ValueError("Positions must be a one-dimensional "
+                                 "sequence.")
+            if np.any(positions < 0) or np.any(positions > 32767):
+                raise ValueError("Output positions must be between 0 and "
+                                 "32767.")
+            if rate is not None and rate <= 0:
+                raise ValueError("Setpoint rate must be positive.")
+            if readback_every is not None and readback_every < 1:
+                raise ValueError("Readback interval must be at least 1.")
+
+            # Pack every packet at once: a six byte header followed by the
+            # channel and position words.
+            pkt_dtype = np.dtype([
+                ('message_id', '<u2'), ('length', '<u2'), ('dest', 'u1'),
+                ('source', 'u1'), ('chan', '<u2'), ('pos', '<u2')
+            ])
+            pkts = np.empty(len(positions), dtype=pkt_dtype)
+            pkts['message_id'] = _cmds.ThorLabsCommands.PZ_SET_OUTPUTPOS
+            pkts['length'] = 4
+            pkts['dest'] = 0x80 | self._apt.destination
+            pkts['source'] = 0x01
+            pkts['chan'] = self._idx_chan
+            pkts['pos'] = positions
+            raw = pkts.tobytes()
+            size = pkt_dtype.itemsize
+
+            if readback_every is not None:
+                readback = np.empty(
+                    len(positions) // readback_every, dtype=np.uint16
+                )
+            else:
+                readback = None
+
+            pace = rate is not None and not self._apt._testing
+            if not pace and readback is None:
+                # Nothing needs to happen between setpoints, so the whole
+                # buffer is written at once.
+                self._apt._file.sendcmd_raw(raw)
+                return None
+
+            t_start = time.time()
+            for idx in range(len(positions)):
+                if pace:
+                    delay = t_start + idx / rate - time.time()
+                    if delay > 0:
+                        time.sleep(delay)
+                self._apt._file.sendcmd_raw(raw[idx * size:(idx + 1) * size])
+                if readback is not None and (idx + 1) % readback_every == 0:
+                    readback[(idx + 1) // readback_every - 1] = \
+                        self.output_position
+
+            return readback
+
     _channel_type = PiezoChannel
 
 
@@ -10,8 +10,11 @@ from __future__ import absolute_import
 from __future__ import division
 
 import re
+import threading
+import warnings
 
 from enum import Enum, IntEnum
+import numpy as np
 import quantities as pq
 
 # CONSTANTS ###################################################################
@@ -164,6 +167,150 @@ def split_unit_str(s, default_units=pq.dimensionless, lookup=None):
                              "and units.".format(repr(s)))
 
 
+def parse_ascii_values(data, dtype=float, sep=","):
+    """
+    Parses a string of numbers, such as an ASCII waveform or a bulk
+    multimeter reading, into a `numpy.ndarray`.
+
+    Numbers may be separated by ``sep``, by whitespace (including newlines),
+    or by both. Parsing is done by `numpy.fromstring`, so that large
+    responses are not first converted into a list of numbers. As older
+    versions of numpy stop at the first invalid number rather than raising,
+    the number of values parsed is checked against the number of
+    separated tokens.
+
+    :param data: The numbers to parse.
+    :type data: `str` or `bytes`
+    :param dtype: Data type of the returned array.
+    :param str sep: Separator between numbers, in addition to whitespace.
+    :rtype: `numpy.ndarray`
+    """
+    if isinstance(data, bytes):
+        data = data.decode("ascii")
+    if sep.strip():
+        data = data.replace(sep, " ")
+    try:
+        with warnings.catch_warnings():
+            # numpy < 2 warns about invalid data instead of raising.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring(data, dtype=dtype, sep=" ")
+    except ValueError:
+        values = None
+    if values is None or len(values) != len(data.split()):
+        raise ValueError("Could not parse {} as {}-separated "
+                         "numbers.".format(repr(data[:80]), repr(sep)))
+    return values
+
+
+def parse_ascii_chunks(chunks, dtype=float, sep=","):
+    """
+    Parses an iterable of partial strings of numbers, such as the chunks of
+    a long response read from an instrument, into a single `numpy.ndarray`.
+
+    Each chunk is parsed as it arrives with `parse_ascii_values`, carrying
+    over any number split across the end of a chunk, so that the full
+    response never needs to be held in memory as a string.
+
+    :param chunks: The partial strings of numbers to parse.
+    :type chunks: iterable of `str` or `bytes`
+    :param dtype: Data type of the returned array.
+    :param str sep: Separator between numbers, in addition to whitespace.
+    :rtype: `numpy.ndarray`
+    """
+    parsed = []
+    remainder = ""
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("ascii")
+        chunk = remainder + chunk
+        # Only parse up to the last separator, as the number after it may
+        # continue in the next chunk.
+        idx = max(chunk.rfind(sep), chunk.rfind(" "), chunk.rfind("\n"))
+        remainder = chunk[idx + 1:]
+        if idx >= 0:
+            parsed.append(parse_ascii_values(chunk[:idx], dtype, sep))
+    parsed.append(parse_ascii_values(remainder, dtype, sep))
+    return np.concatenate(parsed)
+
+
+def minmax_decimate(x, y, n_bins):
+    """
+    Reduces a waveform to the minimum and maximum of each of ``n_bins``
+    equally sized bins, in the manner of a peak-detect acquisition. This
+    preserves narrow peaks and glitches that would be lost by subsampling,
+    and is suitable for displaying long waveforms.
+
+    :param x: The x values of the waveform.
+    :type x: `numpy.ndarray`
+    :param y: The y values of the waveform.
+    :type y: `numpy.ndarray`
+    :param int n_bins: The number of bins to reduce the waveform to. Each
+        bin contributes two points, in the order they occur.
+    :return: The decimated waveform with both x and y components.
+    :rtype: two item `tuple` of `numpy.ndarray`
+    """
+    n_points = len(y)
+    if n_bins < 1:
+        raise ValueError("Number of bins must be at least one.")
+    if 2 * n_bins >= n_points:
+        return x, y
+
+    decimator = MinMaxDecimator(-(-n_points // n_bins))
+    indices, _ = decimator.update(np.asarray(y))
+    rest, _ = decimator.finish()
+    indices = np.concatenate([indices, rest])
+    return x[indices], y[indices]
+
+
+def lttb_downsample(x, y, n_out):
+    """
+    Downsamples a waveform to ``n_out`` points using the
+    largest-triangle-three-buckets algorithm, which keeps the points that
+    best preserve the visual shape of the waveform.
+
+    :param x: The x values of the waveform.
+    :type x: `numpy.ndarray`
+    :param y: The y values of the waveform.
+    :type y: `numpy.ndarray`
+    :param int n_out: The number of points to keep, at least three.
+    :return: The downsampled waveform with both x and y components.
+    :rtype: two item `tuple` of `numpy.ndarray`
+    """
+    n_points = len(y)
+    if n_out < 3:
+        raise ValueError("At least three points must be kept.")
+    if n_out >= n_points:
+        return x, y
+
+    x_vals = np.asarray(x, dtype=float)
+    y_vals = np.asarray(y, dtype=float)
+    # The first and last points are always kept; the rest are split into
+    # n_out - 2 buckets, each contributing the point forming the largest
+    # triangle with the previously kept point and the next bucket's mean.
+    edges = np.floor(
+        np.linspace(1, n_points - 1, n_out - 1)
+    ).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0] = 0
+    indices[-1] = n_points - 1
+    for idx in range(n_out - 2):
+        start, stop = edges[idx], edges[idx + 1]
+        if idx + 2 < len(edges):
+            next_stop = edges[idx + 2]
+        else:
+            next_stop = n_points
+        avg_x = x_vals[stop:next_stop].mean()
+        avg_y = y_vals[stop:next_stop].mean()
+
+        prev = indices[idx]
+        areas = np.abs(
+            (x_vals[prev] - avg_x) * (y_vals[start:stop] - y_vals[prev]) -
+            (x_vals[prev] - x_vals[start:stop]) * (avg_y - y_vals[prev])
+        )
+        indices[idx + 1] = start + np.argmax(areas)
+    return x[indices], y[indices]
+
+
 def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
     """
     Creates and returns a new property based on the input parameters.
@@ -676,3 +823,332 @@ class ProxyList(object):
 
     def __len__(self):
         return len(self._valid_set)
+
+
+class MinMaxDecimator(object):
+    """
+    Incrementally reduces a waveform to the minimum and maximum of each bin
+    of ``bin_size`` consecutive points, as successive chunks of the waveform
+    arrive. Samples left over at the end of a chunk are carried over into
+    the next one.
+
+    As taking minima and maxima commutes with scaling by a linear
+    function, raw samples can be decimated as they are transferred, and
+    only the decimated points scaled afterwards.
+
+    Example usage:
+
+    >>> decimator = MinMaxDecimator(1000)
+    >>> for chunk in chunks:
+    ...     indices, values = decimator.update(chunk)
+    >>> indices, values = decimator.finish()
+
+    :param int bin_size: Number of consecutive points in each bin.
+    """
+
+    def __init__(self, bin_size):
+        if bin_size < 1:
+            raise ValueError("Bin size must be at least one.")
+        self._bin_size = int(bin_size)
+        self._offset = 0
+        self._remainder = None
+
+    def update(self, chunk):
+        """
+        Decimates all complete bins available after adding a chunk of
+        samples.
+
+        :param chunk: The next samples of the waveform.
+        :type chunk: `numpy.ndarray`
+        :return: The indices, within the whole waveform, of the minimum and
+            maximum of each completed bin, and the corresponding samples.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        data = np.asarray(chunk)
+        if self._remainder is not None and len(self._remainder):
+            data = np.concatenate([self._remainder, data])
+        n_full = len(data) // self._bin_size * self._bin_size
+        self._remainder = data[n_full:]
+        return self._decimate(data[:n_full], self._bin_size)
+
+    def finish(self):
+        """
+        Decimates the final, partial bin, if any samples are left over.
+
+        :return: The indices and samples of the last bin's minimum and
+            maximum.
+        :rtype: two item `tuple` of `numpy.ndarray`
+        """
+        remainder = self._remainder
+        self._remainder = None
+        if remainder is None or not len(remainder):
+            return np.empty(0, dtype=int), np.empty(0)
+        return self._decimate(remainder, len(remainder))
+
+    def _decimate(self, data, bin_size):
+        if not len(data):
+            return np.empty(0, dtype=int), data
+        bins = data.reshape(-1, bin_size)
+        # Keep the minimum and maximum of each bin in the order in which
+        # they occur, so that the decimated waveform can be drawn as a line.
+        local = np.sort(np.stack(
+            [bins.argmin(axis=1), bins.argmax(axis=1)], axis=1
+        ), axis=1)
+        local += (np.arange(len(bins)) * bin_size)[:, np.newaxis]
+        local = local.ravel()
+        indices = local + self._offset
+        self._offset += len(data)
+        return indices, data[local]
+
+
+class RingBuffer(object):
+    """
+    Fixed-size buffer holding the most recent samples of a stream, for use
+    when samples are written by one thread and read by another. Once the
+    buffer is full, the oldest samples are overwritten; samples that are
+    overwritten before they have been read are counted in `overflow_count`.
+
+    Example usage:
+
+    >>> buf = RingBuffer(4)
+    >>> buf.extend([1, 2, 3, 4, 5])
+    >>> buf.latest(2)
+    array([ 4.,  5.])
+    >>> buf.read()
+    array([ 2.,  3.,  4.,  5.])
+    >>> buf.overflow_count
+    1
+
+    :param int capacity: Maximum number of samples held by the buffer.
+    :param dtype: Data type of the samples.
+    """
+
+    def __init__(self, capacity, dtype=float):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least one.")
+        self._data = np.zeros(int(capacity), dtype=dtype)
+        self._written = 0
+        self._read_pos = 0
+        self._overflow_count = 0
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        with self._cond:
+            return min(self._written, self.capacity)
+
+    @property
+    def capacity(self):
+        """
+        Gets the maximum number of samples held by the buffer.
+
+        :type: `int`
+        """
+        return len(self._data)
+
+    @property
+    def total_written(self):
+        """
+        Gets the total number of samples written to the buffer.
+
+        :type: `int`
+        """
+        return self._written
+
+    @property
+    def overflow_count(self):
+        """
+        Gets the number of samples that were overwritten before being
+        returned by `read`.
+
+        :type: `int`
+        """
+        return self._overflow_count
+
+    def extend(self, data):
+        """
+        Appends samples to the buffer, overwriting the oldest samples if the
+        buffer is full.
+
+        :param data: Samples to append.
+        :type data: `numpy.ndarray`
+        """
+        data = np.asarray(data, dtype=self._data.dtype).ravel()
+        n_new = len(data)
+        with self._cond:
+            kept = data[-self.capacity:]
+            start = self._written + n_new - len(kept)
+            self._data[np.arange(start, start + len(kept)) % self.capacity] = \
+                kept
+            self._written += n_new
+            lost = self._written - self._read_pos - self.capacity
+            if lost > 0:
+                self._overflow_count += lost
+                self._read_pos += lost
+            self._cond.notify_all()
+
+    def latest(self, n):
+        """
+        Gets the ``n`` most recent samples, oldest first, without marking
+        them as read. Fewer samples are returned if the buffer holds fewer
+        than ``n``.
+
+        :param int n: Number of samples to return.
+        :rtype: `numpy.ndarray`
+        """
+        with self._cond:
+            n = max(0, min(n, len(self)))
+            return self._data[
+                np.arange(self._written - n, self._written) % self.capacity
+            ]
+
+    def read(self, max_count=None, timeout=0):
+        """
+        Gets the samples written since the last call to `read`, oldest
+        first, and marks them as read.
+
+        :param int max_count: Maximum number of samples to return, or `None`
+            to return all unread samples.
+        :param float timeout: Time in seconds to wait for new samples if
+            none are available, or `None` to wait indefinitely.
+        :rtype: `numpy.ndarray`
+        """
+        with self._cond:
+            if self._written == self._read_pos and timeout != 0:
+                self._cond.wait(timeout)
+            n = self._written - self._read_pos
+            if max_count is not None:
+                n = min(n, max_count)
+            indices = np.arange(self._read_pos, self._read_pos + n)
+            self._read_pos += n
+            return self._data[indices % self.capacity]
+
+
+class RingBufferStream(object):
+    """
+    Base class for streaming acquisitions, in which data is transferred
+    from an instrument on a background thread into a `RingBuffer`.
+
+    Iterating over the stream yields each new block of data until the
+    stream is stopped and all data has been yielded. Alternatively,
+    `latest` returns the most recent data at any time. The stream can be
+    used as a context manager, in which case it is stopped on exit.
+
+    Subclasses implement ``_transfer``, which is run on the background
+    thread and should return once ``_stop`` is set. Any exception it raises
+    is re-raised by `stop`, or by iteration once all data has been yielded.
+    Subclasses may also override ``_on_start`` and ``_on_stop`` to start
+    and stop the acquisition on the instrument, and ``_convert`` to convert
+    the data read from the buffer before it is returned.
+
+    :param int buffer_size: Number of samples held by the ring buffer.
+    :param dtype: Data type of the samples.
+    :param float poll_interval: Time in seconds to wait for new data on
+        each pass while iterating.
+    """
+
+    def __init__(self, buffer_size, dtype=float, poll_interval=0.05):
+        self._buffer = RingBuffer(buffer_size, dtype=dtype)
+        self._poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    def __iter__(self):
+        while True:
+            running = self.running
+            data = self._buffer.read(timeout=self._poll_interval)
+            if len(data):
+                yield self._convert(data)
+            elif not running:
+                self._raise_error()
+                return
+
+    # PROPERTIES #
+
+    @property
+    def running(self):
+        """
+        Gets whether data is still being transferred.
+
+        :type: `bool`
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def overflow_count(self):
+        """
+        Gets the number of samples that were overwritten in the ring buffer
+        before being yielded by iterating over the stream.
+
+        :type: `int`
+        """
+        return self._buffer.overflow_count
+
+    # METHODS #
+
+    def start(self):
+        """
+        Starts the acquisition, and starts the background thread
+        transferring its data.
+        """
+        if self.running:
+            raise RuntimeError("Stream is already running.")
+        self._on_start()
+        self._stop.clear()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread and the acquisition. Data already
+        transferred remains available.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._on_stop()
+        self._raise_error()
+
+    def latest(self, n):
+        """
+        Gets the ``n`` most recent samples, oldest first. This does not
+        affect the data yielded by iterating over the stream.
+
+        :param int n: Number of samples to return.
+        """
+        return self._convert(self._buffer.latest(n))
+
+    def _on_start(self):
+        pass
+
+    def _on_stop(self):
+        pass
+
+    def _convert(self, data):  # pylint: disable=no-self-use
+        return data
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        try:
+            self._transfer()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._error = exc
+
+    def _transfer(self):
+        raise NotImplementedError